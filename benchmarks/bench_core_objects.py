@@ -0,0 +1,125 @@
+"""
+Per-object memory and lookup time of core objects (hosts, plugs, plugins),
+compared with the previous layout: `__dict__` based frozen dataclasses with
+host hash recomputed on every lookup.
+
+Hosts trade memory for lookup speed. Cached hash and weak reference slot
+(needed for interning) make a lone host larger than the previous layout,
+while plugins, which dominate registry memory, are still smaller.
+
+Run with:
+
+    PYTHONPATH=src python benchmarks/bench_core_objects.py
+"""
+
+from dataclasses import dataclass
+import gc
+import timeit
+import tracemalloc
+from typing import Any, Callable, Hashable
+
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.host import CoreHost
+from plug_in.core.plug import CorePlug
+from plug_in.core.plugin import FactoryCorePlugin
+
+OBJECTS = 20_000
+LOOKUPS = 200_000
+
+
+@dataclass(frozen=True)
+class LegacyHost:
+    _subject: Hashable
+    _marks: tuple[Hashable, ...] = ()
+
+    @property
+    def subject(self) -> Hashable:
+        return self._subject
+
+    @property
+    def marks(self) -> tuple[Hashable, ...]:
+        return self._marks
+
+    def __hash__(self) -> int:
+        return hash((self.subject, *self.marks))
+
+
+@dataclass(frozen=True)
+class LegacyPlug:
+    _provider: Any
+
+
+@dataclass(frozen=True)
+class LegacyFactoryPlugin:
+    _plug: LegacyPlug
+    _host: LegacyHost
+    _metadata: Any
+    _policy: PluginPolicy = PluginPolicy.FACTORY
+
+
+def _provider() -> None:
+    return None
+
+
+def _bytes_per_object(factory: Callable[[int], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory(idx) for idx in range(OBJECTS)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / OBJECTS
+
+
+def _lookup_seconds(hosts: list[Any]) -> float:
+    table = {host: idx for idx, host in enumerate(hosts)}
+    keys = [type(host)(host._subject, host._marks) for host in hosts[:1000]]
+    rounds = LOOKUPS // len(keys)
+
+    def lookup() -> None:
+        for key in keys:
+            table[key]
+
+    return min(timeit.repeat(lookup, number=rounds, repeat=5)) / LOOKUPS
+
+
+def _marks(idx: int) -> tuple[Hashable, ...]:
+    return (f"tenant-{idx}", idx)
+
+
+def main() -> None:
+    memory = {
+        "host": (
+            _bytes_per_object(lambda idx: LegacyHost(str, _marks(idx))),
+            _bytes_per_object(lambda idx: CoreHost(str, _marks(idx))),
+        ),
+        "factory plugin (with plug and host)": (
+            _bytes_per_object(
+                lambda idx: LegacyFactoryPlugin(
+                    LegacyPlug(_provider), LegacyHost(str, _marks(idx)), None
+                )
+            ),
+            _bytes_per_object(
+                lambda idx: FactoryCorePlugin(
+                    CorePlug(_provider), CoreHost(str, _marks(idx)), None
+                )
+            ),
+        ),
+    }
+
+    lookup = (
+        _lookup_seconds([LegacyHost(str, _marks(idx)) for idx in range(OBJECTS)]),
+        _lookup_seconds([CoreHost(str, _marks(idx)) for idx in range(OBJECTS)]),
+    )
+
+    print(f"{'':46} {'legacy':>12} {'current':>12}")
+    for name, (legacy, current) in memory.items():
+        print(f"{name + ' [B/object]':46} {legacy:12.1f} {current:12.1f}")
+    print(
+        f"{'host dict lookup [ns]':46} {lookup[0] * 1e9:12.1f} {lookup[1] * 1e9:12.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""
+Timings of the resolution hot path: managed calls, plugin policies, registry
+construction and lookup, route finalization and contention on lazy plugins.
+Results are written as JSON, and can be compared with a previous run.
+
+Run with:
+
+    PYTHONPATH=src python benchmarks/bench_resolution.py --output results.json
+    PYTHONPATH=src python benchmarks/bench_resolution.py --compare results.json
+
+Use `--quick` for a smoke run with smaller sizes, and `--only` to select
+benchmarks by name substring. Times are nanoseconds per operation, the best
+of several repeats.
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import timeit
+from typing import Any, Awaitable, Callable, Iterator
+
+from plug_in.boot.builder.builder import plug
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.host import CoreHost
+from plug_in.core.registry import CoreRegistry
+from plug_in.core.scope import scope
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.router import Router
+
+PARAM_COUNTS = (0, 1, 5, 20)
+REGISTRY_SIZES = (10, 100, 1_000, 10_000, 100_000)
+THREAD_COUNTS = (1, 2, 4, 8)
+REPEAT = 5
+
+# Benchmarks yield names with measurements, which are run only when selected
+type Benchmark = Iterator[tuple[str, Callable[[], dict[str, Any]]]]
+
+# Distinct host types of generated routes
+DEPENDENCIES = [type(f"Dep{idx}", (), {}) for idx in range(max(PARAM_COUNTS))]
+
+
+class Value:
+    pass
+
+
+def _generate_route(count: int, is_async: bool) -> Callable[..., Any]:
+    """
+    Define a new function with `count` hosted parameters of distinct types.
+    """
+    params = ", ".join(f"p{idx}: Dep{idx} = Hosted()" for idx in range(count))
+    prefix = "async " if is_async else ""
+    namespace: dict[str, Any] = {
+        "Hosted": Hosted,
+        **{dep.__name__: dep for dep in DEPENDENCIES},
+    }
+    exec(f"{prefix}def route({params}):\n    return None\n", namespace)
+    return namespace["route"]
+
+
+def _dependency_registry() -> CoreRegistry:
+    return CoreRegistry(
+        [plug(dep).into(dep).via_provider("lazy") for dep in DEPENDENCIES]
+    )
+
+
+def _timings(seconds: list[float], ops: int) -> dict[str, Any]:
+    per_op = [value / ops * 1e9 for value in seconds]
+    return {
+        "ns_per_op": min(per_op),
+        "median_ns_per_op": statistics.median(per_op),
+        "ops": ops,
+        "repeat": len(per_op),
+    }
+
+
+def _measure_sync(call: Callable[[], Any], quick: bool) -> dict[str, Any]:
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    if quick:
+        number = max(1, number // 10)
+    return _timings(timer.repeat(repeat=REPEAT, number=number), number)
+
+
+def _measure_async(
+    call: Callable[[], Awaitable[Any]], quick: bool, ops: int = 20_000
+) -> dict[str, Any]:
+    ops = ops // 20 if quick else ops
+
+    async def run() -> list[float]:
+        seconds = []
+        for _ in range(REPEAT):
+            started = time.perf_counter()
+            for _ in range(ops):
+                await call()
+            seconds.append(time.perf_counter() - started)
+        return seconds
+
+    return _timings(asyncio.run(run()), ops)
+
+
+def bench_managed_calls(quick: bool) -> Benchmark:
+    for compiled in (False, True):
+        kind = "compiled" if compiled else "generic"
+        router = Router(compiled_routes=compiled)
+        router.mount(_dependency_registry())
+
+        for count in PARAM_COUNTS:
+            sync_route = router.manage()(_generate_route(count, is_async=False))
+            async_route = router.manage()(_generate_route(count, is_async=True))
+            yield f"call/sync/{kind}/params={count}", lambda: _measure_sync(
+                sync_route, quick
+            )
+            yield f"call/async/{kind}/params={count}", lambda: _measure_async(
+                async_route, quick
+            )
+
+
+def bench_signature_bind(quick: bool) -> Benchmark:
+    router = Router()
+    router.mount(_dependency_registry())
+
+    for count in PARAM_COUNTS[1:]:
+        callable = _generate_route(count, is_async=False)
+        router.manage()(callable)
+        resolver = router.get_route_resolver(callable)
+        yield f"bind/sync/params={count}", lambda: _measure_sync(
+            resolver.get_one_time_bind_sync, quick
+        )
+
+
+async def _provide_value() -> Value:
+    return Value()
+
+
+def _policy_plugins() -> dict[PluginPolicy, Any]:
+    return {
+        PluginPolicy.DIRECT: plug(Value()).into(Value).directly(),
+        PluginPolicy.LAZY: plug(Value).into(Value).via_provider("lazy"),
+        PluginPolicy.FACTORY: plug(Value).into(Value).via_provider("factory"),
+        PluginPolicy.SCOPED: plug(Value).into(Value).via_provider("scoped"),
+        PluginPolicy.THREAD_LOCAL: plug(Value).into(Value).via_provider("thread_local"),
+        PluginPolicy.TASK_LOCAL: plug(Value).into(Value).via_provider("task_local"),
+        PluginPolicy.POOLED: plug(Value).into(Value).via_pool(),
+        PluginPolicy.CACHED: plug(Value).into(Value).via_cache(ttl=3600),
+        PluginPolicy.LAZY_ASYNC: plug(_provide_value)
+        .into(Value)
+        .via_provider("lazy_async"),
+        PluginPolicy.FACTORY_ASYNC: plug(_provide_value)
+        .into(Value)
+        .via_provider("factory_async"),
+        PluginPolicy.SCOPED_ASYNC: plug(_provide_value)
+        .into(Value)
+        .via_provider("scoped_async"),
+        PluginPolicy.TASK_LOCAL_ASYNC: plug(_provide_value)
+        .into(Value)
+        .via_provider("task_local_async"),
+        PluginPolicy.POOLED_ASYNC: plug(_provide_value).into(Value).via_async_pool(),
+        PluginPolicy.CACHED_ASYNC: plug(_provide_value)
+        .into(Value)
+        .via_async_cache(ttl=3600),
+    }
+
+
+def bench_policies(quick: bool) -> Benchmark:
+    """
+    Managed call with a single hosted parameter of each policy. Calls run
+    within a scope and a task, as some policies require them.
+    """
+    for policy, plugin in _policy_plugins().items():
+        router = Router()
+        router.mount(CoreRegistry([plugin]))
+
+        if policy.endswith("_ASYNC"):
+
+            @router.manage()
+            async def route(value: Value = Hosted()) -> Value:
+                return value
+
+            call: Callable[[], Awaitable[Any]] = route
+
+        else:
+
+            @router.manage()
+            def sync_route(value: Value = Hosted()) -> Value:
+                return value
+
+            async def call() -> Any:
+                return sync_route()
+
+        async def scoped_call(call: Callable[[], Awaitable[Any]] = call) -> Any:
+            async with scope():
+                return await call()
+
+        yield f"policy/{policy}", lambda: _measure_async(scoped_call, quick)
+
+
+def _plugins(size: int) -> list[Any]:
+    return [plug(Value).into(Value, idx).via_provider("factory") for idx in range(size)]
+
+
+def bench_registry(quick: bool) -> Benchmark:
+    sizes = REGISTRY_SIZES[:3] if quick else REGISTRY_SIZES
+
+    for size in sizes:
+        plugins = _plugins(size)
+
+        def construct() -> dict[str, Any]:
+            seconds = timeit.repeat(lambda: CoreRegistry(plugins), number=1, repeat=3)
+            return _timings(seconds, 1)
+
+        def lookup() -> dict[str, Any]:
+            registry = CoreRegistry(plugins)
+            # Hosts equal to, but not the same as registered ones
+            hosts = [
+                CoreHost(Value, (idx,)) for idx in range(0, size, max(1, size // 100))
+            ]
+
+            def lookup_all() -> None:
+                for host in hosts:
+                    registry.plugin(host)
+
+            result = _measure_sync(lookup_all, quick)
+            # Per single lookup
+            result["ns_per_op"] /= len(hosts)
+            result["median_ns_per_op"] /= len(hosts)
+            result["ops"] *= len(hosts)
+            return result
+
+        yield f"registry/construct/plugins={size}", construct
+        yield f"registry/lookup/plugins={size}", lookup
+
+
+def bench_finalization(quick: bool) -> Benchmark:
+    """
+    First call of a route: cold one inspects signature and annotations, warm
+    one (after rewind, e.g. remount) only looks plugins up again.
+    """
+    count = 5
+    rounds = 50 if quick else 500
+    router = Router()
+    router.mount(_dependency_registry())
+
+    def cold() -> None:
+        router.manage()(_generate_route(count, is_async=False))()
+
+    callable = _generate_route(count, is_async=False)
+    route = router.manage()(callable)
+    resolver = router.get_route_resolver(callable)
+
+    def warm() -> None:
+        resolver.rewind()
+        route()
+
+    for name, first_call in (("cold", cold), ("warm", warm)):
+        yield f"finalize/{name}/params={count}", lambda: _timings(
+            timeit.repeat(first_call, number=rounds, repeat=REPEAT), rounds
+        )
+
+
+def _run_threads(threads: int, target: Callable[[], None]) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def run() -> None:
+        barrier.wait()
+        target()
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def bench_lazy_contention(quick: bool) -> Benchmark:
+    """
+    Threads calling managed route with a lazy parameter at the same time. First
+    provide is measured separately, with providers racing for the lock.
+    """
+    calls = 2_000 if quick else 50_000
+
+    for threads in THREAD_COUNTS:
+        router = Router()
+        router.mount(CoreRegistry([plug(Value).into(Value).via_provider("lazy")]))
+
+        @router.manage()
+        def route(value: Value = Hosted()) -> Value:
+            return value
+
+        def hammer() -> None:
+            for _ in range(calls):
+                route()
+
+        yield f"lazy/contention/threads={threads}", lambda: _timings(
+            [_run_threads(threads, hammer) for _ in range(REPEAT)], calls * threads
+        )
+
+        def first_provide() -> float:
+            created: list[Value] = []
+
+            def slow_value() -> Value:
+                time.sleep(0.001)
+                created.append(Value())
+                return created[-1]
+
+            reg = CoreRegistry([plug(slow_value).into(Value).via_provider("lazy")])
+            elapsed = _run_threads(threads, lambda: reg.sync_resolve(CoreHost(Value)))
+            assert len(created) == 1, "Lazy plugin provided more than once"
+            return elapsed
+
+        yield f"lazy/first-provide/threads={threads}", lambda: _timings(
+            [first_provide() for _ in range(REPEAT)], 1
+        )
+
+
+BENCHMARKS = (
+    bench_managed_calls,
+    bench_signature_bind,
+    bench_policies,
+    bench_registry,
+    bench_finalization,
+    bench_lazy_contention,
+)
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format_ns(value: float) -> str:
+    if value >= 1e6:
+        return f"{value / 1e6:10.2f} ms"
+    if value >= 1e3:
+        return f"{value / 1e3:10.2f} us"
+    return f"{value:10.1f} ns"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="Write results as JSON into this file")
+    parser.add_argument("--compare", help="Show ratios against results in this file")
+    parser.add_argument("--only", default="", help="Run benchmarks containing this")
+    parser.add_argument("--quick", action="store_true", help="Smaller smoke run")
+    args = parser.parse_args()
+
+    baseline: dict[str, Any] = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    results: dict[str, dict[str, Any]] = {}
+    for bench in BENCHMARKS:
+        for name, measure in bench(args.quick):
+            if args.only not in name:
+                continue
+
+            result = results[name] = measure()
+            line = f"{name:44} {_format_ns(result['ns_per_op'])}"
+            if name in baseline:
+                ratio = result["ns_per_op"] / baseline[name]["ns_per_op"]
+                line += f"  x{ratio:.2f}"
+            print(line, flush=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "meta": {
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "commit": _commit(),
+                        "python": sys.version,
+                        "platform": platform.platform(),
+                        "quick": args.quick,
+                    },
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,12 @@ from plug_in.boot.root import (
     RootRegistry,
     RootRouter,
     manage,
+    resolve_many,
+    async_resolve_many,
 )
 
 from plug_in.boot.builder.builder import plug
+from plug_in.core.scope import scope
 from plug_in.ioc.hosting import Hosted
 
 from plug_in import boot
@@ -20,8 +23,11 @@ from plug_in import types
 
 __all__ = [
     "manage",
+    "resolve_many",
+    "async_resolve_many",
     "Hosted",
     "plug",
+    "scope",
     "RootConfig",
     "get_root_registry",
     "get_root_router",
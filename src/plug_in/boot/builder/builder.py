@@ -1,4 +1,5 @@
-from typing import Awaitable, Callable, cast, overload
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import AsyncIterator, Awaitable, Callable, Iterator, cast, overload
 
 from plug_in.boot.builder.facade import (
     CoroutinePlugFacade,
@@ -8,7 +9,10 @@ from plug_in.boot.builder.facade import (
     ProvidingPlugFacadeProtocol,
 )
 from plug_in.boot.builder.proto import CoroutinePlugFacadeProtocol
-from plug_in.tools.introspect import is_coroutine_callable
+from plug_in.tools.introspect import (
+    is_async_generator_callable,
+    is_coroutine_callable,
+)
 
 
 @overload
@@ -19,6 +23,26 @@ def plug[
 ) -> CoroutinePlugFacadeProtocol[T, MetaData]: ...
 
 
+@overload
+def plug[
+    T, MetaData
+](
+    provider: (
+        Callable[[], AsyncIterator[T]] | Callable[[], AbstractAsyncContextManager[T]]
+    ),
+    metadata: MetaData = None,
+) -> CoroutinePlugFacadeProtocol[T, MetaData]: ...
+
+
+@overload
+def plug[
+    T, MetaData
+](
+    provider: Callable[[], Iterator[T]] | Callable[[], AbstractContextManager[T]],
+    metadata: MetaData = None,
+) -> ProvidingPlugFacadeProtocol[T, MetaData]: ...
+
+
 @overload
 def plug[
     T, MetaData
@@ -43,8 +67,16 @@ def plug[
     | ProvidingPlugFacadeProtocol[T, MetaData]
     | PlugFacadeProtocol[T, MetaData]
 ):
-    if is_coroutine_callable(provider):
-        return CoroutinePlugFacade(provider, metadata)
+    """
+    Start building a plugin from a provider.
+
+    Providers can be generator functions (sync or async), or functions decorated
+    with `contextlib.contextmanager` / `contextlib.asynccontextmanager`. They
+    yield provided value once, and code after `yield` runs on teardown: at
+    registry close for lazy plugins, at scope exit for factory and scoped ones.
+    """
+    if is_coroutine_callable(provider) or is_async_generator_callable(provider):
+        return CoroutinePlugFacade(cast(Callable[[], Awaitable[T]], provider), metadata)
     elif callable(provider):
         return ProvidingPlugFacade(cast(Callable[[], T], provider), metadata)
     else:
@@ -2,8 +2,24 @@ from abc import abstractmethod
 from types import NotImplementedType
 from typing import Any, Awaitable, Callable, Hashable, Literal, Protocol, overload
 
-from plug_in.core.asyncio.plugin import FactoryAsyncCorePlugin, LazyAsyncCorePlugin
-from plug_in.core.plugin import DirectCorePlugin, FactoryCorePlugin, LazyCorePlugin
+from plug_in.core.asyncio.plugin import (
+    CachedAsyncCorePlugin,
+    FactoryAsyncCorePlugin,
+    LazyAsyncCorePlugin,
+    PooledAsyncCorePlugin,
+    ScopedAsyncCorePlugin,
+    TaskLocalAsyncCorePlugin,
+)
+from plug_in.core.plugin import (
+    CachedCorePlugin,
+    DirectCorePlugin,
+    FactoryCorePlugin,
+    LazyCorePlugin,
+    PooledCorePlugin,
+    ScopedCorePlugin,
+    TaskLocalCorePlugin,
+    ThreadLocalCorePlugin,
+)
 
 
 class PluginSelectorProtocol[P, MetaData](Protocol):
@@ -70,6 +86,76 @@ class ProvidingPluginSelectorProtocol[P, MetaData](
         """
         ...
 
+    @overload
+    @abstractmethod
+    def via_provider(self, policy: Literal["scoped"]) -> ScopedCorePlugin[P, MetaData]:
+        """
+        Create [.ScopedCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked once per active scope.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_provider(
+        self, policy: Literal["thread_local"]
+    ) -> ThreadLocalCorePlugin[P, MetaData]:
+        """
+        Create [.ThreadLocalCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked once per thread.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_provider(
+        self, policy: Literal["task_local"]
+    ) -> TaskLocalCorePlugin[P, MetaData]:
+        """
+        Create [.TaskLocalCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked once per asyncio task.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @abstractmethod
+    def via_pool(
+        self,
+        max_size: int = 8,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> PooledCorePlugin[P, MetaData]:
+        """
+        Create [.PooledCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked to fill a pool of at most `max_size` values,
+        and each value will be used by one managed call at a time.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @abstractmethod
+    def via_cache(
+        self,
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> CachedCorePlugin[P, MetaData]:
+        """
+        Create [.CachedCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked again once its result is `ttl` seconds old.
+        Expired value is served for `stale_ttl` more seconds (half of `ttl`
+        by default) while it is refreshed in background.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
 
 class TypedProvidingPluginSelectorProtocol[P, MetaData](
     TypedPluginSelectorProtocol[Callable[[], P], MetaData], Protocol
@@ -110,6 +196,69 @@ class TypedProvidingPluginSelectorProtocol[P, MetaData](
         """
         ...
 
+    @overload
+    @abstractmethod
+    def via_provider(self, policy: Literal["scoped"]) -> ScopedCorePlugin[P, MetaData]:
+        """
+        Create [.ScopedCorePlugin][] for well-known host. Your plug
+        callable will be invoked once per active scope, and the result will be
+        shared by every request within that scope.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_provider(
+        self, policy: Literal["thread_local"]
+    ) -> ThreadLocalCorePlugin[P, MetaData]:
+        """
+        Create [.ThreadLocalCorePlugin][] for well-known host. Your plug
+        callable will be invoked once per thread, and the result will be
+        shared by every request within that thread.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_provider(
+        self, policy: Literal["task_local"]
+    ) -> TaskLocalCorePlugin[P, MetaData]:
+        """
+        Create [.TaskLocalCorePlugin][] for well-known host. Your plug
+        callable will be invoked once per asyncio task, and the result will be
+        shared by every request within that task.
+        """
+        ...
+
+    @abstractmethod
+    def via_pool(
+        self,
+        max_size: int = 8,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> PooledCorePlugin[P, MetaData]:
+        """
+        Create [.PooledCorePlugin][] for well-known host. Your plug callable
+        will be invoked to fill a pool of at most `max_size` values, and each
+        value will be used by one managed call at a time.
+        """
+        ...
+
+    @abstractmethod
+    def via_cache(
+        self,
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> CachedCorePlugin[P, MetaData]:
+        """
+        Create [.CachedCorePlugin][] for well-known host. Your plug callable
+        will be invoked again once its result is `ttl` seconds old.
+        Expired value is served for `stale_ttl` more seconds (half of `ttl`
+        by default) while it is refreshed in background.
+        """
+        ...
+
 
 class CoroutinePluginSelectorProtocol[P, MetaData](
     ProvidingPluginSelectorProtocol[Awaitable[P], MetaData], Protocol
@@ -204,10 +353,11 @@ class CoroutinePluginSelectorProtocol[P, MetaData](
     @overload
     @abstractmethod
     def via_async_provider(
-        self, policy: Literal["lazy"]
+        self, policy: Literal["lazy"], timeout: float | None = None
     ) -> LazyAsyncCorePlugin[P, MetaData]:
         """
-        Alias on `.via_provider(policy="lazy_async")`
+        Alias on `.via_provider(policy="lazy_async")`, with optional `timeout`
+        of the initialization in seconds.
 
         Create [.AsyncLazyCorePlugin][] for non-obvious host type. Your plug
         callable will be invoked and awaited once host subject is requested in
@@ -221,10 +371,15 @@ class CoroutinePluginSelectorProtocol[P, MetaData](
     @overload
     @abstractmethod
     def via_async_provider(
-        self, policy: Literal["factory"]
+        self,
+        policy: Literal["factory"],
+        timeout: float | None = None,
+        coalesce: bool = False,
     ) -> FactoryAsyncCorePlugin[P, MetaData]:
         """
-        Alias on `.via_provider(policy="factory_async")`
+        Alias on `.via_provider(policy="factory_async")`, with optional
+        `timeout` of every invocation in seconds. With `coalesce`, concurrent
+        requests within the same scope (or task) share a single invocation.
 
         Create [.AsyncFactoryCorePlugin][] for non-obvious host type. Your plug
         callable will be invoked and awaited every time host subject is requested
@@ -234,6 +389,140 @@ class CoroutinePluginSelectorProtocol[P, MetaData](
         """
         ...
 
+    @overload
+    @abstractmethod
+    def via_provider(
+        self, policy: Literal["scoped"]
+    ) -> ScopedCorePlugin[Awaitable[P], MetaData]:
+        """
+        Create [.ScopedCorePlugin][] for non-obvious host type.
+
+        ## Caution
+
+        Please revise plugin configuration. Your host type cannot be determined, assuming
+        that Your plug is a callable that returns `Awaitable[T]`. This `Awaitable[T]`
+        will be returned by plugin.provide().
+
+        Use with care.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_provider(
+        self, policy: Literal["scoped_async"]
+    ) -> ScopedAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.ScopedAsyncCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked and awaited once per active scope.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_async_provider(
+        self, policy: Literal["scoped"]
+    ) -> ScopedAsyncCorePlugin[P, MetaData]:
+        """
+        Alias on `.via_provider(policy="scoped_async")`
+
+        Create [.ScopedAsyncCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked and awaited once per active scope.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_provider(
+        self, policy: Literal["task_local_async"]
+    ) -> TaskLocalAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.TaskLocalAsyncCorePlugin][] for non-obvious host type. Your
+        plug callable will be invoked and awaited once per asyncio task.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_async_provider(
+        self, policy: Literal["task_local"]
+    ) -> TaskLocalAsyncCorePlugin[P, MetaData]:
+        """
+        Alias on `.via_provider(policy="task_local_async")`
+
+        Create [.TaskLocalAsyncCorePlugin][] for non-obvious host type. Your
+        plug callable will be invoked and awaited once per asyncio task.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @abstractmethod
+    def via_pool(
+        self,
+        max_size: int = 8,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> PooledAsyncCorePlugin[P, MetaData]:
+        """
+        Alias on `.via_async_pool`. Awaitables are not pooled themselves, as
+        each can be awaited only once.
+        """
+        ...
+
+    @abstractmethod
+    def via_cache(
+        self,
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> CachedAsyncCorePlugin[P, MetaData]:
+        """
+        Alias on `.via_async_cache`. Awaitables are not cached themselves, as
+        each can be awaited only once.
+        """
+        ...
+
+    @abstractmethod
+    def via_async_pool(
+        self,
+        max_size: int = 8,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> PooledAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.PooledAsyncCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked and awaited to fill a pool of at most
+        `max_size` values, and each value will be used by one managed call at
+        a time.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @abstractmethod
+    def via_async_cache(
+        self,
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> CachedAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.CachedAsyncCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked and awaited again once its result is `ttl`
+        seconds old. Expired value is served for `stale_ttl` more seconds (half
+        of `ttl` by default) while it is refreshed in background.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
 
 class TypedCoroutinePluginSelectorProtocol[P, MetaData](
     TypedProvidingPluginSelectorProtocol[Awaitable[P], MetaData], Protocol
@@ -310,10 +599,12 @@ class TypedCoroutinePluginSelectorProtocol[P, MetaData](
     @overload
     @abstractmethod
     def via_async_provider(
-        self, policy: Literal["lazy"]
+        self, policy: Literal["lazy"], timeout: float | None = None
     ) -> LazyAsyncCorePlugin[P, MetaData]:
         """
-        Alias on `.via_provider(policy="factory_async")`
+        Alias on `.via_provider(policy="factory_async")`, with optional
+        `timeout` of every invocation in seconds. With `coalesce`, concurrent
+        requests within the same scope (or task) share a single invocation.
 
         Create [.LazyAsyncCorePlugin][]. Your plug
         callable will be invoked and awaited on first request, and then
@@ -324,10 +615,15 @@ class TypedCoroutinePluginSelectorProtocol[P, MetaData](
     @overload
     @abstractmethod
     def via_async_provider(
-        self, policy: Literal["factory"]
+        self,
+        policy: Literal["factory"],
+        timeout: float | None = None,
+        coalesce: bool = False,
     ) -> FactoryAsyncCorePlugin[P, MetaData]:
         """
-        Alias on `.via_provider(policy="factory_async")`
+        Alias on `.via_provider(policy="factory_async")`, with optional
+        `timeout` of every invocation in seconds. With `coalesce`, concurrent
+        requests within the same scope (or task) share a single invocation.
 
         Create [.FactoryAsyncCorePlugin][]. Your plug
         callable will be invoked and awaited every time host
@@ -335,6 +631,126 @@ class TypedCoroutinePluginSelectorProtocol[P, MetaData](
         """
         ...
 
+    @overload
+    @abstractmethod
+    def via_provider(self, policy: Literal["scoped"]) -> NotImplementedType:
+        """
+        # !! USAGE PROHIBITED !!
+
+        ## Not implemented for typed host subject.
+
+        Your host subject indicates that provider action is done by calling and
+        awaiting. Plugging it via sync provider will result in receiving
+        `Awaitable[T]` instead of `T`. Use `.via_async_provider()`
+        instead.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_provider(
+        self, policy: Literal["scoped_async"]
+    ) -> ScopedAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.ScopedAsyncCorePlugin][]. Your plug
+        callable will be invoked and awaited once per active scope, and the
+        result will be shared by every request within that scope.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_async_provider(
+        self, policy: Literal["scoped"]
+    ) -> ScopedAsyncCorePlugin[P, MetaData]:
+        """
+        Alias on `.via_provider(policy="scoped_async")`
+
+        Create [.ScopedAsyncCorePlugin][]. Your plug
+        callable will be invoked and awaited once per active scope, and the
+        result will be shared by every request within that scope.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_provider(
+        self, policy: Literal["task_local_async"]
+    ) -> TaskLocalAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.TaskLocalAsyncCorePlugin][]. Your plug callable will be
+        invoked and awaited once per asyncio task, and the result will be
+        shared by every request within that task.
+        """
+        ...
+
+    @overload
+    @abstractmethod
+    def via_async_provider(
+        self, policy: Literal["task_local"]
+    ) -> TaskLocalAsyncCorePlugin[P, MetaData]:
+        """
+        Alias on `.via_provider(policy="task_local_async")`
+
+        Create [.TaskLocalAsyncCorePlugin][]. Your plug callable will be
+        invoked and awaited once per asyncio task, and the result will be
+        shared by every request within that task.
+        """
+        ...
+
+    @abstractmethod
+    def via_pool(
+        self,
+        max_size: int = 8,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> NotImplementedType:
+        """
+        Pooling awaitables is not allowed, use `.via_async_pool` instead.
+        """
+        ...
+
+    @abstractmethod
+    def via_async_pool(
+        self,
+        max_size: int = 8,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> PooledAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.PooledAsyncCorePlugin][]. Your plug callable will be invoked
+        and awaited to fill a pool of at most `max_size` values, and each value
+        will be used by one managed call at a time.
+        """
+        ...
+
+    @abstractmethod
+    def via_cache(
+        self,
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> NotImplementedType:
+        """
+        Caching awaitables is not allowed, use `.via_async_cache` instead.
+        """
+        ...
+
+    @abstractmethod
+    def via_async_cache(
+        self,
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> CachedAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.CachedAsyncCorePlugin][]. Your plug callable will be invoked
+        and awaited again once its result is `ttl` seconds old.
+        Expired value is served for `stale_ttl` more seconds (half of `ttl`
+        by default) while it is refreshed in background.
+        """
+        ...
+
 
 class PlugFacadeProtocol[T, MetaData](Protocol):
     @overload
@@ -8,10 +8,26 @@ from plug_in.boot.builder.proto import (
     TypedPluginSelectorProtocol,
     TypedProvidingPluginSelectorProtocol,
 )
-from plug_in.core.asyncio.plugin import FactoryAsyncCorePlugin, LazyAsyncCorePlugin
+from plug_in.core.asyncio.plugin import (
+    CachedAsyncCorePlugin,
+    FactoryAsyncCorePlugin,
+    LazyAsyncCorePlugin,
+    PooledAsyncCorePlugin,
+    ScopedAsyncCorePlugin,
+    TaskLocalAsyncCorePlugin,
+)
 from plug_in.core.host import CoreHost
 from plug_in.core.plug import CorePlug
-from plug_in.core.plugin import DirectCorePlugin, FactoryCorePlugin, LazyCorePlugin
+from plug_in.core.plugin import (
+    CachedCorePlugin,
+    DirectCorePlugin,
+    FactoryCorePlugin,
+    LazyCorePlugin,
+    PooledCorePlugin,
+    ScopedCorePlugin,
+    TaskLocalCorePlugin,
+    ThreadLocalCorePlugin,
+)
 
 
 class PluginSelector[P, MetaData](
@@ -127,9 +143,49 @@ class ProvidingPluginSelector[P, MetaData](
         """
         ...
 
+    @overload
+    def via_provider(self, policy: Literal["scoped"]) -> ScopedCorePlugin[P, MetaData]:
+        """
+        Create [.ScopedCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked once per active scope.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
+    def via_provider(
+        self, policy: Literal["thread_local"]
+    ) -> ThreadLocalCorePlugin[P, MetaData]:
+        """
+        Create [.ThreadLocalCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked once per thread.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
     def via_provider(
-        self, policy: Literal["lazy", "factory"]
-    ) -> FactoryCorePlugin[P, MetaData] | LazyCorePlugin[P, MetaData]:
+        self, policy: Literal["task_local"]
+    ) -> TaskLocalCorePlugin[P, MetaData]:
+        """
+        Create [.TaskLocalCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked once per asyncio task.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    def via_provider(
+        self, policy: Literal["lazy", "factory", "scoped", "thread_local", "task_local"]
+    ) -> (
+        FactoryCorePlugin[P, MetaData]
+        | LazyCorePlugin[P, MetaData]
+        | ScopedCorePlugin[P, MetaData]
+        | ThreadLocalCorePlugin[P, MetaData]
+        | TaskLocalCorePlugin[P, MetaData]
+    ):
 
         match policy:
             case "lazy":
@@ -144,9 +200,69 @@ class ProvidingPluginSelector[P, MetaData](
                     CoreHost(self._sub, self._marks),
                     _metadata=self._metadata,
                 )
+            case "scoped":
+                return ScopedCorePlugin(
+                    CorePlug(self._provider),
+                    CoreHost(self._sub, self._marks),
+                    _metadata=self._metadata,
+                )
+            case "thread_local":
+                return ThreadLocalCorePlugin(
+                    CorePlug(self._provider),
+                    CoreHost(self._sub, self._marks),
+                    _metadata=self._metadata,
+                )
+            case "task_local":
+                return TaskLocalCorePlugin(
+                    CorePlug(self._provider),
+                    CoreHost(self._sub, self._marks),
+                    _metadata=self._metadata,
+                )
             case _:
                 raise RuntimeError(f"{policy=} is not implemented")
 
+    def via_pool(
+        self,
+        max_size: int = 8,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> PooledCorePlugin[P, MetaData]:
+        """
+        Create [.PooledCorePlugin][] holding at most `max_size` values, each
+        used by one managed call at a time. Values idle for `max_idle` seconds
+        are torn down, and requests wait at most `timeout` seconds for a free
+        value. This method implements both protocols.
+        """
+        return PooledCorePlugin(
+            CorePlug(self._provider),
+            CoreHost(self._sub, self._marks),
+            _metadata=self._metadata,
+            _max_size=max_size,
+            _max_idle=max_idle,
+            _timeout=timeout,
+        )
+
+    def via_cache(
+        self,
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> CachedCorePlugin[P, MetaData]:
+        """
+        Create [.CachedCorePlugin][] reusing provided value for `ttl` seconds.
+        Expired value is served for `stale_ttl` more seconds (half of `ttl` when
+        `None`) while it is refreshed in background. This method implements
+        both protocols.
+        """
+        return CachedCorePlugin(
+            CorePlug(self._provider),
+            CoreHost(self._sub, self._marks),
+            _metadata=self._metadata,
+            _ttl=ttl,
+            _stale_ttl=stale_ttl,
+            _jitter=jitter,
+        )
+
 
 class CoroutinePluginSelector[P, MetaData](
     CoroutinePluginSelectorProtocol[P, MetaData],
@@ -235,12 +351,38 @@ class CoroutinePluginSelector[P, MetaData](
         """
         ...
 
+    @overload
+    def via_provider(
+        self, policy: Literal["scoped"]
+    ) -> ScopedCorePlugin[Awaitable[P], MetaData] | NotImplementedType:
+        """
+        Create [.ScopedCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked once per active scope, and the awaitable
+        returned by it will be used in place of host subject.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
+    def via_provider(
+        self, policy: Literal["scoped_async"]
+    ) -> ScopedAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.ScopedAsyncCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked and awaited once per active scope.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
     @overload
     def via_async_provider(
-        self, policy: Literal["lazy"]
+        self, policy: Literal["lazy"], timeout: float | None = None
     ) -> LazyAsyncCorePlugin[P, MetaData]:
         """
-        Alias on `.via_provider(policy="lazy_async")`
+        Alias on `.via_provider(policy="lazy_async")`, with optional `timeout`
+        of the initialization in seconds.
 
         Create [.LazyAsyncCorePlugin][] for non-obvious host type. Your plug
         callable will be invoked and awaited once host subject is requested in
@@ -253,10 +395,15 @@ class CoroutinePluginSelector[P, MetaData](
 
     @overload
     def via_async_provider(
-        self, policy: Literal["factory"]
+        self,
+        policy: Literal["factory"],
+        timeout: float | None = None,
+        coalesce: bool = False,
     ) -> FactoryAsyncCorePlugin[P, MetaData]:
         """
-        Alias on `.via_provider(policy="factory_async")`
+        Alias on `.via_provider(policy="factory_async")`, with optional
+        `timeout` of every invocation in seconds. With `coalesce`, concurrent
+        requests within the same scope (or task) share a single invocation.
 
         Create [.FactoryAsyncCorePlugin][] for non-obvious host type. Your plug
         callable will be invoked and awaited every time host subject is
@@ -266,36 +413,106 @@ class CoroutinePluginSelector[P, MetaData](
         """
         ...
 
+    @overload
+    def via_async_provider(
+        self, policy: Literal["scoped"]
+    ) -> ScopedAsyncCorePlugin[P, MetaData]:
+        """
+        Alias on `.via_provider(policy="scoped_async")`
+
+        Create [.ScopedAsyncCorePlugin][] for non-obvious host type. Your plug
+        callable will be invoked and awaited once per active scope.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
     def via_provider(
-        self, policy: Literal["lazy_async", "factory_async", "lazy", "factory"]
+        self, policy: Literal["task_local_async"]
+    ) -> TaskLocalAsyncCorePlugin[P, MetaData]:
+        """
+        Create [.TaskLocalAsyncCorePlugin][] for non-obvious host type. Your
+        plug callable will be invoked and awaited once per asyncio task.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    @overload
+    def via_async_provider(
+        self, policy: Literal["task_local"]
+    ) -> TaskLocalAsyncCorePlugin[P, MetaData]:
+        """
+        Alias on `.via_provider(policy="task_local_async")`
+
+        Create [.TaskLocalAsyncCorePlugin][] for non-obvious host type. Your
+        plug callable will be invoked and awaited once per asyncio task.
+
+        Always be careful about typing in non-obvious host subject type.
+        """
+        ...
+
+    def via_provider(
+        self,
+        policy: Literal[
+            "lazy_async",
+            "factory_async",
+            "scoped_async",
+            "task_local_async",
+            "lazy",
+            "factory",
+            "scoped",
+        ],
     ) -> (
         FactoryAsyncCorePlugin[P, MetaData]
         | LazyAsyncCorePlugin[P, MetaData]
+        | ScopedAsyncCorePlugin[P, MetaData]
+        | TaskLocalAsyncCorePlugin[P, MetaData]
         | FactoryCorePlugin[Awaitable[P], MetaData]
         | LazyCorePlugin[Awaitable[P], MetaData]
+        | ScopedCorePlugin[Awaitable[P], MetaData]
     ):
 
         match policy:
             case "lazy_async":
-                return LazyCorePlugin(
+                return LazyAsyncCorePlugin(
                     CorePlug(self._provider),
                     CoreHost(self._sub, self._marks),
                     _metadata=self._metadata,
                 )
             case "factory_async":
-                return FactoryCorePlugin(
+                return FactoryAsyncCorePlugin(
+                    CorePlug(self._provider),
+                    CoreHost(self._sub, self._marks),
+                    _metadata=self._metadata,
+                )
+            case "scoped_async":
+                return ScopedAsyncCorePlugin(
+                    CorePlug(self._provider),
+                    CoreHost(self._sub, self._marks),
+                    _metadata=self._metadata,
+                )
+            case "task_local_async":
+                return TaskLocalAsyncCorePlugin(
                     CorePlug(self._provider),
                     CoreHost(self._sub, self._marks),
                     _metadata=self._metadata,
                 )
             case "lazy":
-                return LazyAsyncCorePlugin(
+                return LazyCorePlugin(
                     CorePlug(self._provider),
                     CoreHost(self._sub, self._marks),
                     _metadata=self._metadata,
                 )
             case "factory":
-                return FactoryAsyncCorePlugin(
+                return FactoryCorePlugin(
+                    CorePlug(self._provider),
+                    CoreHost(self._sub, self._marks),
+                    _metadata=self._metadata,
+                )
+            case "scoped":
+                return ScopedCorePlugin(
                     CorePlug(self._provider),
                     CoreHost(self._sub, self._marks),
                     _metadata=self._metadata,
@@ -304,12 +521,96 @@ class CoroutinePluginSelector[P, MetaData](
                 raise RuntimeError(f"{policy=} is not implemented")
 
     def via_async_provider(
-        self, policy: Literal["lazy", "factory"]
-    ) -> LazyAsyncCorePlugin[P, MetaData] | FactoryAsyncCorePlugin[P, MetaData]:
+        self,
+        policy: Literal["lazy", "factory", "scoped", "task_local"],
+        timeout: float | None = None,
+        coalesce: bool = False,
+    ) -> (
+        LazyAsyncCorePlugin[P, MetaData]
+        | FactoryAsyncCorePlugin[P, MetaData]
+        | ScopedAsyncCorePlugin[P, MetaData]
+        | TaskLocalAsyncCorePlugin[P, MetaData]
+    ):
+        if timeout is not None and policy not in ("lazy", "factory"):
+            raise ValueError(f"{policy=} does not support timeout")
+        if coalesce and policy != "factory":
+            raise ValueError(f"{policy=} does not support coalescing")
+
         match policy:
             case "lazy":
-                return self.via_provider(policy="lazy_async")
+                return LazyAsyncCorePlugin(
+                    CorePlug(self._provider),
+                    CoreHost(self._sub, self._marks),
+                    _metadata=self._metadata,
+                    _timeout=timeout,
+                )
             case "factory":
-                return self.via_provider(policy="factory_async")
+                return FactoryAsyncCorePlugin(
+                    CorePlug(self._provider),
+                    CoreHost(self._sub, self._marks),
+                    _metadata=self._metadata,
+                    _timeout=timeout,
+                    _coalesce=coalesce,
+                )
+            case "scoped":
+                return self.via_provider(policy="scoped_async")
+            case "task_local":
+                return self.via_provider(policy="task_local_async")
             case _:
                 raise RuntimeError(f"{policy=} is not implemented")
+
+    def via_pool(
+        self,
+        max_size: int = 8,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> PooledAsyncCorePlugin[P, MetaData] | NotImplementedType:
+        """
+        Alias on `.via_async_pool`. Awaitables are not pooled themselves, as
+        each can be awaited only once. This method implements both protocols,
+        prefer `.via_async_pool`.
+        """
+        return self.via_async_pool(max_size, max_idle, timeout)
+
+    def via_async_pool(
+        self,
+        max_size: int = 8,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> PooledAsyncCorePlugin[P, MetaData]:
+        return PooledAsyncCorePlugin(
+            CorePlug(self._provider),
+            CoreHost(self._sub, self._marks),
+            _metadata=self._metadata,
+            _max_size=max_size,
+            _max_idle=max_idle,
+            _timeout=timeout,
+        )
+
+    def via_cache(
+        self,
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> CachedAsyncCorePlugin[P, MetaData] | NotImplementedType:
+        """
+        Alias on `.via_async_cache`. Awaitables are not cached themselves, as
+        each can be awaited only once. This method implements both protocols,
+        prefer `.via_async_cache`.
+        """
+        return self.via_async_cache(ttl, stale_ttl, jitter)
+
+    def via_async_cache(
+        self,
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> CachedAsyncCorePlugin[P, MetaData]:
+        return CachedAsyncCorePlugin(
+            CorePlug(self._provider),
+            CoreHost(self._sub, self._marks),
+            _metadata=self._metadata,
+            _ttl=ttl,
+            _stale_ttl=stale_ttl,
+            _jitter=jitter,
+        )
@@ -1,10 +1,14 @@
 import threading
-from typing import Any, Callable, Concatenate, Iterable, Union
+from typing import Any, Callable, Concatenate, Hashable, Iterable, Mapping, Union
 from plug_in.boot.builder.builder import plug
+from plug_in.core.graph import DependencyGraph
 from plug_in.core.registry import CoreRegistry
+from plug_in.core.warmup import WarmUpReport
 from plug_in.exc import BootConfigError
+from plug_in.ioc.enum import AsyncResolutionMode
 from plug_in.ioc.router import Router
 from plug_in.types.alias import Manageable
+from plug_in.types.proto.core_host import CoreHostProtocol
 from plug_in.types.proto.core_plugin import (
     CorePluginProtocol,
 )
@@ -163,6 +167,7 @@ class RootConfig[RegCls: CoreRegistryProtocol, RouterCls: RouterProtocol](
         plugins: Iterable[CorePluginProtocol],
         include_default_plugins: bool = True,
         reg_kwargs: dict[str, Any] | None = None,
+        check_dependency_cycles: bool = True,
     ) -> None:
         """
         Creates root registry with provided plugins. Mounts root router to newly
@@ -177,35 +182,187 @@ class RootConfig[RegCls: CoreRegistryProtocol, RouterCls: RouterProtocol](
                 - for `RootConfig` - provides root config
             reg_kwargs: Additional keyword arguments that will be passed to registry
                 factory
+            check_dependency_cycles: If `True` (default), dependencies between
+                plugins provided by callables managed by root router are checked
+                for cycles.
+
+        Raises:
+            [.BootConfigError][]: When root is already initialized.
+            [plug_in.exc.DependencyCycleError][]: When plugin providers depend
+                on each other in a cycle. Root stays uninitialized.
         """
         with _boot_lock:
             if self._is_reg_initialized:
                 raise BootConfigError(f"Root already initialized with config: {self}")
 
-            use_reg_kwargs = reg_kwargs if reg_kwargs is not None else dict()
-
-            if include_default_plugins:
-                use_plugins = [
-                    *plugins,
-                    plug(self._root_registry_provider())
-                    .into(RootRegistry)
-                    .via_provider(policy="lazy"),
-                    plug(self._root_router_provider())
-                    .into(RootRouter)
-                    .via_provider(policy="lazy"),
-                    plug(self).into(RootConfig).directly(),
-                ]
-            else:
-                use_plugins = plugins
-
-            self._registry = self._make_registry(
-                use_plugins,
-                **use_reg_kwargs,
+            registry = self._make_root_registry(
+                plugins, include_default_plugins, reg_kwargs, check_dependency_cycles
             )
+
+            self._registry = registry
             self.get_router().mount(self._registry)
 
             self._is_root_initialized = True
 
+    def swap_root_registry(
+        self,
+        plugins: Iterable[CorePluginProtocol],
+        include_default_plugins: bool = True,
+        reg_kwargs: dict[str, Any] | None = None,
+        check_dependency_cycles: bool = True,
+    ) -> RegCls:
+        """
+        Replace root registry with a new one created from provided plugins,
+        without stopping traffic. Root router is remounted atomically (see
+        [plug_in.ioc.router.Router.remount][]): calls in progress finish with
+        previous plugins, and plans of all routes are rebuilt before the swap.
+
+        Previous registry is returned and not closed, so plugins still used by
+        calls in progress stay usable. Close it when it is drained.
+
+        Args:
+            See [.RootConfig.init_root_registry][].
+
+        Returns:
+            Previous root registry.
+
+        Raises:
+            [.BootConfigError][]: When root registry is not initialized.
+            [plug_in.exc.DependencyCycleError][]: When plugin providers depend
+                on each other in a cycle. Root registry is not changed.
+            [plug_in.exc.SyncPluginExpected][]: When new registry provides async
+                plugin for synchronous route. Root registry is not changed.
+        """
+        with _boot_lock:
+            previous = self.get_registry()
+            registry = self._make_root_registry(
+                plugins, include_default_plugins, reg_kwargs, check_dependency_cycles
+            )
+
+            self.get_router().remount(registry)
+            self._registry = registry
+
+        return previous
+
+    def _make_root_registry(
+        self,
+        plugins: Iterable[CorePluginProtocol],
+        include_default_plugins: bool,
+        reg_kwargs: dict[str, Any] | None,
+        check_dependency_cycles: bool,
+    ) -> RegCls:
+        use_reg_kwargs = reg_kwargs if reg_kwargs is not None else dict()
+
+        if include_default_plugins:
+            use_plugins = [
+                *plugins,
+                plug(self._root_registry_provider())
+                .into(RootRegistry)
+                .via_provider(policy="lazy"),
+                plug(self._root_router_provider())
+                .into(RootRouter)
+                .via_provider(policy="lazy"),
+                plug(self).into(RootConfig).directly(),
+            ]
+        else:
+            use_plugins = plugins
+
+        registry = self._make_registry(
+            use_plugins,
+            **use_reg_kwargs,
+        )
+
+        if check_dependency_cycles:
+            registry.dependency_graph(self.get_router().get_route_dependencies)
+
+        return registry
+
+    def dependency_graph(self) -> DependencyGraph:
+        """
+        Graph of dependencies between plugins of root registry, derived from
+        routes of root router.
+
+        Raises:
+            [.BootConfigError][]: When root registry is not initialized.
+        """
+        return self.get_registry().dependency_graph(
+            self.get_router().get_route_dependencies
+        )
+
+    def close(self) -> None:
+        """
+        Tear down resources of synchronous plugins of root registry, following
+        [.RootConfig.dependency_graph][] in reverse.
+
+        Raises:
+            [.BootConfigError][]: When root registry is not initialized.
+        """
+        self.get_registry().close(graph=self.dependency_graph())
+
+    async def aclose(self) -> None:
+        """
+        Tear down resources of all plugins of root registry, following
+        [.RootConfig.dependency_graph][] in reverse. Independent plugins are
+        closed concurrently.
+
+        Raises:
+            [.BootConfigError][]: When root registry is not initialized.
+        """
+        await self.get_registry().aclose(graph=self.dependency_graph())
+
+    def warm_up(
+        self,
+        hosts: Iterable[CoreHostProtocol[Any]] | None = None,
+        metadata_filter: Callable[[Any], bool] | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        raise_on_error: bool = True,
+    ) -> WarmUpReport:
+        """
+        Initialize sync lazy plugins of root registry ahead of time, following
+        [.RootConfig.dependency_graph][]. Async plugins are skipped, use
+        [.RootConfig.async_warm_up][] from the serving event loop for them.
+        See [plug_in.core.registry.CoreRegistry.warm_up][] for arguments.
+
+        Raises:
+            [.BootConfigError][]: When root registry is not initialized.
+            [plug_in.exc.SyncPluginExpected][]: When one of `hosts` has an
+                async lazy plugin.
+            [plug_in.exc.WarmUpError][]
+        """
+        return self.get_registry().warm_up(
+            hosts=hosts,
+            metadata_filter=metadata_filter,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            raise_on_error=raise_on_error,
+            graph=self.dependency_graph(),
+        )
+
+    async def async_warm_up(
+        self,
+        hosts: Iterable[CoreHostProtocol[Any]] | None = None,
+        metadata_filter: Callable[[Any], bool] | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        raise_on_error: bool = True,
+    ) -> WarmUpReport:
+        """
+        Async version of [.RootConfig.warm_up][].
+
+        Raises:
+            [.BootConfigError][]: When root registry is not initialized.
+            [plug_in.exc.WarmUpError][]
+        """
+        return await self.get_registry().async_warm_up(
+            hosts=hosts,
+            metadata_filter=metadata_filter,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            raise_on_error=raise_on_error,
+            graph=self.dependency_graph(),
+        )
+
 
 def get_root_config() -> RootConfig[CoreRegistryProtocol, RouterProtocol]:
     """
@@ -231,5 +388,33 @@ def get_root_router() -> RootRouter:
     return get_root_config().get_router()
 
 
-def manage[T: Manageable]() -> Callable[[T], T]:
-    return get_root_router().manage()
+def resolve_many(
+    hosts: Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]],
+) -> dict[Hashable, Any] | tuple[Any, ...]:
+    """
+    Resolve many hosts at once via root registry, e.g. outside of managed
+    callables. See [plug_in.core.registry.CoreRegistry.resolve_many][].
+    """
+    return get_root_registry().resolve_many(hosts)
+
+
+async def async_resolve_many(
+    hosts: Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]],
+) -> dict[Hashable, Any] | tuple[Any, ...]:
+    """
+    Resolve many hosts at once into provided values via root registry. See
+    [plug_in.core.registry.CoreRegistry.async_resolve_many][].
+    """
+    return await get_root_registry().async_resolve_many(hosts)
+
+
+def manage[
+    T: Manageable
+](
+    async_resolution: AsyncResolutionMode | None = None,
+    compiled: bool | None = None,
+    timeout: float | None = None,
+) -> Callable[[T], T]:
+    return get_root_router().manage(
+        async_resolution=async_resolution, compiled=compiled, timeout=timeout
+    )
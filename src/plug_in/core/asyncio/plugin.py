@@ -1,29 +1,88 @@
-from dataclasses import dataclass
-from typing import Awaitable, Callable, Literal, Self
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import partial
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Literal, Self
 import asyncio
 
-from plug_in.core.enum import PluginPolicy
+from plug_in.core.cache import AsyncTtlCache
+from plug_in.core.deadline import await_bounded, no_deadline
+from plug_in.core.enum import PluginPolicy, Sentinel
 from plug_in.core.plug import CorePlug
 from plug_in.core.host import CoreHost
+from plug_in.core.lifecycle import (
+    AsyncTeardown,
+    async_enter_provided,
+    async_provide_in_scope,
+    raise_teardown_errors,
+)
+from plug_in.core.local import TaskLocalValues, current_task
+from plug_in.core.pool import AsyncObjectPool, release_target
+from plug_in.core.scope import Scope, find_current_scope, get_current_scope
 from plug_in.exc import UnexpectedForwardRefError
-from plug_in.tools.introspect import contains_forward_refs
+from plug_in.tools.introspect import (
+    contains_forward_refs,
+    is_async_generator_callable,
+)
 from plug_in.types.proto.core_plugin import (
+    AsyncClosingCorePluginProtocol,
     AsyncCorePluginProtocol,
     BindingCorePluginProtocol,
+    HoldingCorePluginProtocol,
     ProvidingCorePluginProtocol,
 )
 
 from plug_in.types.proto.joint import Joint
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LazyAsyncCorePlugin[JointType: Joint, MetaDataType](
-    AsyncCorePluginProtocol[JointType, MetaDataType]
+    AsyncCorePluginProtocol[JointType, MetaDataType],
+    AsyncClosingCorePluginProtocol,
+    HoldingCorePluginProtocol,
 ):
+    """
+    Plug callable is invoked and awaited once, on the first request. Plugin is
+    not bound to any event loop, so it can be safely used from multiple loops
+    and threads. Concurrent first-time awaiters (from any loop) share a single
+    in-flight initialization. Failed initialization is not cached, the next
+    request retries it.
+
+    Initialization runs as a task of the loop of the request that started it,
+    and is bounded only by `timeout` seconds. Deadline of a request (see
+    [plug_in.core.deadline.deadline][]) bounds just its own wait, so a request
+    that gives up does not fail initialization shared with other requests.
+
+    Plug callable can be an async generator function (or
+    `contextlib.asynccontextmanager`), yielding provided value once. Code after
+    `yield` runs on [.LazyAsyncCorePlugin.aclose][] call, e.g. at registry
+    shutdown.
+
+    Raises:
+        [plug_in.exc.ProviderTimeoutError][]: On `provide` call, when value was
+            not provided in time. Timed out initialization is not cached.
+    """
+
     _plug: CorePlug[Callable[[], Awaitable[JointType]]]
     _host: CoreHost[JointType]
     _metadata: MetaDataType
     _policy: Literal[PluginPolicy.LAZY_ASYNC] = PluginPolicy.LAZY_ASYNC
+    _timeout: float | None = None
+    _lock: threading.Lock = field(init=False, repr=False, compare=False)
+    _in_flight: Future[JointType] | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    # Keeps initialization task alive, loop holds only weak references
+    _init_task: asyncio.Task[None] | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _provided: JointType | Literal[Sentinel.NOT_PROVIDED] = field(
+        init=False, repr=False, compare=False, default=Sentinel.NOT_PROVIDED
+    )
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+    _teardown: AsyncTeardown | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def __post_init__(self):
         """
@@ -36,6 +95,11 @@ class LazyAsyncCorePlugin[JointType: Joint, MetaDataType](
                 f"allowed at plugin creation time."
             )
 
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(
+            self, "_lifecycle", is_async_generator_callable(self._plug.provider)
+        )
+
     @property
     def metadata(self) -> MetaDataType:
         return self._metadata
@@ -48,24 +112,101 @@ class LazyAsyncCorePlugin[JointType: Joint, MetaDataType](
     def host(self) -> CoreHost[JointType]:
         return self._host
 
-    def _get_lock(self) -> asyncio.Lock:
-        try:
-            return getattr(self, "_lock")
-        except AttributeError:
-            _lock = asyncio.Lock()
-            object.__setattr__(self, "_lock", _lock)
+    @property
+    def policy(self) -> Literal[PluginPolicy.LAZY_ASYNC]:
+        return self._policy
 
-        return _lock
+    @property
+    def is_provided(self) -> bool:
+        """
+        Whether value is provided and kept, so the next request returns it
+        without invoking plug callable.
+        """
+        return self._provided is not Sentinel.NOT_PROVIDED
 
     async def provide(self) -> JointType:
-        async with self._get_lock():
-            try:
-                return getattr(self, "_provided")
-            except AttributeError:
-                _provided = await self.plug.provider()
-                object.__setattr__(self, "_provided", _provided)
+        # Fast path, no locking once value exists
+        provided = self._provided
+        if provided is not Sentinel.NOT_PROVIDED:
+            return provided
+
+        # Lock is never held across await, it only guards in-flight future
+        with self._lock:
+            provided = self._provided
+            if provided is not Sentinel.NOT_PROVIDED:
+                return provided
 
-        return _provided
+            in_flight = self._in_flight
+            if in_flight is None:
+                in_flight = Future()
+                object.__setattr__(self, "_in_flight", in_flight)
+                object.__setattr__(
+                    self,
+                    "_init_task",
+                    asyncio.get_running_loop().create_task(self._initialize(in_flight)),
+                )
+
+        # Loop agnostic wait, bounded by deadline of this request only.
+        # Shielded, so cancelled request does not cancel shared initialization.
+        return await await_bounded(
+            asyncio.shield(asyncio.wrap_future(in_flight)), None, self.host
+        )
+
+    async def _initialize(self, in_flight: Future[JointType]) -> None:
+        """
+        Invoke plug callable and resolve `in_flight` future with its result.
+        Runs in its own task, with a copy of the context, so lifting the
+        deadline does not affect the request that started it.
+        """
+        teardown: AsyncTeardown | None = None
+        try:
+            with no_deadline():
+                if self._lifecycle:
+                    provided, teardown = await await_bounded(
+                        async_enter_provided(self.plug.provider()),
+                        self._timeout,
+                        self.host,
+                    )
+                else:
+                    provided = await await_bounded(
+                        self.plug.provider(), self._timeout, self.host
+                    )
+        except BaseException as e:
+            # Do not cache failures, next request will retry
+            with self._lock:
+                object.__setattr__(self, "_in_flight", None)
+                object.__setattr__(self, "_init_task", None)
+
+            if isinstance(e, asyncio.CancelledError):
+                in_flight.cancel()
+                raise
+            # Retrieved by waiting requests, not by the task
+            in_flight.set_exception(e)
+            return
+
+        with self._lock:
+            object.__setattr__(self, "_provided", provided)
+            object.__setattr__(self, "_teardown", teardown)
+            object.__setattr__(self, "_in_flight", None)
+            object.__setattr__(self, "_init_task", None)
+
+        in_flight.set_result(provided)
+
+    async def aclose(self) -> None:
+        """
+        Run teardown of provided value (code after `yield` of async generator
+        plug callable). Value is forgotten, so the next request initializes it
+        again. Does nothing when there is nothing to tear down.
+        """
+        with self._lock:
+            teardown = self._teardown
+            if teardown is None:
+                return
+
+            object.__setattr__(self, "_teardown", None)
+            object.__setattr__(self, "_provided", Sentinel.NOT_PROVIDED)
+
+        await teardown()
 
     def assert_sync(
         self,
@@ -82,14 +223,46 @@ class LazyAsyncCorePlugin[JointType: Joint, MetaDataType](
         return self
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FactoryAsyncCorePlugin[JointType: Joint, MetaDataType](
     AsyncCorePluginProtocol[JointType, MetaDataType]
 ):
+    """
+    Plug callable is invoked and awaited on every request, bounded by `timeout`
+    seconds and by the deadline of the request (see
+    [plug_in.core.deadline.deadline][]).
+
+    With `coalesce`, concurrent requests within the same active
+    [plug_in.core.scope.Scope][] (or the same asyncio task, when no scope is
+    active) share a single in-flight invocation, e.g. when one callable hosts
+    the same dependency twice and resolves its parameters with
+    [plug_in.ioc.enum.AsyncResolutionMode.CONCURRENT][]. Task is the one
+    calling `provide`, not the one awaiting it. Requests made after the
+    invocation finished (e.g. with sequential resolution) invoke plug callable
+    again. Shared invocation runs in its own task, bounded only by `timeout`,
+    so a request that is cancelled or hits its deadline affects only itself.
+
+    Plug callable can be an async generator function (or
+    `contextlib.asynccontextmanager`), yielding provided value once. Code after
+    `yield` runs at exit of the active [plug_in.core.scope.Scope][].
+
+    Raises:
+        [plug_in.exc.MissingScopeError][]: On `provide` call, when plug callable
+            is an async generator function and no scope is active.
+        [plug_in.exc.ProviderTimeoutError][]: On `provide` call, when value was
+            not provided in time.
+    """
+
     _plug: CorePlug[Callable[[], Awaitable[JointType]]]
     _host: CoreHost[JointType]
     _metadata: MetaDataType
     _policy: Literal[PluginPolicy.FACTORY_ASYNC] = PluginPolicy.FACTORY_ASYNC
+    _timeout: float | None = None
+    _coalesce: bool = False
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+    _in_flight: dict[object, asyncio.Task[JointType]] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """
@@ -102,6 +275,11 @@ class FactoryAsyncCorePlugin[JointType: Joint, MetaDataType](
                 f"allowed at plugin creation time."
             )
 
+        object.__setattr__(
+            self, "_lifecycle", is_async_generator_callable(self._plug.provider)
+        )
+        object.__setattr__(self, "_in_flight", {})
+
     @property
     def metadata(self) -> MetaDataType:
         return self._metadata
@@ -114,9 +292,164 @@ class FactoryAsyncCorePlugin[JointType: Joint, MetaDataType](
     def host(self) -> CoreHost[JointType]:
         return self._host
 
+    @property
+    def policy(self) -> Literal[PluginPolicy.FACTORY_ASYNC]:
+        return self._policy
+
+    def provide(self) -> Coroutine[Any, Any, JointType]:
+        if self._coalesce:
+            # Owner is taken at request time, awaiting can happen in another
+            # task (e.g. concurrent resolution of route parameters)
+            return self._provide_coalesced(find_current_scope() or current_task())
+
+        return self._invoke()
+
+    async def _provide_coalesced(self, owner: object) -> JointType:
+        in_flight = self._in_flight.get(owner)
+        if in_flight is None:
+            # Runs as a separate task, so a cancelled request does not cancel
+            # invocation shared with other requests
+            in_flight = asyncio.get_running_loop().create_task(self._invoke_shared())
+            self._in_flight[owner] = in_flight
+            in_flight.add_done_callback(partial(self._invocation_done, owner))
+
+        # Bounded by deadline of this request only
+        return await await_bounded(asyncio.shield(in_flight), None, self.host)
+
+    async def _invoke_shared(self) -> JointType:
+        with no_deadline():
+            return await self._invoke()
+
+    def _invocation_done(self, owner: object, task: asyncio.Task[JointType]) -> None:
+        # Only concurrent requests are coalesced
+        if self._in_flight.get(owner) is task:
+            del self._in_flight[owner]
+
+        # Retrieved also when every request gave up waiting
+        if not task.cancelled():
+            task.exception()
+
+    async def _invoke(self) -> JointType:
+        if self._lifecycle:
+            return await await_bounded(
+                async_provide_in_scope(get_current_scope(), self.plug.provider),
+                self._timeout,
+                self.host,
+            )
+
+        return await await_bounded(self.plug.provider(), self._timeout, self.host)
+
+    def assert_sync(
+        self,
+    ) -> (
+        BindingCorePluginProtocol[JointType, MetaDataType]
+        | ProvidingCorePluginProtocol[JointType, MetaDataType]
+    ):
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("LazyAsyncCorePlugin is not synchronous.")
+
+    def assert_async(self) -> Self:
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class ScopedAsyncCorePlugin[JointType: Joint, MetaDataType](
+    AsyncCorePluginProtocol[JointType, MetaDataType]
+):
+    """
+    Plug callable is invoked and awaited once per active
+    [plug_in.core.scope.Scope][]. Concurrent first-time resolutions within the
+    same scope share a single provider invocation, which runs in its own task,
+    so a cancelled request does not affect the others. Failed invocation is
+    not stored in the scope, so the next resolution retries it.
+
+    Plug callable can be an async generator function (or
+    `contextlib.asynccontextmanager`), yielding provided value once. Code after
+    `yield` runs at scope exit.
+
+    Raises:
+        [plug_in.exc.MissingScopeError][]: On `provide` call, when no scope is
+            active.
+    """
+
+    _plug: CorePlug[Callable[[], Awaitable[JointType]]]
+    _host: CoreHost[JointType]
+    _metadata: MetaDataType
+    _policy: Literal[PluginPolicy.SCOPED_ASYNC] = PluginPolicy.SCOPED_ASYNC
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
+        """
+        Raises:
+            [.UnexpectedForwardRefError][]: When provided host has forward references.
+        """
+        if contains_forward_refs(self._host.subject):
+            raise UnexpectedForwardRefError(
+                f"Given host {self._host} contains forward references, which are not "
+                f"allowed at plugin creation time."
+            )
+
+        object.__setattr__(
+            self, "_lifecycle", is_async_generator_callable(self._plug.provider)
+        )
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._metadata
+
+    @property
+    def plug(self) -> CorePlug[Callable[[], Awaitable[JointType]]]:
+        return self._plug
+
+    @property
+    def host(self) -> CoreHost[JointType]:
+        return self._host
+
+    @property
+    def policy(self) -> Literal[PluginPolicy.SCOPED_ASYNC]:
+        return self._policy
+
     async def provide(self) -> JointType:
+        current_scope = get_current_scope()
+
+        try:
+            in_flight: asyncio.Task[JointType] = current_scope.get(self)
+        except KeyError:
+            # Runs as a separate task, so a cancelled request does not cancel
+            # invocation shared with other requests in the scope
+            in_flight = asyncio.get_running_loop().create_task(
+                self._invoke(current_scope)
+            )
+            current_scope.set(self, in_flight)
+            in_flight.add_done_callback(partial(self._invocation_done, current_scope))
+        else:
+            if in_flight.done():
+                return in_flight.result()
+
+        return await asyncio.shield(in_flight)
+
+    async def _invoke(self, current_scope: Scope) -> JointType:
+        if self._lifecycle:
+            return await async_provide_in_scope(current_scope, self.plug.provider)
+
         return await self.plug.provider()
 
+    def _invocation_done(
+        self, current_scope: Scope, task: asyncio.Task[JointType]
+    ) -> None:
+        # Do not keep failures in scope
+        if not task.cancelled() and task.exception() is None:
+            return
+
+        try:
+            stored = current_scope.get(self)
+        except KeyError:
+            return
+        if stored is task:
+            current_scope.pop(self)
+
     def assert_sync(
         self,
     ) -> (
@@ -126,7 +459,355 @@ class FactoryAsyncCorePlugin[JointType: Joint, MetaDataType](
         """
         Always raises `AssertionError`.
         """
-        raise AssertionError("LazyAsyncCorePlugin is not synchronous.")
+        raise AssertionError("ScopedAsyncCorePlugin is not synchronous.")
+
+    def assert_async(self) -> Self:
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class TaskLocalAsyncCorePlugin[JointType: Joint, MetaDataType](
+    AsyncCorePluginProtocol[JointType, MetaDataType], AsyncClosingCorePluginProtocol
+):
+    """
+    Plug callable is invoked and awaited once per asyncio task, on the first
+    request in that task. Concurrent requests within the same task share a
+    single provider invocation. Failed invocation is not kept, the next request
+    retries it. Value of a task is dropped when the task is done.
+
+    Value belongs to the task requesting it (calling `provide`), so tasks
+    created by concurrent resolution of route parameters share value of the
+    task running the route.
+
+    Plug callable can be an async generator function (or
+    `contextlib.asynccontextmanager`), yielding provided value once. Code after
+    `yield` runs in background when the task is done, or on
+    [.TaskLocalAsyncCorePlugin.aclose][] call for tasks still running.
+
+    Raises:
+        [plug_in.exc.MissingTaskError][]: On `provide` call outside of asyncio
+            task.
+    """
+
+    _plug: CorePlug[Callable[[], Awaitable[JointType]]]
+    _host: CoreHost[JointType]
+    _metadata: MetaDataType
+    _policy: Literal[PluginPolicy.TASK_LOCAL_ASYNC] = PluginPolicy.TASK_LOCAL_ASYNC
+    _values: TaskLocalValues = field(init=False, repr=False, compare=False)
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
+        """
+        Raises:
+            [.UnexpectedForwardRefError][]: When provided host has forward references.
+        """
+        if contains_forward_refs(self._host.subject):
+            raise UnexpectedForwardRefError(
+                f"Given host {self._host} contains forward references, which are not "
+                f"allowed at plugin creation time."
+            )
+
+        object.__setattr__(self, "_values", TaskLocalValues())
+        object.__setattr__(
+            self, "_lifecycle", is_async_generator_callable(self._plug.provider)
+        )
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._metadata
+
+    @property
+    def plug(self) -> CorePlug[Callable[[], Awaitable[JointType]]]:
+        return self._plug
+
+    @property
+    def host(self) -> CoreHost[JointType]:
+        return self._host
+
+    @property
+    def policy(self) -> Literal[PluginPolicy.TASK_LOCAL_ASYNC]:
+        return self._policy
+
+    def provide(self) -> Coroutine[Any, Any, JointType]:
+        # Task is taken at request time, awaiting can happen in another task
+        return self._provide_in(current_task())
+
+    async def _provide_in(self, task: asyncio.Task) -> JointType:
+        in_flight: asyncio.Future[JointType] | Literal[Sentinel.NOT_PROVIDED] = (
+            self._values.get(task)
+        )
+        if in_flight is not Sentinel.NOT_PROVIDED:
+            if in_flight.done():
+                return in_flight.result()
+            # Shielded, so cancelled waiter does not cancel shared invocation
+            return await asyncio.shield(in_flight)
+
+        in_flight = asyncio.get_running_loop().create_future()
+        self._values.set(task, in_flight)
+
+        teardown: AsyncTeardown | None = None
+        try:
+            if self._lifecycle:
+                provided, teardown = await async_enter_provided(self.plug.provider())
+            else:
+                provided = await self.plug.provider()
+        except BaseException as e:
+            # Do not keep failures
+            self._values.discard(task)
+            if isinstance(e, asyncio.CancelledError):
+                in_flight.cancel()
+            else:
+                in_flight.set_exception(e)
+                # Mark as retrieved, the exception is propagated below anyway
+                in_flight.exception()
+            raise
+
+        if teardown is not None:
+            self._values.set(task, in_flight, teardown)
+        in_flight.set_result(provided)
+        return provided
+
+    async def aclose(self) -> None:
+        """
+        Run teardowns of values of all running tasks, and wait for teardowns of
+        finished tasks. Values are forgotten, so the next request in every task
+        initializes them again.
+        """
+        teardowns, pending = self._values.pop_all()
+        results = await asyncio.gather(
+            *(teardown() for teardown in teardowns), *pending, return_exceptions=True
+        )
+
+        errors: list[Exception] = []
+        for result in results:
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+
+        raise_teardown_errors(errors, f"Teardown of task-local {self.host} failed")
+
+    def assert_sync(
+        self,
+    ) -> (
+        BindingCorePluginProtocol[JointType, MetaDataType]
+        | ProvidingCorePluginProtocol[JointType, MetaDataType]
+    ):
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("TaskLocalAsyncCorePlugin is not synchronous.")
+
+    def assert_async(self) -> Self:
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class PooledAsyncCorePlugin[JointType: Joint, MetaDataType](
+    AsyncCorePluginProtocol[JointType, MetaDataType], AsyncClosingCorePluginProtocol
+):
+    """
+    Async version of [plug_in.core.plugin.PooledCorePlugin][], backed by
+    [plug_in.core.pool.AsyncObjectPool][]. Plug callable is invoked and awaited
+    when no idle value exists and pool is not full.
+
+    Plug callable can be an async generator function (or
+    `contextlib.asynccontextmanager`), yielding provided value once. Code after
+    `yield` runs when value is evicted from the pool, or on
+    [.PooledAsyncCorePlugin.aclose][] call.
+
+    Raises:
+        [plug_in.exc.MissingScopeError][]: On `provide` call outside of managed
+            call, when no scope is active.
+        [plug_in.exc.PoolTimeoutError][]: On `provide` call, when no value
+            became free in time.
+    """
+
+    _plug: CorePlug[Callable[[], Awaitable[JointType]]]
+    _host: CoreHost[JointType]
+    _metadata: MetaDataType
+    _policy: Literal[PluginPolicy.POOLED_ASYNC] = PluginPolicy.POOLED_ASYNC
+    _max_size: int = 8
+    _max_idle: float | None = None
+    _timeout: float | None = None
+    _pool: AsyncObjectPool = field(init=False, repr=False, compare=False)
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
+        """
+        Raises:
+            [.UnexpectedForwardRefError][]: When provided host has forward references.
+        """
+        if contains_forward_refs(self._host.subject):
+            raise UnexpectedForwardRefError(
+                f"Given host {self._host} contains forward references, which are not "
+                f"allowed at plugin creation time."
+            )
+
+        object.__setattr__(
+            self, "_lifecycle", is_async_generator_callable(self._plug.provider)
+        )
+        object.__setattr__(
+            self,
+            "_pool",
+            AsyncObjectPool(
+                self._create,
+                max_size=self._max_size,
+                max_idle=self._max_idle,
+                timeout=self._timeout,
+            ),
+        )
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._metadata
+
+    @property
+    def plug(self) -> CorePlug[Callable[[], Awaitable[JointType]]]:
+        return self._plug
+
+    @property
+    def host(self) -> CoreHost[JointType]:
+        return self._host
+
+    @property
+    def policy(self) -> Literal[PluginPolicy.POOLED_ASYNC]:
+        return self._policy
+
+    @property
+    def pool(self) -> AsyncObjectPool:
+        return self._pool
+
+    async def _create(self) -> tuple[JointType, AsyncTeardown | None]:
+        if self._lifecycle:
+            return await async_enter_provided(self.plug.provider())
+        return await self.plug.provider(), None
+
+    async def provide(self) -> JointType:
+        # Fail before taking a value that could not be returned
+        push_release = release_target(is_async=True)
+        entry = await self._pool.acquire()
+        push_release(partial(self._pool.release, entry))
+        return entry.value
+
+    async def aclose(self) -> None:
+        """
+        Tear down idle values. Values in use are torn down when returned.
+        """
+        raise_teardown_errors(
+            await self._pool.aclose(), f"Teardown of pooled {self.host} failed"
+        )
+
+    def assert_sync(
+        self,
+    ) -> (
+        BindingCorePluginProtocol[JointType, MetaDataType]
+        | ProvidingCorePluginProtocol[JointType, MetaDataType]
+    ):
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("PooledAsyncCorePlugin is not synchronous.")
+
+    def assert_async(self) -> Self:
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAsyncCorePlugin[JointType: Joint, MetaDataType](
+    AsyncCorePluginProtocol[JointType, MetaDataType], AsyncClosingCorePluginProtocol
+):
+    """
+    Async version of [plug_in.core.plugin.CachedCorePlugin][], backed by
+    [plug_in.core.cache.AsyncTtlCache][]. Plug callable is invoked and awaited
+    on the first request, and its result is reused for `ttl` seconds. Stale
+    value is refreshed by a background task, and concurrent requests waiting
+    for a value share a single invocation.
+
+    Plug callable can be an async generator function (or
+    `contextlib.asynccontextmanager`), yielding provided value once. Code after
+    `yield` runs one refresh after the value was replaced, or on
+    [.CachedAsyncCorePlugin.aclose][] call.
+    """
+
+    _plug: CorePlug[Callable[[], Awaitable[JointType]]]
+    _host: CoreHost[JointType]
+    _metadata: MetaDataType
+    _policy: Literal[PluginPolicy.CACHED_ASYNC] = PluginPolicy.CACHED_ASYNC
+    _ttl: float = 60.0
+    _stale_ttl: float | None = None
+    _jitter: float = 0.1
+    _cache: AsyncTtlCache = field(init=False, repr=False, compare=False)
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
+        """
+        Raises:
+            [.UnexpectedForwardRefError][]: When provided host has forward references.
+        """
+        if contains_forward_refs(self._host.subject):
+            raise UnexpectedForwardRefError(
+                f"Given host {self._host} contains forward references, which are not "
+                f"allowed at plugin creation time."
+            )
+
+        object.__setattr__(
+            self, "_lifecycle", is_async_generator_callable(self._plug.provider)
+        )
+        object.__setattr__(
+            self,
+            "_cache",
+            AsyncTtlCache(
+                self._create,
+                ttl=self._ttl,
+                stale_ttl=self._stale_ttl,
+                jitter=self._jitter,
+            ),
+        )
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._metadata
+
+    @property
+    def plug(self) -> CorePlug[Callable[[], Awaitable[JointType]]]:
+        return self._plug
+
+    @property
+    def host(self) -> CoreHost[JointType]:
+        return self._host
+
+    @property
+    def policy(self) -> Literal[PluginPolicy.CACHED_ASYNC]:
+        return self._policy
+
+    async def _create(self) -> tuple[JointType, AsyncTeardown | None]:
+        if self._lifecycle:
+            return await async_enter_provided(self.plug.provider())
+        return await self.plug.provider(), None
+
+    async def provide(self) -> JointType:
+        return await self._cache.get()
+
+    async def aclose(self) -> None:
+        """
+        Tear down cached value. Value is forgotten, so the next request
+        initializes it again.
+        """
+        raise_teardown_errors(
+            await self._cache.aclose(), f"Teardown of cached {self.host} failed"
+        )
+
+    def assert_sync(
+        self,
+    ) -> (
+        BindingCorePluginProtocol[JointType, MetaDataType]
+        | ProvidingCorePluginProtocol[JointType, MetaDataType]
+    ):
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("CachedAsyncCorePlugin is not synchronous.")
 
     def assert_async(self) -> Self:
         return self
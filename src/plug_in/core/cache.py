@@ -0,0 +1,275 @@
+import asyncio
+from functools import partial
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+from plug_in.core.lifecycle import AsyncTeardown, Teardown
+
+
+class CacheEntry:
+    """
+    Cached value with its teardown and expiry times (`time.monotonic` based).
+    Value is fresh until `expires_at`, and can be served stale until
+    `stale_until` while it is refreshed in background.
+    """
+
+    __slots__ = ("value", "teardown", "expires_at", "stale_until")
+
+    def __init__(
+        self, value: Any, teardown: Any, expires_at: float, stale_until: float
+    ) -> None:
+        self.value = value
+        self.teardown = teardown
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class _Expiry:
+    """
+    Computes expiry of new entries. Time to live is shortened by a random part
+    of `jitter`, so values created together do not expire together. Stale time
+    defaults to half of time to live.
+    """
+
+    __slots__ = ("ttl", "stale_ttl", "jitter")
+
+    def __init__(self, ttl: float, stale_ttl: float | None, jitter: float) -> None:
+        if ttl <= 0:
+            raise ValueError(f"Time to live must be positive, got {ttl}")
+        if stale_ttl is None:
+            stale_ttl = ttl / 2
+        if stale_ttl < 0:
+            raise ValueError(f"Stale time must not be negative, got {stale_ttl}")
+        if not 0 <= jitter < 1:
+            raise ValueError(f"Jitter must be within [0, 1), got {jitter}")
+
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.jitter = jitter
+
+    def entry(self, value: Any, teardown: Any) -> CacheEntry:
+        expires_at = time.monotonic() + self.ttl * (1 - self.jitter * random.random())
+        return CacheEntry(value, teardown, expires_at, expires_at + self.stale_ttl)
+
+
+def _log_refresh_error(error: BaseException) -> None:
+    logging.warning("Background refresh of cached value failed", exc_info=error)
+
+
+class TtlCache:
+    """
+    Single value cache with time to live, refreshed by a sync factory.
+
+    Expired value is still served for `stale_ttl` seconds, while a background
+    thread refreshes it (stale-while-revalidate), so requests do not wait for
+    it. Later, requests wait for the refresh. Only one refresh runs at a time,
+    concurrent requests share its result.
+
+    Replaced value is not torn down right away, as requests that got it just
+    before the replacement may still use it. It is retired, and torn down on
+    the following refresh (so it stays usable for about `ttl` more seconds)
+    or on [.TtlCache.close][].
+
+    Args:
+        create: Returns new value with its teardown (or `None`).
+        ttl: Seconds for which value is fresh.
+        stale_ttl: Seconds after expiry for which value is served stale. Half
+            of `ttl` when `None`, `0` makes every expiry wait for the refresh.
+        jitter: Fraction of `ttl` by which it is randomly shortened.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], tuple[Any, Teardown | None]],
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> None:
+        self._create = create
+        self._expiry = _Expiry(ttl, stale_ttl, jitter)
+        self._entry: CacheEntry | None = None
+        self._retired: CacheEntry | None = None
+        # Held for the whole refresh, so it is also a single-flight guard
+        self._refresh_lock = threading.Lock()
+
+    def get(self) -> Any:
+        entry = self._entry
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.expires_at:
+                return entry.value
+
+            if now < entry.stale_until:
+                self._refresh_in_background()
+                return entry.value
+
+        with self._refresh_lock:
+            entry = self._entry
+            # Concurrent refresh might have finished in the meantime
+            if entry is not None and time.monotonic() < entry.expires_at:
+                return entry.value
+
+            return self._refresh().value
+
+    def _refresh(self) -> CacheEntry:
+        """
+        Create and store new entry. Caller holds refresh lock.
+        """
+        value, teardown = self._create()
+        entry = self._expiry.entry(value, teardown)
+        retired, self._retired, self._entry = self._retired, self._entry, entry
+        if retired is not None and retired.teardown is not None:
+            try:
+                retired.teardown()
+            except Exception as e:
+                logging.warning("Teardown of cached value failed", exc_info=e)
+
+        return entry
+
+    def _refresh_in_background(self) -> None:
+        # Refresh is already running when the lock is taken
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+
+        def refresh() -> None:
+            try:
+                self._refresh()
+            except Exception as e:
+                _log_refresh_error(e)
+            finally:
+                self._refresh_lock.release()
+
+        try:
+            threading.Thread(
+                target=refresh, name="plug_in-cache-refresh", daemon=True
+            ).start()
+        except BaseException:
+            self._refresh_lock.release()
+            raise
+
+    def close(self) -> list[Exception]:
+        """
+        Forget cached value and tear it down, together with retired one. Next
+        request creates it again.
+
+        Returns:
+            Errors raised by teardowns.
+        """
+        with self._refresh_lock:
+            entries = (self._entry, self._retired)
+            self._entry = self._retired = None
+
+        errors: list[Exception] = []
+        for entry in entries:
+            if entry is None or entry.teardown is None:
+                continue
+            try:
+                entry.teardown()
+            except Exception as e:
+                errors.append(e)
+
+        return errors
+
+
+class AsyncTtlCache:
+    """
+    Async version of [.TtlCache][], refreshed by an async factory. Background
+    refresh runs as a task of the event loop of the request that triggered it.
+
+    Args:
+        create: Returns awaitable of new value with its async teardown
+            (or `None`).
+        ttl: See [.TtlCache][].
+        stale_ttl: See [.TtlCache][].
+        jitter: See [.TtlCache][].
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], Awaitable[tuple[Any, AsyncTeardown | None]]],
+        ttl: float,
+        stale_ttl: float | None = None,
+        jitter: float = 0.1,
+    ) -> None:
+        self._create = create
+        self._expiry = _Expiry(ttl, stale_ttl, jitter)
+        self._entry: CacheEntry | None = None
+        self._retired: CacheEntry | None = None
+        self._in_flight: asyncio.Task[CacheEntry] | None = None
+
+    async def get(self) -> Any:
+        entry = self._entry
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.expires_at:
+                return entry.value
+
+            if now < entry.stale_until:
+                self._start_refresh(background=True)
+                return entry.value
+
+        # Shielded, so cancelled request does not cancel shared refresh
+        return (await asyncio.shield(self._start_refresh(background=False))).value
+
+    def _start_refresh(self, background: bool) -> asyncio.Task[CacheEntry]:
+        in_flight = self._in_flight
+        loop = asyncio.get_running_loop()
+        if in_flight is not None and in_flight.get_loop() is loop:
+            return in_flight
+
+        in_flight = loop.create_task(self._refresh())
+        in_flight.add_done_callback(partial(self._refresh_done, background))
+        self._in_flight = in_flight
+        return in_flight
+
+    def _refresh_done(self, background: bool, task: asyncio.Task[CacheEntry]) -> None:
+        if self._in_flight is task:
+            self._in_flight = None
+
+        if task.cancelled():
+            return
+
+        # Retrieved also when nobody waits for the refresh
+        error = task.exception()
+        if error is not None and background:
+            _log_refresh_error(error)
+
+    async def _refresh(self) -> CacheEntry:
+        value, teardown = await self._create()
+        entry = self._expiry.entry(value, teardown)
+        retired, self._retired, self._entry = self._retired, self._entry, entry
+        if retired is not None and retired.teardown is not None:
+            try:
+                await retired.teardown()
+            except Exception as e:
+                logging.warning("Teardown of cached value failed", exc_info=e)
+
+        return entry
+
+    async def aclose(self) -> list[Exception]:
+        """
+        Forget cached value and tear it down, together with retired one.
+        Refresh in progress is cancelled. Next request creates value again.
+
+        Returns:
+            Errors raised by teardowns.
+        """
+        entries = (self._entry, self._retired)
+        self._entry = self._retired = None
+        in_flight, self._in_flight = self._in_flight, None
+        if in_flight is not None:
+            in_flight.cancel()
+
+        errors: list[Exception] = []
+        for entry in entries:
+            if entry is None or entry.teardown is None:
+                continue
+            try:
+                await entry.teardown()
+            except Exception as e:
+                errors.append(e)
+
+        return errors
@@ -0,0 +1,107 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+from typing import Any, Awaitable, Iterator
+
+from plug_in.exc import ProviderTimeoutError
+
+# Absolute deadline (`time.monotonic` based) of the current request
+_deadline: ContextVar[float | None] = ContextVar("plug_in_deadline", default=None)
+
+
+def get_deadline() -> float | None:
+    """
+    Deadline of the current request, or `None` when there is none.
+    """
+    return _deadline.get()
+
+
+@contextmanager
+def deadline(timeout: float | None) -> Iterator[float | None]:
+    """
+    Bound awaiting of async providers within the block (also in tasks created
+    inside it) to `timeout` seconds. Nested deadline cannot extend the outer
+    one. With `None` timeout, the current deadline is kept.
+
+    Example:
+        ```python
+        with deadline(0.5):
+            await handle_request()
+        ```
+
+    Yields:
+        Absolute deadline in effect, as `time.monotonic` value.
+    """
+    current = _deadline.get()
+    if timeout is None:
+        yield current
+        return
+
+    at = time.monotonic() + timeout
+    if current is not None and current < at:
+        at = current
+
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """
+    Lift the current deadline within the block, e.g. for shared work that must
+    not be bounded by deadline of the request that happened to start it.
+    """
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_left(timeout: float | None = None) -> float | None:
+    """
+    Seconds left for awaiting: the lesser of `timeout` and time left to the
+    current deadline. `None` when awaiting is not bounded.
+    """
+    at = _deadline.get()
+    if at is None:
+        return timeout
+
+    left = at - time.monotonic()
+    return left if timeout is None or left < timeout else timeout
+
+
+async def await_bounded[
+    T
+](awaitable: Awaitable[T], timeout: float | None, what: Any) -> T:
+    """
+    Await given awaitable within `timeout` and the current deadline.
+
+    Args:
+        awaitable: Awaitable to be awaited, e.g. provider coroutine.
+        timeout: Own timeout of the awaitable, `None` for no timeout.
+        what: Described in the error message, e.g. host of a plugin.
+
+    Raises:
+        [plug_in.exc.ProviderTimeoutError][]: When time is up. Awaitable is
+            cancelled then.
+    """
+    left = time_left(timeout)
+    if left is None:
+        return await awaitable
+
+    bound = asyncio.timeout(left)
+    try:
+        async with bound:
+            return await awaitable
+    except TimeoutError as e:
+        # Timeouts raised by the awaitable itself are passed through
+        if not bound.expired():
+            raise
+        raise ProviderTimeoutError(
+            f"{what} was not provided within {max(left, 0):.3f}s"
+        ) from e
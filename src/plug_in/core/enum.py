@@ -1,4 +1,4 @@
-from enum import StrEnum
+from enum import Enum, StrEnum
 
 
 class PluginPolicy(StrEnum):
@@ -7,3 +7,20 @@ class PluginPolicy(StrEnum):
     FACTORY = "FACTORY"
     LAZY_ASYNC = "LAZY_ASYNC"
     FACTORY_ASYNC = "FACTORY_ASYNC"
+    SCOPED = "SCOPED"
+    SCOPED_ASYNC = "SCOPED_ASYNC"
+    THREAD_LOCAL = "THREAD_LOCAL"
+    TASK_LOCAL = "TASK_LOCAL"
+    TASK_LOCAL_ASYNC = "TASK_LOCAL_ASYNC"
+    POOLED = "POOLED"
+    POOLED_ASYNC = "POOLED_ASYNC"
+    CACHED = "CACHED"
+    CACHED_ASYNC = "CACHED_ASYNC"
+
+
+class Sentinel(Enum):
+    """
+    Markers used internally in place of values that are not present yet.
+    """
+
+    NOT_PROVIDED = "NOT_PROVIDED"
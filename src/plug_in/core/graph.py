@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+from plug_in.exc import DependencyCycleError
+from plug_in.types.proto.core_host import CoreHostProtocol
+
+
+@dataclass(frozen=True)
+class DependencyGraph:
+    """
+    Dependencies between plugins of a registry, keyed by plugin hosts. Edge
+    `A -> B` means that provider of `A` has a hosted parameter resolved by `B`.
+
+    Graph is acyclic. Use [.build_dependency_graph][] to create instances.
+    """
+
+    _dependencies: Mapping[CoreHostProtocol[Any], tuple[CoreHostProtocol[Any], ...]]
+    _layers: tuple[tuple[CoreHostProtocol[Any], ...], ...]
+
+    @property
+    def layers(self) -> tuple[tuple[CoreHostProtocol[Any], ...], ...]:
+        """
+        Hosts grouped into layers. Every host depends only on hosts from
+        preceding layers, so hosts of one layer can be initialized concurrently.
+        """
+        return self._layers
+
+    @property
+    def order(self) -> tuple[CoreHostProtocol[Any], ...]:
+        """
+        Hosts in topological order, dependencies first.
+        """
+        return tuple(host for layer in self._layers for host in layer)
+
+    @property
+    def hosts(self) -> tuple[CoreHostProtocol[Any], ...]:
+        return tuple(self._dependencies)
+
+    def dependencies(
+        self, host: CoreHostProtocol[Any]
+    ) -> tuple[CoreHostProtocol[Any], ...]:
+        """
+        Direct dependencies of given host. Empty for hosts not in the graph.
+        """
+        return self._dependencies.get(host, ())
+
+    def dependents(
+        self, host: CoreHostProtocol[Any]
+    ) -> tuple[CoreHostProtocol[Any], ...]:
+        """
+        Hosts directly depending on given host.
+        """
+        return tuple(
+            dependent
+            for dependent, dependencies in self._dependencies.items()
+            if host in dependencies
+        )
+
+
+def _find_cycle(
+    dependencies: Mapping[CoreHostProtocol[Any], tuple[CoreHostProtocol[Any], ...]],
+    candidates: Iterable[CoreHostProtocol[Any]],
+) -> tuple[CoreHostProtocol[Any], ...]:
+    """
+    Find one cycle among candidates. Every candidate must belong to or lead to
+    a cycle (as left over by Kahn's algorithm).
+    """
+    remaining = set(candidates)
+    path: list[CoreHostProtocol[Any]] = []
+    position: dict[CoreHostProtocol[Any], int] = {}
+    host = next(iter(remaining))
+
+    while host not in position:
+        position[host] = len(path)
+        path.append(host)
+        host = next(dep for dep in dependencies[host] if dep in remaining)
+
+    return (*path[position[host] :], host)
+
+
+def build_dependency_graph(
+    dependencies: Mapping[CoreHostProtocol[Any], Iterable[CoreHostProtocol[Any]]],
+) -> DependencyGraph:
+    """
+    Build [.DependencyGraph][] from a mapping of hosts to their dependencies.
+    Dependencies that are not keys of the mapping are ignored.
+
+    Raises:
+        [plug_in.exc.DependencyCycleError][]: When dependencies form a cycle.
+    """
+    edges = {
+        host: tuple(dict.fromkeys(dep for dep in deps if dep in dependencies))
+        for host, deps in dependencies.items()
+    }
+
+    pending = {host: len(deps) for host, deps in edges.items()}
+    dependents: dict[CoreHostProtocol[Any], list[CoreHostProtocol[Any]]] = {
+        host: [] for host in edges
+    }
+    for host, deps in edges.items():
+        for dep in deps:
+            dependents[dep].append(host)
+
+    layers: list[tuple[CoreHostProtocol[Any], ...]] = []
+    layer = tuple(host for host, count in pending.items() if count == 0)
+
+    while layer:
+        layers.append(layer)
+        next_layer: list[CoreHostProtocol[Any]] = []
+        for host in layer:
+            for dependent in dependents[host]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    next_layer.append(dependent)
+        layer = tuple(next_layer)
+
+    if sum(len(layer) for layer in layers) != len(edges):
+        cycle = _find_cycle(edges, (host for host, count in pending.items() if count))
+        raise DependencyCycleError(
+            "Plugin dependencies form a cycle: "
+            + " -> ".join(str(host) for host in cycle),
+            cycle=cycle,
+        )
+
+    return DependencyGraph(_dependencies=edges, _layers=tuple(layers))
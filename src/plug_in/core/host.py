@@ -1,18 +1,27 @@
-from dataclasses import dataclass
-from typing import Hashable
+from dataclasses import dataclass, field
+import threading
+import weakref
+from typing import Any, Hashable
 from plug_in.types.proto.core_host import CoreHostProtocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class CoreHost[Subject](CoreHostProtocol[Subject]):
     """
     Create a host object. Hosts are used as a keys to lookup plugins in
-    registries.
+    registries. Hosts are equal when their subjects and marks are equal. Hash
+    is computed once, at construction time. It makes a host slightly larger
+    than one with `__dict__` and no cached hash, in exchange for faster
+    lookups.
 
     """
 
     _subject: Hashable | type[Subject]
     _marks: tuple[Hashable, ...] = ()
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self._subject, *self._marks)))
 
     # This was a wrong decision
     # def __post_init__(self):
@@ -42,5 +51,49 @@ class CoreHost[Subject](CoreHostProtocol[Subject]):
     def marks(self) -> tuple[Hashable, ...]:
         return self._marks
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, CoreHost):
+            return NotImplemented
+
+        return (
+            self._hash == other._hash
+            and self._subject == other._subject
+            and self._marks == other._marks
+        )
+
     def __hash__(self) -> int:
-        return hash((self.subject, *self.marks))
+        return self._hash
+
+
+# Keyed by subject and marks, so entries do not keep hosts alive. Entry is
+# dropped when the last reference to its host is gone.
+_interned_hosts: weakref.WeakValueDictionary[
+    tuple[Hashable, tuple[Hashable, ...]], CoreHostProtocol[Any]
+] = weakref.WeakValueDictionary()
+_intern_lock = threading.Lock()
+
+
+def intern_host[HostT: CoreHostProtocol[Any]](host: HostT) -> HostT:
+    """
+    Return canonical instance of a host equal to given one. Registries and
+    resolvers intern hosts they use, so lookups hit the same key object and
+    dict lookups end at identity check, without comparing subjects and marks.
+
+    Interned hosts are weakly referenced, so hosts of discarded registries and
+    callables are not kept for the process lifetime. Hosts that do not support
+    weak references are returned as they are.
+    """
+    key = (host.subject, host.marks)
+    canonical = _interned_hosts.get(key)
+    if canonical is None:
+        with _intern_lock:
+            try:
+                canonical = _interned_hosts.setdefault(key, host)
+            except TypeError:
+                return host
+
+    # Other host types may have equal subject and marks
+    return canonical if canonical == host else host  # type: ignore[return-value]
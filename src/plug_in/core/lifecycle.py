@@ -0,0 +1,100 @@
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from functools import partial
+from types import AsyncGeneratorType, GeneratorType
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Sequence
+
+if TYPE_CHECKING:
+    from plug_in.core.scope import Scope
+
+type Teardown = Callable[[], None]
+type AsyncTeardown = Callable[[], Awaitable[None]]
+
+
+def _finish_generator(gen: GeneratorType) -> None:
+    try:
+        next(gen)
+    except StopIteration:
+        pass
+    else:
+        raise RuntimeError(f"Provider generator {gen} did not stop after one yield")
+
+
+async def _finish_async_generator(gen: AsyncGeneratorType) -> None:
+    try:
+        await anext(gen)
+    except StopAsyncIteration:
+        pass
+    else:
+        raise RuntimeError(f"Provider generator {gen} did not stop after one yield")
+
+
+def enter_provided(result: Any) -> tuple[Any, Teardown | None]:
+    """
+    Enter result of a lifecycle provider (generator function or
+    `contextlib.contextmanager`). Returns provided value and teardown callback.
+    Other results are returned as they are, with no teardown.
+    """
+    if isinstance(result, GeneratorType):
+        try:
+            value = next(result)
+        except StopIteration as e:
+            raise RuntimeError(f"Provider generator {result} did not yield") from e
+        return value, partial(_finish_generator, result)
+
+    if isinstance(result, AbstractContextManager):
+        return result.__enter__(), partial(result.__exit__, None, None, None)
+
+    return result, None
+
+
+async def async_enter_provided(result: Any) -> tuple[Any, AsyncTeardown | None]:
+    """
+    Enter result of an async lifecycle provider (async generator function or
+    `contextlib.asynccontextmanager`). Returns provided value and teardown
+    callback. Other results are awaited, with no teardown.
+    """
+    if isinstance(result, AsyncGeneratorType):
+        try:
+            value = await anext(result)
+        except StopAsyncIteration as e:
+            raise RuntimeError(f"Provider generator {result} did not yield") from e
+        return value, partial(_finish_async_generator, result)
+
+    if isinstance(result, AbstractAsyncContextManager):
+        return await result.__aenter__(), partial(result.__aexit__, None, None, None)
+
+    return await result, None
+
+
+def provide_in_scope(scope: "Scope", provider: Callable[[], Any]) -> Any:
+    """
+    Call lifecycle provider and register its teardown in given scope.
+    """
+    value, teardown = enter_provided(provider())
+    if teardown is not None:
+        scope.push_teardown(teardown)
+
+    return value
+
+
+async def async_provide_in_scope(scope: "Scope", provider: Callable[[], Any]) -> Any:
+    """
+    Call async lifecycle provider and register its teardown in given scope.
+    """
+    value, teardown = await async_enter_provided(provider())
+    if teardown is not None:
+        scope.push_async_teardown(teardown)
+
+    return value
+
+
+def raise_teardown_errors(errors: Sequence[Exception], message: str) -> None:
+    """
+    Raise errors collected while running teardowns. Single error is raised as
+    it is, multiple errors are raised as `ExceptionGroup`.
+    """
+    if len(errors) == 1:
+        raise errors[0]
+
+    if errors:
+        raise ExceptionGroup(message, errors)
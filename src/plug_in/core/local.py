@@ -0,0 +1,158 @@
+import asyncio
+import inspect
+import threading
+from typing import Any, Awaitable, Callable
+import weakref
+
+from plug_in.core.enum import Sentinel
+from plug_in.exc import MissingTaskError
+
+type LocalTeardown = Callable[[], Awaitable[None] | None]
+
+
+class _ThreadSlot:
+    """
+    Kept in thread-local storage next to the value. It is dropped at thread end,
+    which triggers teardown of the value.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+class ThreadLocalValues:
+    """
+    Values of a plugin, one per thread. Value of a thread is dropped when the
+    thread ends, and its teardown (if any) runs then.
+    """
+
+    __slots__ = ("_local", "_lock", "_finalizers")
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._finalizers: set[weakref.finalize] = set()
+
+    def get(self) -> Any:
+        """
+        Value of the current thread, or [.Sentinel.NOT_PROVIDED][].
+        """
+        return getattr(self._local, "value", Sentinel.NOT_PROVIDED)
+
+    def set(self, value: Any, teardown: LocalTeardown | None = None) -> None:
+        local = self._local
+        local.value = value
+        if teardown is None:
+            return
+
+        slot = _ThreadSlot()
+        local.slot = slot
+        with self._lock:
+            self._finalizers = {f for f in self._finalizers if f.alive}
+            self._finalizers.add(weakref.finalize(slot, teardown))
+
+    def clear(self) -> list[Exception]:
+        """
+        Forget values of all threads and run teardowns of those still alive.
+
+        Returns:
+            Errors raised by teardowns.
+        """
+        with self._lock:
+            finalizers, self._finalizers = self._finalizers, set()
+            self._local = threading.local()
+
+        errors: list[Exception] = []
+        for finalizer in finalizers:
+            try:
+                finalizer()
+            except Exception as e:
+                errors.append(e)
+
+        return errors
+
+
+def current_task() -> asyncio.Task:
+    """
+    Raises:
+        [plug_in.exc.MissingTaskError][]: When called outside of asyncio task.
+    """
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+
+    if task is None:
+        raise MissingTaskError("Task-local plugin requested outside of asyncio task")
+
+    return task
+
+
+class TaskLocalValues:
+    """
+    Values of a plugin, one per asyncio task. Value of a task is dropped when
+    the task is done, and its teardown (if any) runs then. Async teardowns run
+    in background tasks of the loop of finished task.
+    """
+
+    __slots__ = ("_values", "_teardowns", "_pending")
+
+    def __init__(self) -> None:
+        self._values: dict[asyncio.Task, Any] = {}
+        self._teardowns: dict[asyncio.Task, LocalTeardown] = {}
+        self._pending: set[asyncio.Future[Any]] = set()
+
+    def get(self, task: asyncio.Task) -> Any:
+        """
+        Value of given task, or [.Sentinel.NOT_PROVIDED][].
+        """
+        return self._values.get(task, Sentinel.NOT_PROVIDED)
+
+    def set(
+        self, task: asyncio.Task, value: Any, teardown: LocalTeardown | None = None
+    ) -> None:
+        if task not in self._values:
+            task.add_done_callback(self._drop)
+
+        self._values[task] = value
+        if teardown is not None:
+            self._teardowns[task] = teardown
+
+    def discard(self, task: asyncio.Task) -> None:
+        """
+        Forget value of given task without teardown, e.g. when it failed.
+        """
+        if self._values.pop(task, Sentinel.NOT_PROVIDED) is not Sentinel.NOT_PROVIDED:
+            task.remove_done_callback(self._drop)
+        self._teardowns.pop(task, None)
+
+    def _drop(self, task: asyncio.Task) -> None:
+        self._values.pop(task, None)
+        teardown = self._teardowns.pop(task, None)
+        if teardown is None:
+            return
+
+        result = teardown()
+        if inspect.isawaitable(result):
+            pending = asyncio.ensure_future(result)
+            self._pending.add(pending)
+            pending.add_done_callback(self._pending.discard)
+
+    def pop_all(self) -> tuple[list[LocalTeardown], list[asyncio.Future[Any]]]:
+        """
+        Forget values of all tasks.
+
+        Returns:
+            Teardowns of values of tasks still running, and async teardowns
+            in progress.
+        """
+        teardowns: list[LocalTeardown] = []
+        for task in list(self._values):
+            task.remove_done_callback(self._drop)
+            self._values.pop(task, None)
+            teardown = self._teardowns.pop(task, None)
+            if teardown is not None:
+                teardowns.append(teardown)
+
+        pending = list(self._pending)
+        self._pending.clear()
+        return teardowns, pending
@@ -0,0 +1,326 @@
+from bisect import bisect_left
+import threading
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+from plug_in.core.enum import PluginPolicy
+from plug_in.types.proto.core_host import CoreHostProtocol
+from plug_in.types.proto.core_plugin import (
+    CorePluginProtocol,
+    HoldingCorePluginProtocol,
+)
+from plug_in.types.proto.observer import ObserverProtocol
+
+
+class Observer(ObserverProtocol):
+    """
+    Receives instrumentation events of registries and routers it is given to
+    (see `observer` argument of [plug_in.core.registry.CoreRegistry][] and
+    [plug_in.ioc.router.Router][]). Base methods do nothing, override the ones
+    you need.
+
+    Events are reported synchronously, in the middle of resolution, so
+    handlers must be cheap and must not raise. Durations are in seconds.
+    """
+
+    __slots__ = ()
+
+    def on_provide(
+        self,
+        host: CoreHostProtocol[Any],
+        policy: PluginPolicy,
+        duration: float,
+        is_async: bool,
+        hit: bool | None,
+        error: BaseException | None,
+    ) -> None:
+        """
+        Plugin provided a value (or failed to, with `error`). `hit` tells if
+        value kept by plugin was reused, and it is `None` for plugins that do
+        not keep values.
+        """
+
+    def on_route_finalized(self, route: Callable[..., Any], duration: float) -> None:
+        """
+        Plugins of a managed callable were looked up and its call plan is ready.
+        """
+
+    def on_route_failed(self, route: Callable[..., Any], error: BaseException) -> None:
+        """
+        Plugins of a managed callable could not be looked up (yet).
+        """
+
+    def on_bind(self, route: Callable[..., Any], duration: float) -> None:
+        """
+        Arguments of a managed call were prepared, including resolution of
+        hosted parameters.
+        """
+
+
+def observed_provider(
+    observer: ObserverProtocol,
+    plugin: CorePluginProtocol[Any, Any],
+    provide: Callable[[], Any],
+    is_async: bool,
+) -> Callable[[], Any]:
+    """
+    Wrap provide callable of a plugin, so every call is reported to the observer.
+    Wrap once and reuse the result, e.g. in a call plan.
+    """
+    if is_async:
+        return _observed_async(observer, plugin, provide)
+
+    host, policy = plugin.host, plugin.policy
+    holding = plugin if isinstance(plugin, HoldingCorePluginProtocol) else None
+
+    def observed() -> Any:
+        hit = holding.is_provided if holding is not None else None
+        started = perf_counter()
+        try:
+            value = provide()
+        except BaseException as e:
+            observer.on_provide(host, policy, perf_counter() - started, False, hit, e)
+            raise
+
+        observer.on_provide(host, policy, perf_counter() - started, False, hit, None)
+        return value
+
+    return observed
+
+
+def _observed_async(
+    observer: ObserverProtocol,
+    plugin: CorePluginProtocol[Any, Any],
+    provide: Callable[[], Awaitable[Any]],
+) -> Callable[[], Awaitable[Any]]:
+    host, policy = plugin.host, plugin.policy
+    holding = plugin if isinstance(plugin, HoldingCorePluginProtocol) else None
+
+    async def observe(
+        awaitable: Awaitable[Any], hit: bool | None, started: float
+    ) -> Any:
+        try:
+            value = await awaitable
+        except BaseException as e:
+            observer.on_provide(host, policy, perf_counter() - started, True, hit, e)
+            raise
+
+        observer.on_provide(host, policy, perf_counter() - started, True, hit, None)
+        return value
+
+    def observed_async() -> Awaitable[Any]:
+        # Provider is called at request time, as some providers depend on the
+        # task calling them
+        hit = holding.is_provided if holding is not None else None
+        started = perf_counter()
+        try:
+            awaitable = provide()
+        except BaseException as e:
+            observer.on_provide(host, policy, perf_counter() - started, True, hit, e)
+            raise
+
+        return observe(awaitable, hit, started)
+
+    return observed_async
+
+
+class LatencyHistogram:
+    """
+    Counts of durations in exponential buckets. Bucket upper bounds start at
+    1 microsecond and double, up to about 33 seconds. Longer durations are
+    counted in the last, unbounded bucket.
+    """
+
+    BOUNDS: tuple[float, ...] = tuple(1e-6 * 2**exp for exp in range(26))
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, duration: float) -> None:
+        self.counts[bisect_left(self.BOUNDS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Upper bound of the bucket holding `q`-th percentile (`0 < q <= 100`),
+        capped at maximal recorded duration. `None` when nothing was recorded.
+        """
+        if not self.count:
+            return None
+
+        rank = q / 100 * self.count
+        seen = 0
+        for idx, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                break
+
+        return min(self.BOUNDS[idx], self.max) if idx < len(self.BOUNDS) else self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+        }
+
+
+class ProviderStats:
+    """
+    Aggregated `provide` calls of a single host.
+    """
+
+    __slots__ = ("policy", "calls", "errors", "hits", "misses", "latency")
+
+    def __init__(self, policy: PluginPolicy) -> None:
+        self.policy = policy
+        self.calls = 0
+        self.errors = 0
+        self.hits = 0
+        self.misses = 0
+        self.latency = LatencyHistogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "policy": str(self.policy),
+            "calls": self.calls,
+            "errors": self.errors,
+            "hits": self.hits,
+            "misses": self.misses,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class RouteStats:
+    """
+    Aggregated events of a single managed callable.
+    """
+
+    __slots__ = ("finalizations", "failures", "finalization", "bind")
+
+    def __init__(self) -> None:
+        self.finalizations = 0
+        self.failures = 0
+        self.finalization = LatencyHistogram()
+        self.bind = LatencyHistogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "finalizations": self.finalizations,
+            "failures": self.failures,
+            "finalization": self.finalization.as_dict(),
+            "bind": self.bind.as_dict(),
+        }
+
+
+class InMemoryAggregator(Observer):
+    """
+    Observer keeping counts and latency histograms per host and per route in
+    memory. Thread-safe.
+
+    Example:
+        ```python
+        aggregator = InMemoryAggregator()
+        router = Router(observer=aggregator)
+        router.mount(CoreRegistry(plugins, observer=aggregator))
+        ...
+        print(aggregator.snapshot())
+        ```
+    """
+
+    __slots__ = ("_lock", "_providers", "_routes")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._providers: dict[CoreHostProtocol[Any], ProviderStats] = {}
+        self._routes: dict[Callable[..., Any], RouteStats] = {}
+
+    def provider_stats(self, host: CoreHostProtocol[Any]) -> ProviderStats | None:
+        return self._providers.get(host)
+
+    def route_stats(self, route: Callable[..., Any]) -> RouteStats | None:
+        return self._routes.get(route)
+
+    def _route(self, route: Callable[..., Any]) -> RouteStats:
+        stats = self._routes.get(route)
+        if stats is None:
+            stats = self._routes[route] = RouteStats()
+        return stats
+
+    def on_provide(
+        self,
+        host: CoreHostProtocol[Any],
+        policy: PluginPolicy,
+        duration: float,
+        is_async: bool,
+        hit: bool | None,
+        error: BaseException | None,
+    ) -> None:
+        with self._lock:
+            stats = self._providers.get(host)
+            if stats is None:
+                stats = self._providers[host] = ProviderStats(policy)
+
+            stats.calls += 1
+            stats.latency.record(duration)
+            if error is not None:
+                stats.errors += 1
+            if hit is True:
+                stats.hits += 1
+            elif hit is False:
+                stats.misses += 1
+
+    def on_route_finalized(self, route: Callable[..., Any], duration: float) -> None:
+        with self._lock:
+            stats = self._route(route)
+            stats.finalizations += 1
+            stats.finalization.record(duration)
+
+    def on_route_failed(self, route: Callable[..., Any], error: BaseException) -> None:
+        with self._lock:
+            self._route(route).failures += 1
+
+    def on_bind(self, route: Callable[..., Any], duration: float) -> None:
+        with self._lock:
+            self._route(route).bind.record(duration)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        JSON-serializable copy of all statistics. Hosts and routes are keyed by
+        their string representation and qualified name.
+        """
+        with self._lock:
+            return {
+                "providers": {
+                    str(host): stats.as_dict()
+                    for host, stats in self._providers.items()
+                },
+                "routes": {
+                    getattr(route, "__qualname__", repr(route)): stats.as_dict()
+                    for route, stats in self._routes.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._providers.clear()
+            self._routes.clear()
@@ -4,7 +4,7 @@ from plug_in.types.proto.core_plug import CorePlugProtocol
 from plug_in.types.proto.pluggable import Pluggable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CorePlug[T: Pluggable](CorePlugProtocol):
     _provider: T
 
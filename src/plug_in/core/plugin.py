@@ -1,23 +1,49 @@
-from dataclasses import dataclass
+import asyncio
+from concurrent.futures import Executor
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from functools import partial
 import threading
 from typing import Any, Awaitable, Callable, Literal, Self, cast, overload
 
-from plug_in.core.enum import PluginPolicy
+from plug_in.core.cache import TtlCache
+from plug_in.core.enum import PluginPolicy, Sentinel
 from plug_in.core.plug import CorePlug
 from plug_in.core.host import CoreHost
+from plug_in.core.lifecycle import (
+    Teardown,
+    enter_provided,
+    provide_in_scope,
+    raise_teardown_errors,
+)
+from plug_in.core.local import TaskLocalValues, ThreadLocalValues, current_task
+from plug_in.core.pool import ObjectPool, release_target
+from plug_in.core.scope import get_current_scope
 from plug_in.exc import UnexpectedForwardRefError
-from plug_in.tools.introspect import contains_forward_refs
+from plug_in.tools.introspect import contains_forward_refs, is_generator_callable
+from plug_in.types.proto.core_host import CoreHostProtocol
+from plug_in.types.proto.core_plug import CorePlugProtocol
 from plug_in.types.proto.core_plugin import (
     AsyncCorePluginProtocol,
     BindingCorePluginProtocol,
+    ClosingCorePluginProtocol,
+    HoldingCorePluginProtocol,
+    OffloadingCorePluginProtocol,
     ProvidingCorePluginProtocol,
 )
-from plug_in.core.asyncio.plugin import LazyAsyncCorePlugin, FactoryAsyncCorePlugin
+from plug_in.core.asyncio.plugin import (
+    LazyAsyncCorePlugin,
+    FactoryAsyncCorePlugin,
+    ScopedAsyncCorePlugin,
+    TaskLocalAsyncCorePlugin,
+    PooledAsyncCorePlugin,
+    CachedAsyncCorePlugin,
+)
 
 from plug_in.types.proto.joint import Joint
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DirectCorePlugin[JointType: Joint, MetaDataType](
     BindingCorePluginProtocol[JointType, MetaDataType]
 ):
@@ -68,14 +94,32 @@ class DirectCorePlugin[JointType: Joint, MetaDataType](
         raise AssertionError("DirectCorePlugin is not asynchronous")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LazyCorePlugin[JointType: Joint, MetaDataType](
-    ProvidingCorePluginProtocol[JointType, MetaDataType]
+    ProvidingCorePluginProtocol[JointType, MetaDataType],
+    ClosingCorePluginProtocol,
+    HoldingCorePluginProtocol,
 ):
+    """
+    Plug callable is invoked once, on the first request.
+
+    Plug callable can be a generator function (or `contextlib.contextmanager`),
+    yielding provided value once. Code after `yield` runs on
+    [.LazyCorePlugin.close][] call, e.g. at registry shutdown.
+    """
+
     _plug: CorePlug[Callable[[], JointType]]
     _host: CoreHost[JointType]
     _metadata: MetaDataType
     _policy: Literal[PluginPolicy.LAZY] = PluginPolicy.LAZY
+    _lock: threading.Lock = field(init=False, repr=False, compare=False)
+    _provided: JointType | Literal[Sentinel.NOT_PROVIDED] = field(
+        init=False, repr=False, compare=False, default=Sentinel.NOT_PROVIDED
+    )
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+    _teardown: Teardown | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def __post_init__(self):
         """
@@ -88,6 +132,11 @@ class LazyCorePlugin[JointType: Joint, MetaDataType](
                 f"allowed at plugin creation time."
             )
 
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(
+            self, "_lifecycle", is_generator_callable(self._plug.provider)
+        )
+
     @property
     def metadata(self) -> MetaDataType:
         return self._metadata
@@ -100,25 +149,52 @@ class LazyCorePlugin[JointType: Joint, MetaDataType](
     def host(self) -> CoreHost[JointType]:
         return self._host
 
-    def _get_lock(self) -> threading.Lock:
-        try:
-            return getattr(self, "_lock")
-        except AttributeError:
-            _lock = threading.Lock()
-            object.__setattr__(self, "_lock", _lock)
+    @property
+    def policy(self) -> Literal[PluginPolicy.LAZY]:
+        return self._policy
 
-        return _lock
+    @property
+    def is_provided(self) -> bool:
+        """
+        Whether value is provided and kept, so the next request returns it
+        without invoking plug callable.
+        """
+        return self._provided is not Sentinel.NOT_PROVIDED
 
     def provide(self) -> JointType:
-        # TODO: Lock should be instantiated
-        with self._get_lock():
-            try:
-                return getattr(self, "_provided")
-            except AttributeError:
-                _provided = self.plug.provider()
-                object.__setattr__(self, "_provided", _provided)
+        # Fast path, no locking once value exists
+        provided = self._provided
+        if provided is not Sentinel.NOT_PROVIDED:
+            return provided
 
-        return _provided
+        # Double-checked, lock is taken only during first construction
+        with self._lock:
+            provided = self._provided
+            if provided is Sentinel.NOT_PROVIDED:
+                if self._lifecycle:
+                    provided, teardown = enter_provided(self.plug.provider())
+                    object.__setattr__(self, "_teardown", teardown)
+                else:
+                    provided = self.plug.provider()
+                object.__setattr__(self, "_provided", provided)
+
+        return provided
+
+    def close(self) -> None:
+        """
+        Run teardown of provided value (code after `yield` of generator plug
+        callable). Value is forgotten, so the next request initializes it again.
+        Does nothing when there is nothing to tear down.
+        """
+        with self._lock:
+            teardown = self._teardown
+            if teardown is None:
+                return
+
+            object.__setattr__(self, "_teardown", None)
+            object.__setattr__(self, "_provided", Sentinel.NOT_PROVIDED)
+
+        teardown()
 
     def assert_sync(
         self,
@@ -132,14 +208,27 @@ class LazyCorePlugin[JointType: Joint, MetaDataType](
         raise AssertionError("LazyCorePlugin is not asynchronous")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FactoryCorePlugin[JointType: Joint, MetaDataType](
     ProvidingCorePluginProtocol[JointType, MetaDataType]
 ):
+    """
+    Plug callable is invoked on every request.
+
+    Plug callable can be a generator function (or `contextlib.contextmanager`),
+    yielding provided value once. Code after `yield` runs at exit of the active
+    [plug_in.core.scope.Scope][].
+
+    Raises:
+        [plug_in.exc.MissingScopeError][]: On `provide` call, when plug callable
+            is a generator function and no scope is active.
+    """
+
     _plug: CorePlug[Callable[[], JointType]]
     _host: CoreHost[JointType]
     _metadata: MetaDataType
     _policy: Literal[PluginPolicy.FACTORY] = PluginPolicy.FACTORY
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
 
     def __post_init__(self):
         """
@@ -152,6 +241,10 @@ class FactoryCorePlugin[JointType: Joint, MetaDataType](
                 f"allowed at plugin creation time."
             )
 
+        object.__setattr__(
+            self, "_lifecycle", is_generator_callable(self._plug.provider)
+        )
+
     @property
     def metadata(self) -> MetaDataType:
         return self._metadata
@@ -164,7 +257,14 @@ class FactoryCorePlugin[JointType: Joint, MetaDataType](
     def host(self) -> CoreHost[JointType]:
         return self._host
 
+    @property
+    def policy(self) -> Literal[PluginPolicy.FACTORY]:
+        return self._policy
+
     def provide(self) -> JointType:
+        if self._lifecycle:
+            return provide_in_scope(get_current_scope(), self.plug.provider)
+
         return self.plug.provider()
 
     def assert_sync(
@@ -179,6 +279,581 @@ class FactoryCorePlugin[JointType: Joint, MetaDataType](
         raise AssertionError("FactoryCorePlugin is not asynchronous")
 
 
+@dataclass(frozen=True, slots=True)
+class ScopedCorePlugin[JointType: Joint, MetaDataType](
+    ProvidingCorePluginProtocol[JointType, MetaDataType]
+):
+    """
+    Plug callable is invoked once per active [plug_in.core.scope.Scope][]. Every
+    resolution within the same scope receives the same value.
+
+    Plug callable can be a generator function (or `contextlib.contextmanager`),
+    yielding provided value once. Code after `yield` runs at scope exit.
+
+    Raises:
+        [plug_in.exc.MissingScopeError][]: On `provide` call, when no scope is
+            active.
+    """
+
+    _plug: CorePlug[Callable[[], JointType]]
+    _host: CoreHost[JointType]
+    _metadata: MetaDataType
+    _policy: Literal[PluginPolicy.SCOPED] = PluginPolicy.SCOPED
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
+        """
+        Raises:
+            [.UnexpectedForwardRefError][]: When provided host has forward references.
+        """
+        if contains_forward_refs(self._host.subject):
+            raise UnexpectedForwardRefError(
+                f"Given host {self._host} contains forward references, which are not "
+                f"allowed at plugin creation time."
+            )
+
+        object.__setattr__(
+            self, "_lifecycle", is_generator_callable(self._plug.provider)
+        )
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._metadata
+
+    @property
+    def plug(self) -> CorePlug[Callable[[], JointType]]:
+        return self._plug
+
+    @property
+    def host(self) -> CoreHost[JointType]:
+        return self._host
+
+    @property
+    def policy(self) -> Literal[PluginPolicy.SCOPED]:
+        return self._policy
+
+    def provide(self) -> JointType:
+        current_scope = get_current_scope()
+
+        if self._lifecycle:
+            return current_scope.get_or_create(
+                self, partial(provide_in_scope, current_scope, self.plug.provider)
+            )
+
+        return current_scope.get_or_create(self, self.plug.provider)
+
+    def assert_sync(
+        self,
+    ) -> Self:
+        return self
+
+    def assert_async(self) -> AsyncCorePluginProtocol[JointType, MetaDataType]:
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("ScopedCorePlugin is not asynchronous")
+
+
+@dataclass(frozen=True, slots=True)
+class ThreadLocalCorePlugin[JointType: Joint, MetaDataType](
+    ProvidingCorePluginProtocol[JointType, MetaDataType], ClosingCorePluginProtocol
+):
+    """
+    Plug callable is invoked once per thread, on the first request in that
+    thread. Use it for values that are expensive to create, but are not safe to
+    share between threads. Value of a thread is dropped when the thread ends.
+
+    Plug callable can be a generator function (or `contextlib.contextmanager`),
+    yielding provided value once. Code after `yield` runs when the thread ends,
+    or on [.ThreadLocalCorePlugin.close][] call for threads still running.
+    """
+
+    _plug: CorePlug[Callable[[], JointType]]
+    _host: CoreHost[JointType]
+    _metadata: MetaDataType
+    _policy: Literal[PluginPolicy.THREAD_LOCAL] = PluginPolicy.THREAD_LOCAL
+    _values: ThreadLocalValues = field(init=False, repr=False, compare=False)
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
+        """
+        Raises:
+            [.UnexpectedForwardRefError][]: When provided host has forward references.
+        """
+        if contains_forward_refs(self._host.subject):
+            raise UnexpectedForwardRefError(
+                f"Given host {self._host} contains forward references, which are not "
+                f"allowed at plugin creation time."
+            )
+
+        object.__setattr__(self, "_values", ThreadLocalValues())
+        object.__setattr__(
+            self, "_lifecycle", is_generator_callable(self._plug.provider)
+        )
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._metadata
+
+    @property
+    def plug(self) -> CorePlug[Callable[[], JointType]]:
+        return self._plug
+
+    @property
+    def host(self) -> CoreHost[JointType]:
+        return self._host
+
+    @property
+    def policy(self) -> Literal[PluginPolicy.THREAD_LOCAL]:
+        return self._policy
+
+    def provide(self) -> JointType:
+        provided = self._values.get()
+        if provided is not Sentinel.NOT_PROVIDED:
+            return provided
+
+        # No locking, no other thread touches value of this one
+        teardown: Teardown | None = None
+        if self._lifecycle:
+            provided, teardown = enter_provided(self.plug.provider())
+        else:
+            provided = self.plug.provider()
+
+        self._values.set(provided, teardown)
+        return provided
+
+    def close(self) -> None:
+        """
+        Run teardowns of values of all running threads, from the calling thread.
+        Values are forgotten, so the next request in every thread initializes
+        them again.
+        """
+        raise_teardown_errors(
+            self._values.clear(), f"Teardown of thread-local {self.host} failed"
+        )
+
+    def assert_sync(
+        self,
+    ) -> Self:
+        return self
+
+    def assert_async(self) -> AsyncCorePluginProtocol[JointType, MetaDataType]:
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("ThreadLocalCorePlugin is not asynchronous")
+
+
+@dataclass(frozen=True, slots=True)
+class TaskLocalCorePlugin[JointType: Joint, MetaDataType](
+    ProvidingCorePluginProtocol[JointType, MetaDataType], ClosingCorePluginProtocol
+):
+    """
+    Plug callable is invoked once per asyncio task, on the first request in
+    that task. Value of a task is dropped when the task is done. Tasks created
+    by concurrent resolution of route parameters do not get their own values,
+    as plugins are requested before these tasks start.
+
+    Plug callable can be a generator function (or `contextlib.contextmanager`),
+    yielding provided value once. Code after `yield` runs when the task is done,
+    or on [.TaskLocalCorePlugin.close][] call for tasks still running.
+
+    Raises:
+        [plug_in.exc.MissingTaskError][]: On `provide` call outside of asyncio
+            task.
+    """
+
+    _plug: CorePlug[Callable[[], JointType]]
+    _host: CoreHost[JointType]
+    _metadata: MetaDataType
+    _policy: Literal[PluginPolicy.TASK_LOCAL] = PluginPolicy.TASK_LOCAL
+    _values: TaskLocalValues = field(init=False, repr=False, compare=False)
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
+        """
+        Raises:
+            [.UnexpectedForwardRefError][]: When provided host has forward references.
+        """
+        if contains_forward_refs(self._host.subject):
+            raise UnexpectedForwardRefError(
+                f"Given host {self._host} contains forward references, which are not "
+                f"allowed at plugin creation time."
+            )
+
+        object.__setattr__(self, "_values", TaskLocalValues())
+        object.__setattr__(
+            self, "_lifecycle", is_generator_callable(self._plug.provider)
+        )
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._metadata
+
+    @property
+    def plug(self) -> CorePlug[Callable[[], JointType]]:
+        return self._plug
+
+    @property
+    def host(self) -> CoreHost[JointType]:
+        return self._host
+
+    @property
+    def policy(self) -> Literal[PluginPolicy.TASK_LOCAL]:
+        return self._policy
+
+    def provide(self) -> JointType:
+        task = current_task()
+        provided = self._values.get(task)
+        if provided is not Sentinel.NOT_PROVIDED:
+            return provided
+
+        teardown: Teardown | None = None
+        if self._lifecycle:
+            provided, teardown = enter_provided(self.plug.provider())
+        else:
+            provided = self.plug.provider()
+
+        self._values.set(task, provided, teardown)
+        return provided
+
+    def close(self) -> None:
+        """
+        Run teardowns of values of all running tasks. Values are forgotten, so
+        the next request in every task initializes them again.
+        """
+        teardowns, _ = self._values.pop_all()
+        errors: list[Exception] = []
+        for teardown in teardowns:
+            try:
+                teardown()
+            except Exception as e:
+                errors.append(e)
+
+        raise_teardown_errors(errors, f"Teardown of task-local {self.host} failed")
+
+    def assert_sync(
+        self,
+    ) -> Self:
+        return self
+
+    def assert_async(self) -> AsyncCorePluginProtocol[JointType, MetaDataType]:
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("TaskLocalCorePlugin is not asynchronous")
+
+
+@dataclass(frozen=True, slots=True)
+class PooledCorePlugin[JointType: Joint, MetaDataType](
+    ProvidingCorePluginProtocol[JointType, MetaDataType], ClosingCorePluginProtocol
+):
+    """
+    Values are taken from a bounded pool ([plug_in.core.pool.ObjectPool][]) and
+    returned to it when the managed call that requested them finishes, also when
+    it raises. Outside of managed calls, values are returned at exit of the
+    active [plug_in.core.scope.Scope][]. Use it for values that are expensive
+    to create, but cannot be used by two callers at once.
+
+    Plug callable is invoked when no idle value exists and pool is not full.
+    When pool is full, request waits for a value to be returned, at most
+    `timeout` seconds. Values idle for `max_idle` seconds are torn down.
+
+    Plug callable can be a generator function (or `contextlib.contextmanager`),
+    yielding provided value once. Code after `yield` runs when value is evicted
+    from the pool, or on [.PooledCorePlugin.close][] call.
+
+    Raises:
+        [plug_in.exc.MissingScopeError][]: On `provide` call outside of managed
+            call, when no scope is active.
+        [plug_in.exc.PoolTimeoutError][]: On `provide` call, when no value
+            became free in time.
+    """
+
+    _plug: CorePlug[Callable[[], JointType]]
+    _host: CoreHost[JointType]
+    _metadata: MetaDataType
+    _policy: Literal[PluginPolicy.POOLED] = PluginPolicy.POOLED
+    _max_size: int = 8
+    _max_idle: float | None = None
+    _timeout: float | None = None
+    _pool: ObjectPool = field(init=False, repr=False, compare=False)
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
+        """
+        Raises:
+            [.UnexpectedForwardRefError][]: When provided host has forward references.
+        """
+        if contains_forward_refs(self._host.subject):
+            raise UnexpectedForwardRefError(
+                f"Given host {self._host} contains forward references, which are not "
+                f"allowed at plugin creation time."
+            )
+
+        object.__setattr__(
+            self, "_lifecycle", is_generator_callable(self._plug.provider)
+        )
+        object.__setattr__(
+            self,
+            "_pool",
+            ObjectPool(
+                self._create,
+                max_size=self._max_size,
+                max_idle=self._max_idle,
+                timeout=self._timeout,
+            ),
+        )
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._metadata
+
+    @property
+    def plug(self) -> CorePlug[Callable[[], JointType]]:
+        return self._plug
+
+    @property
+    def host(self) -> CoreHost[JointType]:
+        return self._host
+
+    @property
+    def policy(self) -> Literal[PluginPolicy.POOLED]:
+        return self._policy
+
+    @property
+    def pool(self) -> ObjectPool:
+        return self._pool
+
+    def _create(self) -> tuple[JointType, Teardown | None]:
+        if self._lifecycle:
+            return enter_provided(self.plug.provider())
+        return self.plug.provider(), None
+
+    def provide(self) -> JointType:
+        # Fail before taking a value that could not be returned
+        push_release = release_target(is_async=False)
+        entry = self._pool.acquire()
+        push_release(partial(self._pool.release, entry))
+        return entry.value
+
+    def close(self) -> None:
+        """
+        Tear down idle values. Values in use are torn down when returned.
+        """
+        raise_teardown_errors(
+            self._pool.close(), f"Teardown of pooled {self.host} failed"
+        )
+
+    def assert_sync(
+        self,
+    ) -> Self:
+        return self
+
+    def assert_async(self) -> AsyncCorePluginProtocol[JointType, MetaDataType]:
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("PooledCorePlugin is not asynchronous")
+
+
+@dataclass(frozen=True, slots=True)
+class CachedCorePlugin[JointType: Joint, MetaDataType](
+    ProvidingCorePluginProtocol[JointType, MetaDataType], ClosingCorePluginProtocol
+):
+    """
+    Plug callable is invoked on the first request, and its result is reused
+    for `ttl` seconds ([plug_in.core.cache.TtlCache][]). Use it for values that
+    must be refreshed periodically, like credentials or configuration snapshots.
+
+    Expired value is still provided for `stale_ttl` seconds (half of `ttl` by
+    default), while it is refreshed in background thread, so requests hitting
+    the expiry do not wait. Only one refresh runs at a time. Time to live of
+    every value is randomly shortened by up to `jitter` fraction of it.
+
+    Plug callable can be a generator function (or `contextlib.contextmanager`),
+    yielding provided value once. Code after `yield` runs one refresh after
+    the value was replaced, so it stays usable by requests that got it just
+    before, or on [.CachedCorePlugin.close][] call.
+    """
+
+    _plug: CorePlug[Callable[[], JointType]]
+    _host: CoreHost[JointType]
+    _metadata: MetaDataType
+    _policy: Literal[PluginPolicy.CACHED] = PluginPolicy.CACHED
+    _ttl: float = 60.0
+    _stale_ttl: float | None = None
+    _jitter: float = 0.1
+    _cache: TtlCache = field(init=False, repr=False, compare=False)
+    _lifecycle: bool = field(init=False, repr=False, compare=False, default=False)
+
+    def __post_init__(self):
+        """
+        Raises:
+            [.UnexpectedForwardRefError][]: When provided host has forward references.
+        """
+        if contains_forward_refs(self._host.subject):
+            raise UnexpectedForwardRefError(
+                f"Given host {self._host} contains forward references, which are not "
+                f"allowed at plugin creation time."
+            )
+
+        object.__setattr__(
+            self, "_lifecycle", is_generator_callable(self._plug.provider)
+        )
+        object.__setattr__(
+            self,
+            "_cache",
+            TtlCache(
+                self._create,
+                ttl=self._ttl,
+                stale_ttl=self._stale_ttl,
+                jitter=self._jitter,
+            ),
+        )
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._metadata
+
+    @property
+    def plug(self) -> CorePlug[Callable[[], JointType]]:
+        return self._plug
+
+    @property
+    def host(self) -> CoreHost[JointType]:
+        return self._host
+
+    @property
+    def policy(self) -> Literal[PluginPolicy.CACHED]:
+        return self._policy
+
+    def _create(self) -> tuple[JointType, Teardown | None]:
+        if self._lifecycle:
+            return enter_provided(self.plug.provider())
+        return self.plug.provider(), None
+
+    def provide(self) -> JointType:
+        return self._cache.get()
+
+    def close(self) -> None:
+        """
+        Tear down cached value. Value is forgotten, so the next request
+        initializes it again.
+        """
+        raise_teardown_errors(
+            self._cache.close(), f"Teardown of cached {self.host} failed"
+        )
+
+    def assert_sync(
+        self,
+    ) -> Self:
+        return self
+
+    def assert_async(self) -> AsyncCorePluginProtocol[JointType, MetaDataType]:
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("CachedCorePlugin is not asynchronous")
+
+
+@dataclass(frozen=True, slots=True)
+class BlockingCorePlugin[JointType: Joint, MetaDataType](
+    ProvidingCorePluginProtocol[JointType, MetaDataType],
+    ClosingCorePluginProtocol,
+    OffloadingCorePluginProtocol,
+):
+    """
+    Wraps sync plugin which provider blocks (e.g. performs I/O). Sync callers
+    use it as the wrapped plugin. Async managed callables, and async registry
+    resolution, run its provider in `executor` instead, so the event loop is
+    not blocked, and await it together with async plugins. When `executor` is
+    `None`, default executor of the running loop is used.
+
+    Provider runs in a copy of the caller context, so active
+    [plug_in.core.scope.Scope][] is visible to it. Value already kept by the
+    wrapped plugin (e.g. initialized `LAZY` one) is returned in place.
+
+    Use [.blocking][] to create instances.
+    """
+
+    _plugin: ProvidingCorePluginProtocol[JointType, MetaDataType]
+    _executor: Executor | None = None
+
+    @property
+    def plugin(self) -> ProvidingCorePluginProtocol[JointType, MetaDataType]:
+        return self._plugin
+
+    @property
+    def executor(self) -> Executor | None:
+        return self._executor
+
+    @property
+    def metadata(self) -> MetaDataType:
+        return self._plugin.metadata
+
+    @property
+    def plug(self) -> CorePlugProtocol[Callable[[], JointType]]:
+        return self._plugin.plug
+
+    @property
+    def host(self) -> CoreHostProtocol[JointType]:
+        return self._plugin.host
+
+    @property
+    def policy(self) -> PluginPolicy:
+        return self._plugin.policy
+
+    def provide(self) -> JointType:
+        return self._plugin.provide()
+
+    async def offload(self) -> JointType:
+        plugin = self._plugin
+        # Value kept by the plugin is returned without a thread pool round trip
+        if isinstance(plugin, HoldingCorePluginProtocol) and plugin.is_provided:
+            return plugin.provide()
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, copy_context().run, plugin.provide
+        )
+
+    def close(self) -> None:
+        """
+        Close wrapped plugin, if it holds a resource.
+        """
+        if isinstance(self._plugin, ClosingCorePluginProtocol):
+            self._plugin.close()
+
+    def assert_sync(
+        self,
+    ) -> Self:
+        return self
+
+    def assert_async(self) -> AsyncCorePluginProtocol[JointType, MetaDataType]:
+        """
+        Always raises `AssertionError`.
+        """
+        raise AssertionError("BlockingCorePlugin is not asynchronous")
+
+
+def blocking[
+    JointType: Joint, MetaDataType
+](
+    plugin: ProvidingCorePluginProtocol[JointType, MetaDataType],
+    executor: Executor | None = None,
+) -> BlockingCorePlugin[JointType, MetaDataType]:
+    """
+    Mark sync plugin as blocking. Its provider will run in `executor` when
+    resolved for async callers. See [.BlockingCorePlugin][].
+
+    Example:
+        ```python
+        blocking(plug(read_config).into(Config).via_provider("lazy"))
+        ```
+    """
+    return BlockingCorePlugin(plugin, executor)
+
+
 @overload
 def create_core_plugin[
     JointType: Joint, MetaDataType: Any
@@ -234,6 +909,105 @@ def create_core_plugin[
 ) -> FactoryAsyncCorePlugin[JointType, MetaDataType]: ...
 
 
+@overload
+def create_core_plugin[
+    JointType: Joint, MetaDataType: Any
+](
+    plug: CorePlug[Callable[[], JointType]],
+    host: CoreHost[JointType],
+    policy: Literal[PluginPolicy.SCOPED],
+    meta: MetaDataType = None,
+) -> ScopedCorePlugin[JointType, MetaDataType]: ...
+
+
+@overload
+def create_core_plugin[
+    JointType: Joint, MetaDataType: Any
+](
+    plug: CorePlug[Callable[[], Awaitable[JointType]]],
+    host: CoreHost[JointType],
+    policy: Literal[PluginPolicy.SCOPED_ASYNC],
+    meta: MetaDataType = None,
+) -> ScopedAsyncCorePlugin[JointType, MetaDataType]: ...
+
+
+@overload
+def create_core_plugin[
+    JointType: Joint, MetaDataType: Any
+](
+    plug: CorePlug[Callable[[], JointType]],
+    host: CoreHost[JointType],
+    policy: Literal[PluginPolicy.THREAD_LOCAL],
+    meta: MetaDataType = None,
+) -> ThreadLocalCorePlugin[JointType, MetaDataType]: ...
+
+
+@overload
+def create_core_plugin[
+    JointType: Joint, MetaDataType: Any
+](
+    plug: CorePlug[Callable[[], JointType]],
+    host: CoreHost[JointType],
+    policy: Literal[PluginPolicy.TASK_LOCAL],
+    meta: MetaDataType = None,
+) -> TaskLocalCorePlugin[JointType, MetaDataType]: ...
+
+
+@overload
+def create_core_plugin[
+    JointType: Joint, MetaDataType: Any
+](
+    plug: CorePlug[Callable[[], Awaitable[JointType]]],
+    host: CoreHost[JointType],
+    policy: Literal[PluginPolicy.TASK_LOCAL_ASYNC],
+    meta: MetaDataType = None,
+) -> TaskLocalAsyncCorePlugin[JointType, MetaDataType]: ...
+
+
+@overload
+def create_core_plugin[
+    JointType: Joint, MetaDataType: Any
+](
+    plug: CorePlug[Callable[[], JointType]],
+    host: CoreHost[JointType],
+    policy: Literal[PluginPolicy.POOLED],
+    meta: MetaDataType = None,
+) -> PooledCorePlugin[JointType, MetaDataType]: ...
+
+
+@overload
+def create_core_plugin[
+    JointType: Joint, MetaDataType: Any
+](
+    plug: CorePlug[Callable[[], Awaitable[JointType]]],
+    host: CoreHost[JointType],
+    policy: Literal[PluginPolicy.POOLED_ASYNC],
+    meta: MetaDataType = None,
+) -> PooledAsyncCorePlugin[JointType, MetaDataType]: ...
+
+
+@overload
+def create_core_plugin[
+    JointType: Joint, MetaDataType: Any
+](
+    plug: CorePlug[Callable[[], JointType]],
+    host: CoreHost[JointType],
+    policy: Literal[PluginPolicy.CACHED],
+    meta: MetaDataType = None,
+) -> CachedCorePlugin[JointType, MetaDataType]: ...
+
+
+@overload
+def create_core_plugin[
+    JointType: Joint, MetaDataType: Any
+](
+    plug: CorePlug[Callable[[], Awaitable[JointType]]],
+    host: CoreHost[JointType],
+    policy: Literal[PluginPolicy.CACHED_ASYNC],
+    meta: MetaDataType = None,
+) -> CachedAsyncCorePlugin[JointType, MetaDataType]: ...
+
+
 def create_core_plugin[
     JointType: Joint,
     MetaDataType: Any,
@@ -250,6 +1024,15 @@ def create_core_plugin[
         PluginPolicy.FACTORY,
         PluginPolicy.LAZY_ASYNC,
         PluginPolicy.FACTORY_ASYNC,
+        PluginPolicy.SCOPED,
+        PluginPolicy.SCOPED_ASYNC,
+        PluginPolicy.THREAD_LOCAL,
+        PluginPolicy.TASK_LOCAL,
+        PluginPolicy.TASK_LOCAL_ASYNC,
+        PluginPolicy.POOLED,
+        PluginPolicy.POOLED_ASYNC,
+        PluginPolicy.CACHED,
+        PluginPolicy.CACHED_ASYNC,
     ],
     meta: MetaDataType = None,
 ) -> (
@@ -258,6 +1041,15 @@ def create_core_plugin[
     | FactoryCorePlugin[JointType, MetaDataType]
     | LazyAsyncCorePlugin[JointType, MetaDataType]
     | FactoryAsyncCorePlugin[JointType, MetaDataType]
+    | ScopedCorePlugin[JointType, MetaDataType]
+    | ScopedAsyncCorePlugin[JointType, MetaDataType]
+    | ThreadLocalCorePlugin[JointType, MetaDataType]
+    | TaskLocalCorePlugin[JointType, MetaDataType]
+    | TaskLocalAsyncCorePlugin[JointType, MetaDataType]
+    | PooledCorePlugin[JointType, MetaDataType]
+    | PooledAsyncCorePlugin[JointType, MetaDataType]
+    | CachedCorePlugin[JointType, MetaDataType]
+    | CachedAsyncCorePlugin[JointType, MetaDataType]
 ):
     match policy:
         case PluginPolicy.DIRECT:
@@ -296,6 +1088,69 @@ def create_core_plugin[
                 _metadata=meta,
                 _policy=policy,
             )
+        case PluginPolicy.SCOPED:
+            return ScopedCorePlugin(
+                _plug=cast(CorePlug[Callable[[], JointType]], plug),
+                _host=host,
+                _metadata=meta,
+                _policy=policy,
+            )
+        case PluginPolicy.SCOPED_ASYNC:
+            return ScopedAsyncCorePlugin(
+                _plug=cast(CorePlug[Callable[[], Awaitable[JointType]]], plug),
+                _host=host,
+                _metadata=meta,
+                _policy=policy,
+            )
+        case PluginPolicy.THREAD_LOCAL:
+            return ThreadLocalCorePlugin(
+                _plug=cast(CorePlug[Callable[[], JointType]], plug),
+                _host=host,
+                _metadata=meta,
+                _policy=policy,
+            )
+        case PluginPolicy.TASK_LOCAL:
+            return TaskLocalCorePlugin(
+                _plug=cast(CorePlug[Callable[[], JointType]], plug),
+                _host=host,
+                _metadata=meta,
+                _policy=policy,
+            )
+        case PluginPolicy.TASK_LOCAL_ASYNC:
+            return TaskLocalAsyncCorePlugin(
+                _plug=cast(CorePlug[Callable[[], Awaitable[JointType]]], plug),
+                _host=host,
+                _metadata=meta,
+                _policy=policy,
+            )
+        case PluginPolicy.POOLED:
+            return PooledCorePlugin(
+                _plug=cast(CorePlug[Callable[[], JointType]], plug),
+                _host=host,
+                _metadata=meta,
+                _policy=policy,
+            )
+        case PluginPolicy.POOLED_ASYNC:
+            return PooledAsyncCorePlugin(
+                _plug=cast(CorePlug[Callable[[], Awaitable[JointType]]], plug),
+                _host=host,
+                _metadata=meta,
+                _policy=policy,
+            )
+        case PluginPolicy.CACHED:
+            return CachedCorePlugin(
+                _plug=cast(CorePlug[Callable[[], JointType]], plug),
+                _host=host,
+                _metadata=meta,
+                _policy=policy,
+            )
+        case PluginPolicy.CACHED_ASYNC:
+            return CachedAsyncCorePlugin(
+                _plug=cast(CorePlug[Callable[[], Awaitable[JointType]]], plug),
+                _host=host,
+                _metadata=meta,
+                _policy=policy,
+            )
 
         case _:
             raise RuntimeError(f"Unsupported plugin policy: {policy}")
@@ -0,0 +1,433 @@
+import asyncio
+from collections import deque
+from contextvars import ContextVar, Token
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.lifecycle import AsyncTeardown, Teardown
+from plug_in.core.scope import get_current_scope
+from plug_in.exc import PoolTimeoutError
+
+# Plugins which values must be released when managed call finishes
+LEASED_POLICIES = frozenset({PluginPolicy.POOLED, PluginPolicy.POOLED_ASYNC})
+
+type Release = Callable[[], Awaitable[None] | None]
+
+_lease: ContextVar[list[Release] | None] = ContextVar("plug_in_lease", default=None)
+
+
+def open_lease() -> Token[list[Release] | None]:
+    """
+    Start collecting releases of values checked out by pooled plugins, e.g. for
+    the duration of a managed call. Finish with [.close_lease][] or
+    [.aclose_lease][].
+    """
+    return _lease.set([])
+
+
+def close_lease(token: Token[list[Release] | None]) -> None:
+    """
+    Stop collecting releases and release collected values, in reverse order.
+    """
+    releases = _lease.get()
+    _lease.reset(token)
+    if releases:
+        for release in reversed(releases):
+            release()
+
+
+async def aclose_lease(token: Token[list[Release] | None]) -> None:
+    """
+    Async version of [.close_lease][], awaits async releases.
+    """
+    releases = _lease.get()
+    _lease.reset(token)
+    if releases:
+        for release in reversed(releases):
+            result = release()
+            if inspect.isawaitable(result):
+                await result
+
+
+def release_target(is_async: bool) -> Callable[[Release], None]:
+    """
+    Return function registering a release: in the current lease, or in the
+    active scope when there is no lease.
+
+    Raises:
+        [plug_in.exc.MissingScopeError][]: When there is neither lease nor
+            active scope.
+    """
+    releases = _lease.get()
+    if releases is not None:
+        return releases.append
+
+    scope = get_current_scope()
+    return scope.push_async_teardown if is_async else scope.push_teardown
+
+
+class PoolEntry:
+    """
+    Pooled value with its teardown.
+    """
+
+    __slots__ = ("value", "teardown", "idle_since", "epoch")
+
+    def __init__(self, value: Any, teardown: Any, epoch: int) -> None:
+        self.value = value
+        self.teardown = teardown
+        self.idle_since = 0.0
+        self.epoch = epoch
+
+
+class _PoolState:
+    """
+    Bookkeeping shared by sync and async pools. Callers hold pool lock.
+    Idle entries are kept oldest first, and the newest is reused first.
+    """
+
+    __slots__ = ("max_size", "max_idle", "idle", "size", "epoch")
+
+    def __init__(self, max_size: int, max_idle: float | None) -> None:
+        if max_size < 1:
+            raise ValueError(f"Pool size must be positive, got {max_size}")
+
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.idle: list[PoolEntry] = []
+        self.size = 0
+        self.epoch = 0
+
+    def take(self, now: float) -> tuple[PoolEntry | None, bool, list[PoolEntry]]:
+        """
+        Returns idle entry (if any), whether a new entry can be created (its
+        place is reserved then), and evicted entries.
+        """
+        expired = self.pop_expired(now)
+        if self.idle:
+            return self.idle.pop(), False, expired
+
+        if self.size < self.max_size:
+            self.size += 1
+            return None, True, expired
+
+        return None, False, expired
+
+    def put(self, entry: PoolEntry, now: float) -> tuple[list[PoolEntry], int]:
+        """
+        Return entry to the pool. Returns entries to destroy (evicted ones, and
+        the returned one when pool was closed after it was taken), and number
+        of places that can be taken by waiters: the returned entry and every
+        evicted one.
+        """
+        expired = self.pop_expired(now)
+        freed = len(expired) + 1
+        if entry.epoch != self.epoch:
+            self.size -= 1
+            expired.append(entry)
+        else:
+            entry.idle_since = now
+            self.idle.append(entry)
+
+        return expired, freed
+
+    def pop_expired(self, now: float) -> list[PoolEntry]:
+        if self.max_idle is None or not self.idle:
+            return []
+
+        count = 0
+        for entry in self.idle:
+            if now - entry.idle_since < self.max_idle:
+                break
+            count += 1
+
+        expired = self.idle[:count]
+        del self.idle[:count]
+        self.size -= count
+        return expired
+
+    def drain(self) -> list[PoolEntry]:
+        """
+        Pop all idle entries. Entries taken now are destroyed on return.
+        """
+        drained, self.idle = self.idle, []
+        self.size -= len(drained)
+        self.epoch += 1
+        return drained
+
+    def forget(self) -> None:
+        """
+        Free place reserved by [._PoolState.take][] for entry that failed.
+        """
+        self.size -= 1
+
+
+def _destroy(entries: list[PoolEntry]) -> list[Exception]:
+    errors: list[Exception] = []
+    for entry in entries:
+        if entry.teardown is not None:
+            try:
+                entry.teardown()
+            except Exception as e:
+                errors.append(e)
+
+    return errors
+
+
+async def _adestroy(entries: list[PoolEntry]) -> list[Exception]:
+    errors: list[Exception] = []
+    for entry in entries:
+        if entry.teardown is not None:
+            try:
+                await entry.teardown()
+            except Exception as e:
+                errors.append(e)
+
+    return errors
+
+
+def _log_errors(errors: list[Exception]) -> None:
+    for error in errors:
+        logging.warning("Teardown of pooled value failed", exc_info=error)
+
+
+def _timeout_error(max_size: int, timeout: float | None) -> PoolTimeoutError:
+    return PoolTimeoutError(
+        f"No pooled value became free within {timeout}s (pool size {max_size})"
+    )
+
+
+class ObjectPool:
+    """
+    Bounded, thread-safe pool of values created by a sync factory.
+
+    Args:
+        create: Returns new value with its teardown (or `None`).
+        max_size: Maximum number of values, both idle and taken.
+        max_idle: Seconds after which idle value is torn down. `None` keeps
+            idle values until [.ObjectPool.close][].
+        timeout: Seconds to wait for a free value. `None` waits forever.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], tuple[Any, Teardown | None]],
+        max_size: int,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self._create = create
+        self._state = _PoolState(max_size, max_idle)
+        self._timeout = timeout
+        self._cond = threading.Condition()
+
+    def acquire(self) -> PoolEntry:
+        """
+        Take idle value, create new one if pool is not full, or wait for one to
+        be released.
+
+        Raises:
+            [plug_in.exc.PoolTimeoutError][]: When no value became free in time.
+        """
+        expired: list[PoolEntry] = []
+        try:
+            entry, epoch = self._take(expired)
+        finally:
+            _log_errors(_destroy(expired))
+
+        if entry is not None:
+            return entry
+
+        try:
+            value, teardown = self._create()
+        except BaseException:
+            with self._cond:
+                self._state.forget()
+                self._cond.notify()
+            raise
+
+        return PoolEntry(value, teardown, epoch)
+
+    def _take(self, expired: list[PoolEntry]) -> tuple[PoolEntry | None, int]:
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout
+        with self._cond:
+            while True:
+                entry, create, evicted = self._state.take(time.monotonic())
+                expired.extend(evicted)
+                if entry is not None or create:
+                    return entry, self._state.epoch
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise _timeout_error(self._state.max_size, self._timeout)
+
+                self._cond.wait(remaining)
+
+    def release(self, entry: PoolEntry) -> None:
+        """
+        Return taken value to the pool. Never raises, teardown errors of
+        discarded values are logged.
+        """
+        with self._cond:
+            discarded, freed = self._state.put(entry, time.monotonic())
+            self._cond.notify(freed)
+
+        _log_errors(_destroy(discarded))
+
+    def close(self) -> list[Exception]:
+        """
+        Tear down idle values. Values taken now are torn down when released.
+        Pool stays usable.
+
+        Returns:
+            Errors raised by teardowns.
+        """
+        with self._cond:
+            drained = self._state.drain()
+            self._cond.notify_all()
+
+        return _destroy(drained)
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AsyncObjectPool:
+    """
+    Bounded pool of values created by an async factory. It is not bound to any
+    event loop, waiters from different loops are woken thread-safely.
+
+    Args:
+        create: Returns awaitable of new value with its async teardown
+            (or `None`).
+        max_size: See [.ObjectPool][].
+        max_idle: See [.ObjectPool][].
+        timeout: See [.ObjectPool][].
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], Awaitable[tuple[Any, AsyncTeardown | None]]],
+        max_size: int,
+        max_idle: float | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self._create = create
+        self._state = _PoolState(max_size, max_idle)
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = (
+            deque()
+        )
+
+    async def acquire(self) -> PoolEntry:
+        """
+        Raises:
+            [plug_in.exc.PoolTimeoutError][]: When no value became free in time.
+        """
+        expired: list[PoolEntry] = []
+        try:
+            entry, epoch = await self._take(expired)
+        finally:
+            _log_errors(await _adestroy(expired))
+
+        if entry is not None:
+            return entry
+
+        try:
+            value, teardown = await self._create()
+        except BaseException:
+            with self._lock:
+                self._state.forget()
+            self._wake_one()
+            raise
+
+        return PoolEntry(value, teardown, epoch)
+
+    async def _take(self, expired: list[PoolEntry]) -> tuple[PoolEntry | None, int]:
+        loop = asyncio.get_running_loop()
+        deadline = None if self._timeout is None else loop.time() + self._timeout
+
+        while True:
+            with self._lock:
+                entry, create, evicted = self._state.take(time.monotonic())
+                expired.extend(evicted)
+                if entry is not None or create:
+                    return entry, self._state.epoch
+
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._waiters.append((loop, waiter))
+
+            remaining = None if deadline is None else deadline - loop.time()
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except BaseException as e:
+                self._abandon(loop, waiter)
+                if isinstance(e, TimeoutError):
+                    raise _timeout_error(self._state.max_size, self._timeout) from None
+                raise
+
+    def _abandon(
+        self, loop: asyncio.AbstractEventLoop, waiter: asyncio.Future[None]
+    ) -> None:
+        with self._lock:
+            try:
+                self._waiters.remove((loop, waiter))
+            except ValueError:
+                # Already woken, pass the wake up on
+                woken = True
+            else:
+                woken = False
+
+        if woken:
+            self._wake_one()
+
+    def _wake_one(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                if not waiter.done():
+                    break
+            else:
+                return
+
+        try:
+            loop.call_soon_threadsafe(_wake, waiter)
+        except RuntimeError:
+            # Loop of the waiter is closed
+            self._wake_one()
+
+    async def release(self, entry: PoolEntry) -> None:
+        """
+        Return taken value to the pool. Never raises, teardown errors of
+        discarded values are logged.
+        """
+        with self._lock:
+            discarded, freed = self._state.put(entry, time.monotonic())
+
+        for _ in range(freed):
+            self._wake_one()
+        _log_errors(await _adestroy(discarded))
+
+    async def aclose(self) -> list[Exception]:
+        """
+        Tear down idle values. Values taken now are torn down when released.
+        Pool stays usable.
+
+        Returns:
+            Errors raised by teardowns.
+        """
+        with self._lock:
+            drained = self._state.drain()
+
+        # Places of drained values are free now
+        for _ in drained:
+            self._wake_one()
+
+        return await _adestroy(drained)
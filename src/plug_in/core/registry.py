@@ -1,12 +1,30 @@
+import asyncio
+import itertools
 import threading
-from typing import Any, Awaitable, Iterable
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Mapping, Self, overload
 
-from plug_in.exc import AmbiguousHostError, MissingPluginError
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.graph import DependencyGraph, build_dependency_graph
+from plug_in.core.host import intern_host
+from plug_in.core.lifecycle import raise_teardown_errors
+from plug_in.core.deadline import await_bounded
+from plug_in.core.observe import observed_provider
+from plug_in.core.warmup import WarmUpReport, is_warmable, warm_up_plugins
+from plug_in.exc import (
+    AmbiguousHostError,
+    MissingPluginError,
+    SyncPluginExpected,
+    WarmUpError,
+)
+from plug_in.tools.concurrency import gather_or_cancel
 from plug_in.types.proto.core_host import CoreHostProtocol
 from plug_in.types.proto.core_plugin import (
+    AsyncClosingCorePluginProtocol,
     AsyncCorePluginProtocol,
     BindingCorePluginProtocol,
+    ClosingCorePluginProtocol,
     CorePluginProtocol,
+    OffloadingCorePluginProtocol,
     ProvidingCorePluginProtocol,
 )
 from plug_in.types.proto.core_registry import (
@@ -14,6 +32,12 @@ from plug_in.types.proto.core_registry import (
     CoreRegistryProtocol,
 )
 from plug_in.types.proto.joint import Joint
+from plug_in.types.proto.observer import ObserverProtocol
+
+
+# Registry generations are unique in the process. `next` on `itertools.count`
+# is atomic.
+_generations = itertools.count(1)
 
 
 # TODO: This class has potential to utilize TypeVarTuple, but only if
@@ -24,6 +48,21 @@ class CoreRegistry(CoreRegistryProtocol):
     """
     Holds collection of plugins. Registry object is immutable.
 
+    Every registry gets a new [.CoreRegistry.generation][] id. Routes record
+    generation their plugins were looked up in, and look them up again when it
+    changes.
+
+    Registry can overlay a parent registry (see [.CoreRegistry.overlay][]). It
+    then holds only plugins overriding or extending the parent ones, and
+    looks up remaining plugins in the parent.
+
+    Args:
+        plugins: Plugins of this registry.
+        parent: Registry overlaid by this one. Prefer [.CoreRegistry.overlay][].
+        observer: Receives provider events of [.CoreRegistry.sync_resolve][]
+            and [.CoreRegistry.async_resolve][] calls (see
+            [plug_in.core.observe.Observer][]). Overlays inherit it.
+
     Raises:
         [.AmbiguousHostError][]: When host collision occurs.
     """
@@ -33,43 +72,47 @@ class CoreRegistry(CoreRegistryProtocol):
         plugins: Iterable[CorePluginProtocol[Any, Any]],
         #  TODO: Consider adding verify_joints param
         #  verify_joints: bool = True,
+        parent: "CoreRegistry | None" = None,
+        observer: ObserverProtocol | None = None,
     ) -> None:
         self._original_plugins = plugins
+        self._parent = parent
+        self._observer = observer
+        self._generation = next(_generations)
+        self._flatten_lock = threading.Lock()
 
         # TODO: Verify if this is indeed needed for multithreading.
         #   Asyncio tasks are safe as this never will be an async method
         with threading.Lock():
-            self._hash_to_sync_plugin_map: dict[
-                int,
+            self._host_to_sync_plugin_map: dict[
+                CoreHostProtocol[Any],
                 BindingCorePluginProtocol[Any, Any]
                 | ProvidingCorePluginProtocol[Any, Any],
             ] = {}
 
-            self._hash_to_async_plugin_map: dict[
-                int,
+            self._host_to_async_plugin_map: dict[
+                CoreHostProtocol[Any],
                 AsyncCorePluginProtocol[Any, Any],
             ] = {}
 
-            for plugin in plugins:
-                host_hash = hash(plugin.host)
+            # Both sync and async plugins, single lookup for `plugin` calls
+            self._host_to_plugin_map: dict[
+                CoreHostProtocol[Any], CorePluginProtocol[Any, Any]
+            ] = {}
 
-                if host_hash in self._hash_to_sync_plugin_map:
-                    raise AmbiguousHostError(
-                        f"Host {plugin.host} of plugin {plugin} is ambiguous in "
-                        f"context of this registry. There is already a plugin "
-                        f"registered on that host: "
-                        f"{self._hash_to_sync_plugin_map[host_hash]} "
-                        "Try using mark parameter ["
-                        f"{plugin.host.__class__.__name__}(..., mark='some_mark') ]"
-                        "to remove ambiguity, or register this plugin with sync metadata."
-                    )
+            # Registration order
+            self._plugins: list[CorePluginProtocol[Any, Any]] = []
+
+            for plugin in plugins:
+                # Interned, so lookups with interned hosts end at identity check
+                host = intern_host(plugin.host)
 
-                if host_hash in self._hash_to_async_plugin_map:
+                if host in self._host_to_plugin_map:
                     raise AmbiguousHostError(
                         f"Host {plugin.host} of plugin {plugin} is ambiguous in "
                         f"context of this registry. There is already a plugin "
                         f"registered on that host: "
-                        f"{self._hash_to_async_plugin_map[host_hash]} "
+                        f"{self._host_to_plugin_map[host]} "
                         "Try using mark parameter ["
                         f"{plugin.host.__class__.__name__}(..., mark='some_mark') ]"
                         "to remove ambiguity, or register this plugin with sync metadata."
@@ -79,23 +122,79 @@ class CoreRegistry(CoreRegistryProtocol):
                     sync_plugin = plugin.assert_sync()
                 except AssertionError:
                     try:
-                        async_plugin = plugin.assert_sync()
+                        async_plugin = plugin.assert_async()
                     except AssertionError as e:
                         raise RuntimeError(
                             "This should never happen, report an issue"
                         ) from e
                     else:
-                        self._hash_to_async_plugin_map[host_hash] = async_plugin
+                        self._host_to_async_plugin_map[host] = async_plugin
                 else:
-                    self._hash_to_sync_plugin_map[host_hash] = sync_plugin
+                    self._host_to_sync_plugin_map[host] = sync_plugin
+
+                self._host_to_plugin_map[host] = plugin
+                self._plugins.append(plugin)
+
+        # Flattened lookup of overlays is built on first use
+        self._lookup: (
+            dict[CoreHostProtocol[Any], CorePluginProtocol[Any, Any]] | None
+        ) = (self._host_to_plugin_map if parent is None else None)
+        self._ordered_plugins: list[CorePluginProtocol[Any, Any]] | None = (
+            self._plugins if parent is None else None
+        )
 
         self._hash_val: int = hash(
             (
-                *tuple(self._hash_to_sync_plugin_map.keys()),
-                *tuple(self._hash_to_async_plugin_map.keys()),
+                hash(parent) if parent is not None else None,
+                *self._host_to_plugin_map,
             )
         )
 
+    @property
+    def generation(self) -> int:
+        """
+        Process-unique id of this registry. Overlays get their own ids.
+        """
+        return self._generation
+
+    @property
+    def parent(self) -> "CoreRegistry | None":
+        return self._parent
+
+    @property
+    def observer(self) -> ObserverProtocol | None:
+        return self._observer
+
+    def overlay(self, plugins: Iterable[CorePluginProtocol[Any, Any]]) -> Self:
+        """
+        Create a child registry, where given plugins override plugins of this
+        registry on the same hosts, or add new hosts. Remaining plugins are
+        shared with this registry, including their provided values. Only given
+        plugins are validated, and this registry is left intact.
+
+        Raises:
+            [.AmbiguousHostError][]: When host collision occurs among given
+                plugins.
+        """
+        return self.__class__(plugins, parent=self, observer=self._observer)
+
+    def _get_lookup(
+        self,
+    ) -> dict[CoreHostProtocol[Any], CorePluginProtocol[Any, Any]]:
+        lookup = self._lookup
+        if lookup is None:
+            assert self._parent is not None
+            with self._flatten_lock:
+                lookup = self._lookup
+                if lookup is None:
+                    lookup = {
+                        **self._parent._get_lookup(),
+                        **self._host_to_plugin_map,
+                    }
+                    self._lookup = lookup
+
+        return lookup
+
     def plugin[
         JointType: Joint
     ](self, host: CoreHostProtocol[JointType]) -> CorePluginProtocol[Any, Any]:
@@ -104,15 +203,14 @@ class CoreRegistry(CoreRegistryProtocol):
             [plug_in.exc.MissingPluginError][]
 
         """
+        lookup = self._lookup
+        if lookup is None:
+            lookup = self._get_lookup()
+
         try:
-            return self._hash_to_sync_plugin_map[hash(host)]
+            return lookup[host]
         except KeyError:
-            try:
-                return self._hash_to_async_plugin_map[hash(host)]
-            except KeyError:
-                raise MissingPluginError(
-                    f"Missing plugin for {host} in registry {self}"
-                )
+            raise MissingPluginError(f"Missing plugin for {host} in registry {self}")
 
     def resolve[
         JointType: Joint
@@ -132,23 +230,30 @@ class CoreRegistry(CoreRegistryProtocol):
     ](self, host: CoreHostProtocol[JointType]) -> JointType:
         """
         Resolve host into provided value. This will always resolve into
-        provided value, both for sync and async plugins.
+        provided value, both for sync and async plugins. Awaiting is bounded by
+        the current deadline (see [plug_in.core.deadline.deadline][]).
 
         Raises:
             [plug_in.exc.MissingPluginError][] if plugin does not exist
+            [plug_in.exc.ProviderTimeoutError][] if deadline passed
         """
-
+        plugin = self.plugin(host=host)
+        provide: Callable[[], Awaitable[Any]]
         try:
-            sync_plugin = self.plugin(host=host).assert_sync()
+            sync_plugin = plugin.assert_sync()
         except AssertionError:
             try:
-                async_plugin = self.plugin(host=host).assert_async()
+                provide = plugin.assert_async().provide
             except AssertionError as e:
                 raise RuntimeError("This should never happen, report an issue") from e
-            else:
-                return await async_plugin.provide()
         else:
-            return sync_plugin.provide()
+            if not isinstance(sync_plugin, OffloadingCorePluginProtocol):
+                return self._provide_sync(sync_plugin)
+            provide = sync_plugin.offload
+
+        if self._observer is not None:
+            provide = observed_provider(self._observer, plugin, provide, True)
+        return await await_bounded(provide(), None, host)
 
     def sync_resolve[
         JointType: Joint
@@ -168,7 +273,365 @@ class CoreRegistry(CoreRegistryProtocol):
                 f"Missing plugin for {host} in registry {self}"
             ) from e
         else:
-            return sync_plugin.provide()
+            return self._provide_sync(sync_plugin)
+
+    def _provide_sync(self, plugin: CorePluginProtocol[Any, Any]) -> Any:
+        if self._observer is None:
+            return plugin.provide()
+
+        return observed_provider(self._observer, plugin, plugin.provide, False)()
+
+    def _plugins_of(
+        self, hosts: Iterable[CoreHostProtocol[Any]]
+    ) -> list[CorePluginProtocol[Any, Any]]:
+        """
+        Look up plugins of all hosts in one pass.
+
+        Raises:
+            [plug_in.exc.MissingPluginError][]
+        """
+        lookup = self._lookup
+        if lookup is None:
+            lookup = self._get_lookup()
+
+        try:
+            return [lookup[host] for host in hosts]
+        except KeyError as e:
+            raise MissingPluginError(
+                f"Missing plugin for {e.args[0]} in registry {self}"
+            ) from None
+
+    @overload
+    def resolve_many[
+        K: Hashable
+    ](self, hosts: Mapping[K, CoreHostProtocol[Any]]) -> dict[K, Any]: ...
+
+    @overload
+    def resolve_many(
+        self, hosts: Iterable[CoreHostProtocol[Any]]
+    ) -> tuple[Any, ...]: ...
+
+    def resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Resolve many hosts at once, like [.CoreRegistry.resolve][] does for a
+        single one (async plugins give awaitables). All plugins are looked up
+        before any of them provides a value.
+
+        Args:
+            hosts: Hosts to resolve. For a mapping, dict with the same keys is
+                returned, otherwise tuple of values in order of hosts.
+
+        Raises:
+            [plug_in.exc.MissingPluginError][]: If plugin of any host does not
+                exist. No plugin is called then.
+        """
+        if isinstance(hosts, Mapping):
+            plugins = self._plugins_of(hosts.values())
+            return {key: plugin.provide() for key, plugin in zip(hosts, plugins)}
+
+        return tuple(plugin.provide() for plugin in self._plugins_of(hosts))
+
+    @overload
+    async def async_resolve_many[
+        K: Hashable
+    ](self, hosts: Mapping[K, CoreHostProtocol[Any]]) -> dict[K, Any]: ...
+
+    @overload
+    async def async_resolve_many(
+        self, hosts: Iterable[CoreHostProtocol[Any]]
+    ) -> tuple[Any, ...]: ...
+
+    async def async_resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Resolve many hosts at once into provided values, both for sync and async
+        plugins. Async providers are awaited concurrently. When any of them
+        fails, remaining ones are cancelled and the error is raised.
+
+        Args:
+            hosts: See [.CoreRegistry.resolve_many][].
+
+        Raises:
+            [plug_in.exc.MissingPluginError][]: If plugin of any host does not
+                exist. No plugin is called then.
+        """
+        if isinstance(hosts, Mapping):
+            values = await _provide_all(self._plugins_of(hosts.values()))
+            return dict(zip(hosts, values))
+
+        return tuple(await _provide_all(self._plugins_of(hosts)))
+
+    def _all_plugins(self) -> list[CorePluginProtocol[Any, Any]]:
+        """
+        All plugins visible in this registry, in registration order. Overriding
+        plugins take places of overridden ones.
+        """
+        ordered = self._ordered_plugins
+        if ordered is None:
+            assert self._parent is not None
+            own = self._host_to_plugin_map
+            ordered = [
+                own.get(plugin.host, plugin) for plugin in self._parent._all_plugins()
+            ]
+            inherited = self._parent._get_lookup()
+            ordered.extend(
+                plugin for plugin in self._plugins if plugin.host not in inherited
+            )
+            self._ordered_plugins = ordered
+
+        return list(ordered)
+
+    def dependency_graph(
+        self,
+        route_dependencies: Callable[
+            [Callable[..., Any]], Iterable[CoreHostProtocol[Any]]
+        ],
+    ) -> DependencyGraph:
+        """
+        Build graph of dependencies between plugins of this registry.
+
+        Args:
+            route_dependencies: Returns hosts required by a provider, usually
+                [plug_in.ioc.router.Router.get_route_dependencies][] of the
+                router managing providers. Dependencies on hosts missing in
+                this registry are skipped.
+
+        Raises:
+            [plug_in.exc.DependencyCycleError][]: When providers depend on each
+                other in a cycle.
+        """
+        dependencies: dict[CoreHostProtocol[Any], list[CoreHostProtocol[Any]]] = {}
+
+        for plugin in self._all_plugins():
+            dependencies[plugin.host] = []
+
+            # Direct plugins hold values, not providers
+            if plugin.policy == PluginPolicy.DIRECT:
+                continue
+
+            for host in route_dependencies(plugin.plug.provider):
+                try:
+                    # Use host instance registered in this registry
+                    dependencies[plugin.host].append(self.plugin(host).host)
+                except MissingPluginError:
+                    continue
+
+        return build_dependency_graph(dependencies)
+
+    def _warm_up_candidates(
+        self,
+        hosts: Iterable[CoreHostProtocol[Any]] | None,
+        metadata_filter: Callable[[Any], bool] | None,
+    ) -> list[CorePluginProtocol[Any, Any]]:
+        if hosts is None:
+            plugins = self._all_plugins()
+        else:
+            plugins = [self.plugin(host) for host in hosts]
+
+        return [
+            plugin
+            for plugin in plugins
+            if is_warmable(plugin)
+            and (metadata_filter is None or metadata_filter(plugin.metadata))
+        ]
+
+    async def async_warm_up(
+        self,
+        hosts: Iterable[CoreHostProtocol[Any]] | None = None,
+        metadata_filter: Callable[[Any], bool] | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        raise_on_error: bool = True,
+        graph: DependencyGraph | None = None,
+    ) -> WarmUpReport:
+        """
+        Initialize lazy plugins (`LAZY` and `LAZY_ASYNC` policies) ahead of
+        time, so first resolution does not pay for it. Sync providers are run
+        on a thread pool, async providers are awaited concurrently.
+
+        Args:
+            hosts: Warm up only plugins for given hosts. All lazy plugins when
+                `None`. Hosts of non-lazy plugins are skipped.
+            metadata_filter: Warm up only plugins for which this predicate,
+                called with plugin metadata, returns `True`.
+            max_concurrency: Maximum number of concurrent initializations.
+            timeout: Per-plugin timeout in seconds.
+            raise_on_error: Raise when any plugin fails to initialize. When
+                `False`, errors are only reported.
+            graph: Dependency graph (see [.CoreRegistry.dependency_graph][]).
+                When given, plugins wait only for their own prerequisites,
+                and independent ones are initialized concurrently.
+
+        Returns:
+            [plug_in.core.warmup.WarmUpReport][] with initialization time of
+            each plugin.
+
+        Raises:
+            [plug_in.exc.MissingPluginError][]: When one of `hosts` is missing.
+            [plug_in.exc.WarmUpError][]: When any plugin failed and
+                `raise_on_error` is set.
+        """
+        report = await warm_up_plugins(
+            self._warm_up_candidates(hosts, metadata_filter),
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            graph=graph,
+        )
+        self._check_warm_up(report, raise_on_error)
+        return report
+
+    @staticmethod
+    def _check_warm_up(report: WarmUpReport, raise_on_error: bool) -> None:
+        if raise_on_error and report.failed:
+            raise WarmUpError(
+                f"{len(report.failed)} plugin(s) failed to warm up: "
+                + ", ".join(
+                    f"{entry.host} ({entry.error!r})" for entry in report.failed
+                ),
+                report=report,
+            ) from report.failed[0].error
+
+    def warm_up(
+        self,
+        hosts: Iterable[CoreHostProtocol[Any]] | None = None,
+        metadata_filter: Callable[[Any], bool] | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        raise_on_error: bool = True,
+        graph: DependencyGraph | None = None,
+    ) -> WarmUpReport:
+        """
+        Sync version of [.CoreRegistry.async_warm_up][], which initializes
+        only sync lazy plugins (`LAZY` policy) on a thread pool. Values of
+        async plugins would be bound to an event loop that is closed when
+        warm-up returns, so they are skipped. Warm them up with
+        [.CoreRegistry.async_warm_up][] from the loop that serves them. Runs
+        its own event loop, so it cannot be called from a running loop.
+
+        Raises:
+            [plug_in.exc.MissingPluginError][]: When one of `hosts` is missing.
+            [plug_in.exc.SyncPluginExpected][]: When one of `hosts` has an
+                async lazy plugin.
+            [plug_in.exc.WarmUpError][]: When any plugin failed and
+                `raise_on_error` is set.
+        """
+        candidates = self._warm_up_candidates(hosts, metadata_filter)
+        sync_candidates: list[CorePluginProtocol[Any, Any]] = []
+        for plugin in candidates:
+            try:
+                sync_candidates.append(plugin.assert_sync())
+            except AssertionError as e:
+                if hosts is None:
+                    continue
+                raise SyncPluginExpected(
+                    f"Plugin for {plugin.host} is async and cannot be warmed up "
+                    "synchronously. Use `async_warm_up` from the event loop that "
+                    "will resolve it."
+                ) from e
+
+        # Sync providers run on worker threads, the loop only schedules them
+        report = asyncio.run(
+            warm_up_plugins(
+                sync_candidates,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+                graph=graph,
+            )
+        )
+        self._check_warm_up(report, raise_on_error)
+        return report
+
+    def _closing_layers(
+        self, graph: DependencyGraph | None
+    ) -> list[list[CorePluginProtocol[Any, Any]]]:
+        # Overlays close only their own plugins, the rest belongs to parent
+        if graph is None:
+            # No knowledge of dependencies, one by one in reverse registration
+            # order
+            return [[plugin] for plugin in reversed(self._plugins)]
+
+        own = self._host_to_plugin_map
+        return [
+            [own[host] for host in layer if host in own] for layer in graph.layers[::-1]
+        ]
+
+    def close(self, graph: DependencyGraph | None = None) -> None:
+        """
+        Tear down resources of synchronous plugins (e.g. code after `yield` of
+        generator providers of lazy plugins). Async plugins are not closed, use
+        [.CoreRegistry.aclose][] for them. Overlays close only their own
+        plugins, plugins shared with parent are left to the parent.
+
+        Args:
+            graph: Dependency graph (see [.CoreRegistry.dependency_graph][]).
+                Dependents are closed before their dependencies. Without graph,
+                plugins are closed in reverse registration order.
+
+        Raises:
+            Exception: Error of a failed teardown, raised after all other
+                plugins were closed. Multiple errors are raised as
+                `ExceptionGroup`.
+        """
+        errors: list[Exception] = []
+
+        for layer in self._closing_layers(graph):
+            for plugin in layer:
+                if isinstance(plugin, ClosingCorePluginProtocol):
+                    try:
+                        plugin.close()
+                    except Exception as e:
+                        errors.append(e)
+
+        raise_teardown_errors(errors, "Registry teardown failed")
+
+    async def aclose(self, graph: DependencyGraph | None = None) -> None:
+        """
+        Tear down resources of all plugins (e.g. code after `yield` of
+        generator providers of lazy plugins). Overlays close only their own
+        plugins, plugins shared with parent are left to the parent.
+
+        Args:
+            graph: Dependency graph (see [.CoreRegistry.dependency_graph][]).
+                Dependents are closed before their dependencies, and
+                independent async plugins are closed concurrently. Without
+                graph, plugins are closed one by one in reverse registration
+                order.
+
+        Raises:
+            Exception: Error of a failed teardown, raised after all other
+                plugins were closed. Multiple errors are raised as
+                `ExceptionGroup`.
+        """
+        errors: list[Exception] = []
+
+        for layer in self._closing_layers(graph):
+            closing: list[Awaitable[None]] = []
+
+            for plugin in layer:
+                if isinstance(plugin, AsyncClosingCorePluginProtocol):
+                    closing.append(plugin.aclose())
+                elif isinstance(plugin, ClosingCorePluginProtocol):
+                    try:
+                        plugin.close()
+                    except Exception as e:
+                        errors.append(e)
+
+            for result in await asyncio.gather(*closing, return_exceptions=True):
+                if isinstance(result, Exception):
+                    errors.append(result)
+                elif isinstance(result, BaseException):
+                    raise result
+
+        raise_teardown_errors(errors, "Registry teardown failed")
 
     # Implemented it for trial. Do not know if it will be needed
     def __hash__(self) -> int:
@@ -178,6 +641,45 @@ class CoreRegistry(CoreRegistryProtocol):
         return f"{self.__class__.__name__}(\n\t{self._original_plugins}"
 
 
+async def _provide_all(plugins: list[CorePluginProtocol[Any, Any]]) -> list[Any]:
+    """
+    Provide values of sync plugins in order, then await async ones together.
+    Blocking sync plugins are offloaded and awaited with async ones.
+    """
+    values: list[Any] = [None] * len(plugins)
+    awaited: list[int] = []
+    providers: list[Callable[[], Awaitable[Any]]] = []
+
+    for idx, plugin in enumerate(plugins):
+        try:
+            sync_plugin = plugin.assert_sync()
+        except AssertionError:
+            awaited.append(idx)
+            providers.append(plugin.assert_async().provide)
+        else:
+            if isinstance(sync_plugin, OffloadingCorePluginProtocol):
+                awaited.append(idx)
+                providers.append(sync_plugin.offload)
+            else:
+                values[idx] = sync_plugin.provide()
+
+    if len(providers) == 1:
+        # No need for tasks
+        values[awaited[0]] = await await_bounded(
+            providers[0](), None, plugins[awaited[0]].host
+        )
+    elif providers:
+        provided = await await_bounded(
+            gather_or_cancel(providers),
+            None,
+            [plugins[idx].host for idx in awaited],
+        )
+        for idx, value in zip(awaited, provided):
+            values[idx] = value
+
+    return values
+
+
 class AsyncCoreRegistry(CoreRegistry, AsyncCoreRegistryProtocol):
 
     async def resolve[
@@ -191,3 +693,28 @@ class AsyncCoreRegistry(CoreRegistry, AsyncCoreRegistryProtocol):
 
         """
         return await self.async_resolve(host=host)
+
+    @overload
+    async def resolve_many[
+        K: Hashable
+    ](self, hosts: Mapping[K, CoreHostProtocol[Any]]) -> dict[K, Any]: ...
+
+    @overload
+    async def resolve_many(
+        self, hosts: Iterable[CoreHostProtocol[Any]]
+    ) -> tuple[Any, ...]: ...
+
+    async def resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Resolve many hosts into provided values, see
+        [.CoreRegistry.async_resolve_many][].
+
+        Raises:
+            [plug_in.exc.MissingPluginError][] if plugin of any host does not exist
+        """
+        return await self.async_resolve_many(hosts)
@@ -0,0 +1,184 @@
+from contextvars import ContextVar, Token
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Self
+
+from plug_in.core.lifecycle import raise_teardown_errors
+from plug_in.exc import (
+    AsyncPluginCannotBeAwaited,
+    MissingScopeError,
+    ScopeAlreadyActiveError,
+)
+
+
+class Scope:
+    """
+    Operation scope, e.g. a single HTTP request. Scoped plugins provide one value
+    per scope. Scope is bound to the current context (see [contextvars][]), so it
+    is visible for all managed callables invoked from the code under the scope,
+    including asyncio tasks created within it.
+
+    Use it as a context manager, both sync and async way:
+
+    ```python
+    with scope():
+        ...
+
+    async with scope():
+        ...
+    ```
+
+    Scope can be entered only once. Values are dropped when scope exits, after
+    teardowns of resources created within the scope (generator providers of
+    factory and scoped plugins) are run, in reverse order of creation. Async
+    teardowns require scope to be exited the async way.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[int, tuple[Any, Any]] = {}
+        self._teardowns: list[Callable[[], Any]] = []
+        # Reentrant, scoped providers may resolve other scoped plugins
+        self._lock = threading.RLock()
+        self._token: Token[Scope | None] | None = None
+
+    def get(self, owner: object) -> Any:
+        """
+        Return value stored for given owner (typically a plugin), or raise
+        `KeyError`.
+        """
+        return self._values[id(owner)][1]
+
+    def get_or_create(self, owner: object, factory: Callable[[], Any]) -> Any:
+        """
+        Return value stored for given owner (typically a plugin). If value is
+        missing, `factory` is called and its result is stored.
+        """
+        try:
+            return self._values[id(owner)][1]
+        except KeyError:
+            pass
+
+        with self._lock:
+            try:
+                return self._values[id(owner)][1]
+            except KeyError:
+                value = factory()
+                # Owner is kept alongside the value, so its id cannot be reused
+                self._values[id(owner)] = (owner, value)
+
+        return value
+
+    def set(self, owner: object, value: Any) -> None:
+        """
+        Store value for given owner.
+        """
+        self._values[id(owner)] = (owner, value)
+
+    def pop(self, owner: object) -> None:
+        """
+        Drop value stored for given owner if it exists.
+        """
+        self._values.pop(id(owner), None)
+
+    def push_teardown(self, callback: Callable[[], None]) -> None:
+        """
+        Register callback to be called when scope exits.
+        """
+        self._teardowns.append(callback)
+
+    def push_async_teardown(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Register callback to be called and awaited when scope exits.
+        """
+        self._teardowns.append(callback)
+
+    def _pop_teardowns(self) -> list[Callable[[], Any]]:
+        teardowns, self._teardowns = self._teardowns, []
+        return teardowns[::-1]
+
+    def _activate(self) -> None:
+        if self._token is not None:
+            raise ScopeAlreadyActiveError(f"Scope {self} is already active")
+
+        self._token = _current_scope.set(self)
+
+    def _deactivate(self) -> None:
+        assert self._token is not None
+        _current_scope.reset(self._token)
+        self._values.clear()
+
+    def __enter__(self) -> Self:
+        self._activate()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._deactivate()
+
+        errors: list[Exception] = []
+        for teardown in self._pop_teardowns():
+            try:
+                result = teardown()
+                if inspect.isawaitable(result):
+                    # Close coroutine, it cannot be awaited here
+                    getattr(result, "close", lambda: None)()
+                    raise AsyncPluginCannotBeAwaited(
+                        f"Async teardown {teardown} cannot run on sync scope exit. "
+                        "Use `async with scope(): ...` instead."
+                    )
+            except Exception as e:
+                errors.append(e)
+
+        raise_teardown_errors(errors, "Scope teardown failed")
+
+    async def __aenter__(self) -> Self:
+        self._activate()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._deactivate()
+
+        errors: list[Exception] = []
+        for teardown in self._pop_teardowns():
+            try:
+                result = teardown()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                errors.append(e)
+
+        raise_teardown_errors(errors, "Scope teardown failed")
+
+
+_current_scope: ContextVar[Scope | None] = ContextVar("plug_in_scope", default=None)
+
+
+def scope() -> Scope:
+    """
+    Create new [.Scope][]. Use it as a context manager (`with` or `async with`).
+    """
+    return Scope()
+
+
+def find_current_scope() -> Scope | None:
+    """
+    Return innermost active scope, or `None` when no scope is active.
+    """
+    return _current_scope.get()
+
+
+def get_current_scope() -> Scope:
+    """
+    Return innermost active scope.
+
+    Raises:
+        [plug_in.exc.MissingScopeError][]: When no scope is active.
+    """
+    current = _current_scope.get()
+
+    if current is None:
+        raise MissingScopeError(
+            "No active scope. Wrap the code resolving scoped plugins in "
+            "`with scope(): ...` or `async with scope(): ...`"
+        )
+
+    return current
@@ -0,0 +1,190 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+import time
+from typing import AbstractSet, Any, Awaitable, Sequence
+
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.graph import DependencyGraph
+from plug_in.types.proto.core_host import CoreHostProtocol
+from plug_in.types.proto.core_plugin import CorePluginProtocol
+
+
+@dataclass(frozen=True)
+class WarmUpEntry:
+    """
+    Outcome of a single plugin warm-up.
+    """
+
+    _host: CoreHostProtocol[Any]
+    _policy: PluginPolicy
+    _duration: float
+    _error: BaseException | None = None
+
+    @property
+    def host(self) -> CoreHostProtocol[Any]:
+        return self._host
+
+    @property
+    def policy(self) -> PluginPolicy:
+        return self._policy
+
+    @property
+    def duration(self) -> float:
+        """
+        Initialization time in seconds.
+        """
+        return self._duration
+
+    @property
+    def error(self) -> BaseException | None:
+        return self._error
+
+
+@dataclass(frozen=True)
+class WarmUpReport:
+    """
+    Outcome of warm-up of a set of plugins. Entries are kept in the order
+    of warmed up plugins.
+    """
+
+    _entries: tuple[WarmUpEntry, ...]
+    _duration: float
+
+    @property
+    def entries(self) -> tuple[WarmUpEntry, ...]:
+        return self._entries
+
+    @property
+    def duration(self) -> float:
+        """
+        Total warm-up wall time in seconds.
+        """
+        return self._duration
+
+    @property
+    def failed(self) -> tuple[WarmUpEntry, ...]:
+        return tuple(entry for entry in self._entries if entry.error is not None)
+
+
+WARM_UP_POLICIES = frozenset((PluginPolicy.LAZY, PluginPolicy.LAZY_ASYNC))
+
+
+def is_warmable(plugin: CorePluginProtocol[Any, Any]) -> bool:
+    """
+    Returns `True` if plugin initializes its value once, and can be warmed up.
+    """
+    return plugin.policy in WARM_UP_POLICIES
+
+
+def _prerequisites(
+    graph: DependencyGraph,
+    host: CoreHostProtocol[Any],
+    selected: AbstractSet[CoreHostProtocol[Any]],
+) -> set[CoreHostProtocol[Any]]:
+    """
+    Selected hosts that given host depends on, directly or through hosts
+    that are not selected.
+    """
+    found: set[CoreHostProtocol[Any]] = set()
+    visited: set[CoreHostProtocol[Any]] = set()
+    stack = list(graph.dependencies(host))
+
+    while stack:
+        dep = stack.pop()
+        if dep in visited:
+            continue
+        visited.add(dep)
+
+        if dep in selected:
+            found.add(dep)
+        else:
+            stack.extend(graph.dependencies(dep))
+
+    return found
+
+
+async def _init_plugin(
+    plugin: CorePluginProtocol[Any, Any],
+    executor: ThreadPoolExecutor,
+    timeout: float | None,
+) -> WarmUpEntry:
+    started = time.perf_counter()
+    try:
+        try:
+            sync_plugin = plugin.assert_sync()
+        except AssertionError:
+            provided: Awaitable[Any] = plugin.assert_async().provide()
+        else:
+            provided = asyncio.get_running_loop().run_in_executor(
+                executor, sync_plugin.provide
+            )
+
+        await asyncio.wait_for(provided, timeout)
+    except Exception as e:
+        error: BaseException | None = e
+    else:
+        error = None
+
+    return WarmUpEntry(
+        _host=plugin.host,
+        _policy=plugin.policy,
+        _duration=time.perf_counter() - started,
+        _error=error,
+    )
+
+
+async def warm_up_plugins(
+    plugins: Sequence[CorePluginProtocol[Any, Any]],
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+    graph: DependencyGraph | None = None,
+) -> WarmUpReport:
+    """
+    Initialize given plugins ahead of time. Sync providers run on a thread pool,
+    async providers run concurrently on the running loop.
+
+    Args:
+        plugins: Plugins to be initialized.
+        max_concurrency: Maximum number of initializations running at the same
+            time. Unlimited when `None`.
+        timeout: Per-plugin timeout in seconds. Note that sync provider that
+            timed out cannot be interrupted and keeps running in its thread.
+        graph: Dependencies between plugins. When given, plugin initialization
+            starts only after initialization of its own prerequisites finished,
+            while independent plugins are initialized concurrently.
+
+    Returns:
+        [.WarmUpReport][]. Errors are not raised, but stored in report entries.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    executor = ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="plug_in_warm_up"
+    )
+
+    done: dict[CoreHostProtocol[Any], asyncio.Event] = {
+        plugin.host: asyncio.Event() for plugin in plugins
+    }
+
+    async def warm_up_one(plugin: CorePluginProtocol[Any, Any]) -> WarmUpEntry:
+        try:
+            if graph is not None:
+                for dep in _prerequisites(graph, plugin.host, done.keys()):
+                    await done[dep].wait()
+
+            async with semaphore if semaphore is not None else nullcontext():
+                return await _init_plugin(plugin, executor, timeout)
+        finally:
+            done[plugin.host].set()
+
+    started = time.perf_counter()
+    try:
+        entries = await asyncio.gather(*(warm_up_one(plugin) for plugin in plugins))
+    finally:
+        # Timed out sync providers may still run, do not wait for them
+        executor.shutdown(wait=False)
+
+    return WarmUpReport(
+        _entries=tuple(entries), _duration=time.perf_counter() - started
+    )
@@ -1,3 +1,10 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from plug_in.types.proto.core_host import CoreHostProtocol
+    from plug_in.core.warmup import WarmUpReport
+
+
 class PlugInError(Exception):
     """
     Base class for all plug-in exceptions
@@ -31,6 +38,58 @@ class AsyncPluginCannotBeAwaited(CoreError, RuntimeError):
     pass
 
 
+class MissingScopeError(CoreError):
+    pass
+
+
+class ScopeAlreadyActiveError(CoreError):
+    pass
+
+
+class MissingTaskError(CoreError):
+    """
+    Task-local plugin was requested outside of a running asyncio task.
+    """
+
+
+class PoolTimeoutError(CoreError, TimeoutError):
+    """
+    No pooled value became free within pool timeout.
+    """
+
+
+class ProviderTimeoutError(CoreError, TimeoutError):
+    """
+    Async provider did not finish within its timeout, or before the deadline
+    of the current request.
+    """
+
+
+class WarmUpError(CoreError):
+    """
+    Raised when at least one plugin failed to warm up. Full outcome is
+    available as `report` attribute ([plug_in.core.warmup.WarmUpReport][]).
+    """
+
+    def __init__(self, message: str, report: "WarmUpReport") -> None:
+        super().__init__(message)
+        self.report = report
+
+
+class DependencyCycleError(CoreError):
+    """
+    Raised when plugin providers depend on each other in a cycle. Hosts forming
+    the cycle are available as `cycle` attribute, with first host repeated at
+    the end.
+    """
+
+    def __init__(
+        self, message: str, cycle: tuple["CoreHostProtocol[Any]", ...]
+    ) -> None:
+        super().__init__(message)
+        self.cycle = cycle
+
+
 class IoCError(PlugInError):
     """
     Base class for all exceptions raised by ioc module
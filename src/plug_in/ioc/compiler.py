@@ -0,0 +1,295 @@
+import inspect
+import logging
+from functools import wraps
+from typing import Any, Callable
+
+from plug_in.core.deadline import await_bounded, get_deadline
+from plug_in.core.pool import aclose_lease, close_lease, open_lease
+from plug_in.ioc.enum import AsyncResolutionMode
+from plug_in.ioc.hosted_mark import HostedMark
+from plug_in.ioc.parameter import CallPlan
+from plug_in.ioc.resolver import ParameterResolver
+
+# All names used by generated code start with this prefix. Callables with
+# parameters using this prefix are not compiled.
+_PREFIX = "_pi_"
+
+
+class CompiledRoute:
+    """
+    Specialized wrapper of a managed callable, generated as python source with
+    exactly the same parameter list as the original callable.
+
+    Hosted parameters keep their [.HostedMark][] defaults, which serve as a
+    sentinel. When the sentinel is received, the provider from the route
+    [.CallPlan][] is called, and original callable is invoked directly.
+
+    Providers are bound into generated code namespace on the first call that
+    needs them (or on [.CompiledRoute.bind][] call), so routes can be compiled
+    before the router is mounted. Every call compares generation of bound
+    providers with the current one (see [.ParameterResolver.generation][]),
+    and binds them again when it is outdated.
+
+    When plan has pooled plugins (see [.CallPlan.leased][]), providers are
+    called within a lease, and pooled values are returned when the call
+    finishes.
+
+    Use [.compile_route][] to create instances.
+    """
+
+    def __init__(
+        self,
+        callable: Callable,
+        resolver: ParameterResolver,
+        sig: inspect.Signature,
+    ) -> None:
+        self._callable = callable
+        self._resolver = resolver
+        self._is_async = resolver.should_use_async_bind
+        self._hosted_names = [
+            name
+            for name, param in sig.parameters.items()
+            if isinstance(param.default, HostedMark)
+        ]
+        self._namespace: dict[str, Any] = {
+            "_pi_callable": callable,
+            "_pi_generation": resolver.current_generation,
+            "_pi_unbind": self._unbind_outdated,
+            "_pi_open_lease": open_lease,
+            "_pi_get_deadline": get_deadline,
+            "_pi_await_bounded": await_bounded,
+            "_pi_what": f"Hosted parameters of {callable}",
+            "_pi_close_lease": aclose_lease if self._is_async else close_lease,
+        }
+        self.unbind()
+
+        source = self._generate_source(sig)
+        exec(
+            compile(source, f"<plug_in route {callable.__qualname__}>", "exec"),
+            self._namespace,
+        )
+        self._function: Callable = wraps(callable)(self._namespace["_pi_route"])
+
+    @property
+    def function(self) -> Callable:
+        return self._function
+
+    @property
+    def resolver(self) -> ParameterResolver:
+        return self._resolver
+
+    def _generate_source(self, sig: inspect.Signature) -> str:
+        params: list[str] = []
+        call_args: list[str] = []
+        body: list[str] = []
+        kind = inspect.Parameter
+
+        previous_kind = None
+        for idx, (name, param) in enumerate(sig.parameters.items()):
+            params.extend(_separators(previous_kind, param.kind))
+            previous_kind = param.kind
+
+            if param.kind == kind.VAR_POSITIONAL:
+                params.append(f"*{name}")
+                call_args.append(f"*{name}")
+                continue
+
+            if param.kind == kind.VAR_KEYWORD:
+                params.append(f"**{name}")
+                call_args.append(f"**{name}")
+                continue
+
+            if param.default is inspect.Parameter.empty:
+                params.append(name)
+            else:
+                default_name = f"_pi_default_{idx}"
+                self._namespace[default_name] = param.default
+                params.append(f"{name}={default_name}")
+
+            if param.kind == kind.KEYWORD_ONLY:
+                call_args.append(f"{name}={name}")
+            else:
+                call_args.append(name)
+
+            if name in self._hosted_names:
+                body.append(f"    if {name} is _pi_default_{idx}:")
+                body.append(f"        {name} = _pi_provide_{name}()")
+                if self._is_async:
+                    body.extend(_await_provided(name))
+
+        if previous_kind == kind.POSITIONAL_ONLY:
+            params.append("/")
+
+        call = f"_pi_callable({', '.join(call_args)})"
+        if self._is_async:
+            header = f"async def _pi_route({', '.join(params)}):"
+            body.append(f"    return await {call}")
+        else:
+            header = f"def _pi_route({', '.join(params)}):"
+            body.append(f"    return {call}")
+
+        return (
+            "\n".join(
+                [header, *self._generation_check(), *self._lease_frame(body), *body]
+            )
+            + "\n"
+        )
+
+    def _generation_check(self) -> list[str]:
+        """
+        Source lines rebinding providers when their generation is outdated.
+        """
+        if not self._hosted_names:
+            return []
+
+        return [
+            "    if _pi_generation() != _pi_bound_generation:",
+            "        _pi_unbind()",
+        ]
+
+    def _lease_frame(self, body: list[str]) -> list[str]:
+        """
+        Source lines running given body within a lease, when plan is leased.
+        Otherwise, execution falls through to the body itself.
+        """
+        if not self._hosted_names:
+            return []
+
+        close = "await _pi_close_lease" if self._is_async else "_pi_close_lease"
+        return [
+            "    if _pi_leased:",
+            "        _pi_token = _pi_open_lease()",
+            "        try:",
+            *(f"        {line}" for line in body),
+            "        finally:",
+            f"            {close}(_pi_token)",
+        ]
+
+    def _bootstrap(self, name: str) -> Callable[[], Any]:
+        def bootstrap() -> Any:
+            # Binding cannot interleave with resolver rewind
+            with self._resolver.lock:
+                self.bind(self._resolver.get_call_plan())
+            return self._namespace[f"_pi_provide_{name}"]()
+
+        return bootstrap
+
+    def bind(self, plan: CallPlan) -> None:
+        """
+        Bind providers of given plan into generated code.
+        """
+        for slot in plan.slots:
+            self._namespace[f"_pi_is_async_{slot.name}"] = slot.is_async
+            self._namespace[f"_pi_provide_{slot.name}"] = slot.provide
+        self._namespace["_pi_bound_generation"] = self._resolver.generation
+        self._namespace["_pi_leased"] = plan.leased
+
+    def _unbind_outdated(self) -> None:
+        """
+        Unbind providers of outdated generation, called by generated code.
+        """
+        with self._resolver.lock:
+            self.unbind()
+
+    def unbind(self) -> None:
+        """
+        Restore bootstrap providers, so the next call binds providers again.
+        Call it together with [.ParameterResolver.rewind][], holding resolver
+        lock.
+        """
+        for name in self._hosted_names:
+            self._namespace[f"_pi_is_async_{name}"] = False
+            self._namespace[f"_pi_provide_{name}"] = self._bootstrap(name)
+        # Bootstrap providers check generation themselves
+        self._namespace["_pi_bound_generation"] = self._resolver.current_generation()
+        # Bootstrap providers may check values out of pools
+        self._namespace["_pi_leased"] = True
+
+
+def _await_provided(name: str) -> list[str]:
+    """
+    Source lines awaiting provided value of an async hosted parameter, bounded
+    by the deadline of the caller, as in generic async routes.
+    """
+    return [
+        f"        if _pi_is_async_{name}:",
+        "            if _pi_get_deadline() is None:",
+        f"                {name} = await {name}",
+        "            else:",
+        f"                {name} = await _pi_await_bounded({name}, None, _pi_what)",
+    ]
+
+
+def _separators(
+    previous_kind: inspect._ParameterKind | None, kind: inspect._ParameterKind
+) -> list[str]:
+    """
+    Parameter list separators (`/` and `*`) placed between two parameters.
+    """
+    separators: list[str] = []
+    if (
+        previous_kind == inspect.Parameter.POSITIONAL_ONLY
+        and kind != inspect.Parameter.POSITIONAL_ONLY
+    ):
+        separators.append("/")
+    if kind == inspect.Parameter.KEYWORD_ONLY and previous_kind not in (
+        inspect.Parameter.KEYWORD_ONLY,
+        inspect.Parameter.VAR_POSITIONAL,
+    ):
+        separators.append("*")
+
+    return separators
+
+
+def compile_route(
+    callable: Callable, resolver: ParameterResolver
+) -> CompiledRoute | None:
+    """
+    Try to generate specialized wrapper for a managed callable. Returns `None`
+    when callable cannot be expressed as generated code, and generic wrapper
+    should be used instead. This includes:
+
+    - objects that are not python functions (builtins, classes, callable objects)
+    - callables with parameters named with reserved prefix
+    - async callables with [.AsyncResolutionMode.CONCURRENT][] resolution
+    - async callables with resolution timeout
+
+    Deadline of the caller (see [plug_in.core.deadline.deadline][]) bounds
+    async providers of compiled routes as well.
+    """
+    if not inspect.isfunction(callable):
+        logging.debug("Not compiling route for %s - not a python function", callable)
+        return None
+
+    if (
+        resolver.should_use_async_bind
+        and resolver.async_resolution == AsyncResolutionMode.CONCURRENT
+    ):
+        logging.debug(
+            "Not compiling route for %s - concurrent resolution is not supported",
+            callable,
+        )
+        return None
+
+    if resolver.should_use_async_bind and resolver.timeout is not None:
+        logging.debug(
+            "Not compiling route for %s - resolution timeout is not supported",
+            callable,
+        )
+        return None
+
+    try:
+        sig = inspect.signature(callable)
+    except Exception as e:
+        logging.debug("Not compiling route for %s - no signature: %s", callable, e)
+        return None
+
+    if any(name.startswith(_PREFIX) for name in sig.parameters):
+        logging.debug(
+            "Not compiling route for %s - parameters use reserved prefix %s",
+            callable,
+            _PREFIX,
+        )
+        return None
+
+    return CompiledRoute(callable, resolver, sig)
@@ -0,0 +1,15 @@
+from enum import StrEnum
+
+
+class AsyncResolutionMode(StrEnum):
+    """
+    Describes how hosted parameters of an async managed callable are resolved.
+
+    - `SEQUENTIAL` - async providers are awaited one after another, in the order
+        of callable parameters.
+    - `CONCURRENT` - all async providers are scheduled together and awaited
+        concurrently. When one of them fails, the remaining ones are cancelled.
+    """
+
+    SEQUENTIAL = "SEQUENTIAL"
+    CONCURRENT = "CONCURRENT"
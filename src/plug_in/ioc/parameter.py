@@ -4,8 +4,19 @@ from dataclasses import dataclass
 from enum import StrEnum
 import inspect
 import logging
-from typing import Any, Awaitable, Callable, Literal, Self, cast, get_type_hints
-from plug_in.core.host import CoreHost
+import sys
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Literal,
+    NamedTuple,
+    Self,
+    cast,
+    get_type_hints,
+)
+from plug_in.core.host import CoreHost, intern_host
+from plug_in.core.pool import LEASED_POLICIES
 from plug_in.exc import (
     EmptyHostAnnotationError,
     ObjectNotSupported,
@@ -15,7 +26,10 @@ from plug_in.exc import (
 from plug_in.ioc.hosted_mark import HostedMark
 from plug_in.tools.introspect import contains_forward_refs, is_coroutine_callable
 from plug_in.types.proto.core_host import CoreHostProtocol
-from plug_in.types.proto.core_plugin import CorePluginProtocol
+from plug_in.types.proto.core_plugin import (
+    CorePluginProtocol,
+    OffloadingCorePluginProtocol,
+)
 from plug_in.types.proto.hosted_mark import HostedMarkProtocol
 from plug_in.types.proto.joint import Joint
 from plug_in.types.proto.parameter import (
@@ -32,6 +46,53 @@ class ParamsStateType(StrEnum):
     PLUGIN_READY = "PLUGIN_READY"
 
 
+class CallPlanSlot(NamedTuple):
+    """
+    Single injection slot of a [.CallPlan][]. Slots are kept as tuples, so they
+    can be cheaply unpacked on every managed call.
+    """
+
+    name: str
+    # Index of the parameter among positional parameters. Keyword-only
+    # parameters have `sys.maxsize` here, so they are never considered as
+    # passed positionally.
+    position: int
+    provide: Callable[[], Any]
+    is_async: bool
+
+
+@dataclass(frozen=True)
+class CallPlan:
+    """
+    Precompiled description of how hosted parameters of a callable are injected.
+    Built once per [.PluginParams][] state and reused for every call, so no
+    [inspect.Signature][] or [inspect.BoundArguments][] is created per invocation.
+
+    When `bind_fallback` is `True`, the plan cannot express the injection as
+    keyword arguments (e.g. hosted positional-only parameters) and signature
+    binding must be used instead.
+
+    When `leased` is `True`, some plugins check values out of a pool, and the
+    managed call must return them when it finishes (see [plug_in.core.pool][]).
+    """
+
+    _slots: tuple[CallPlanSlot, ...]
+    _bind_fallback: bool
+    _leased: bool = False
+
+    @property
+    def slots(self) -> tuple[CallPlanSlot, ...]:
+        return self._slots
+
+    @property
+    def bind_fallback(self) -> bool:
+        return self._bind_fallback
+
+    @property
+    def leased(self) -> bool:
+        return self._leased
+
+
 @dataclass
 class PluginParamStage[T: HostedMarkProtocol, JointType: Joint, MetaDataType](
     FinalParamStageProtocol[T, JointType, MetaDataType]
@@ -179,6 +240,25 @@ class PluginParams[T: HostedMarkProtocol](ParamsStateMachine, FinalParamsProtoco
     def advance(self) -> Self:
         return self
 
+    def rewind(self) -> "HostParams[T]":
+        """
+        Go back to [.HostParams][] stage, dropping plugins found by lookup. Use
+        it when plugins behind plugin lookup change, e.g. router is remounted.
+        """
+        return HostParams(
+            _callable=self.callable,
+            _plugin_lookup=self.plugin_lookup,
+            _state_type=ParamsStateType.HOST_READY,
+            _params=[
+                HostParamStage(
+                    _name=param.name, _default=param.default, _host=param.host
+                )
+                for param in self.params
+            ],
+            _type_hints=self.type_hints,
+            _sig=self.sig,
+        )
+
     def _get_resolver_map_cache(
         self,
     ) -> tuple[
@@ -204,6 +284,7 @@ class PluginParams[T: HostedMarkProtocol](ParamsStateMachine, FinalParamsProtoco
         sync_map: dict[str, Callable[[], Joint]] = {}
         async_map: dict[str, Callable[[], Awaitable[Joint]]] = {}
 
+        is_async = self.is_callable_a_coro_callable()
         for param in self.params:
             try:
                 sync_plugin = param.plugin.assert_sync()
@@ -218,13 +299,83 @@ class PluginParams[T: HostedMarkProtocol](ParamsStateMachine, FinalParamsProtoco
                     # Async path
                     async_map[param.name] = async_plugin.provide
             else:
-                # Sync path
-                sync_map[param.name] = sync_plugin.provide
+                if is_async and isinstance(sync_plugin, OffloadingCorePluginProtocol):
+                    # Blocking provider runs in executor, awaited as async one
+                    async_map[param.name] = sync_plugin.offload
+                else:
+                    # Sync path
+                    sync_map[param.name] = sync_plugin.provide
 
         both = (sync_map, async_map)
         setattr(self, "_resolver_cache", both)
         return both
 
+    def _build_call_plan(self) -> CallPlan:
+        """
+        Compile injection slots from resolver maps and callable signature.
+        """
+        try:
+            sync_map, async_map = self._get_resolver_map_cache()
+        except AttributeError:
+            sync_map, async_map = self._build_resolver_map_cache()
+
+        sig_params = list(self.sig.parameters.values())
+        positions: dict[str, int] = {
+            param.name: idx
+            for idx, param in enumerate(sig_params)
+            if param.kind
+            in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+        }
+
+        slots: list[CallPlanSlot] = []
+        bind_fallback = False
+
+        # Params are kept in signature order, so slots are resolved in the same
+        # order as they were resolved by signature binding
+        for param in self.params:
+            if (
+                self.sig.parameters[param.name].kind
+                == inspect.Parameter.POSITIONAL_ONLY
+            ):
+                # Cannot be injected as keyword argument
+                bind_fallback = True
+
+            if param.name in sync_map:
+                provide, is_async = sync_map[param.name], False
+            else:
+                provide, is_async = async_map[param.name], True
+
+            slots.append(
+                CallPlanSlot(
+                    name=param.name,
+                    position=positions.get(param.name, sys.maxsize),
+                    provide=provide,
+                    is_async=is_async,
+                )
+            )
+
+        plan = CallPlan(
+            _slots=tuple(slots),
+            _bind_fallback=bind_fallback,
+            _leased=any(
+                param.plugin.policy in LEASED_POLICIES for param in self.params
+            ),
+        )
+        setattr(self, "_call_plan_cache", plan)
+        return plan
+
+    def call_plan(self) -> CallPlan:
+        """
+        Returns precompiled [.CallPlan][] for this callable.
+        """
+        try:
+            return getattr(self, "_call_plan_cache")
+        except AttributeError:
+            return self._build_call_plan()
+
     def sync_resolver_map(
         self,
     ) -> dict[str, Callable[[], Joint]]:
@@ -459,7 +610,7 @@ class DefaultParams[T: HostedMarkProtocol](ParamsStateMachine):
                     f"callable signature {self.sig}"
                 ) from e
 
-            host = CoreHost(annotation, staged_default_param.default.marks)
+            host = intern_host(CoreHost(annotation, staged_default_param.default.marks))
 
             # Sanity check done, prepare next stage
             host_ready_stages.append(
@@ -1,6 +1,10 @@
+from dataclasses import replace
 import inspect
 import logging
-from typing import Any, Callable
+import threading
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Hashable, cast
+from plug_in.core.deadline import await_bounded, deadline, get_deadline
 from plug_in.exc import (
     EmptyHostAnnotationError,
     MissingMountError,
@@ -8,10 +12,27 @@ from plug_in.exc import (
     ObjectNotSupported,
     UnexpectedForwardRefError,
 )
-from plug_in.ioc.parameter import NothingParams, ParamsStateMachine
+from plug_in.core.observe import observed_provider
+from plug_in.ioc.enum import AsyncResolutionMode
+from plug_in.ioc.tracing import traced_provider
+from plug_in.ioc.parameter import (
+    CallPlan,
+    CallPlanSlot,
+    HostParams,
+    NothingParams,
+    ParamsStateMachine,
+    PluginParams,
+)
 from plug_in.types.proto.core_host import CoreHostProtocol
 from plug_in.types.proto.core_plugin import CorePluginProtocol
+from plug_in.types.proto.observer import ObserverProtocol
+from plug_in.tools.concurrency import gather_or_cancel
 from plug_in.types.proto.resolver import ParameterResolverProtocol
+from plug_in.types.proto.tracing import TracerProtocol
+
+
+def _no_generation() -> None:
+    return None
 
 
 class ParameterResolver[**CallParams](ParameterResolverProtocol):
@@ -20,13 +41,31 @@ class ParameterResolver[**CallParams](ParameterResolverProtocol):
 
     Args:
         callable: A callable that will be managed
-        resolve_callback: Function transforming a [.CoreHost][] instance into
-            provided value.
+        plugin_lookup: Function returning plugin for a [.CoreHost][] instance.
+        generation: Function returning current generation of plugins behind
+            `plugin_lookup` (e.g. [.Router.get_generation][]). It is checked on
+            every call, and when it differs from generation the plugins were
+            looked up in, they are looked up again. When `None`, plugins are
+            looked up once.
         assert_no_forward_ref: If forward reference is present at the resolver
             construction time, setting this to `True` will result in
             [.UnexpectedForwardRefError][]. When it is `False` (default), resolver
             will take an attempt to evaluate forward refs at the first callable
             invocation.
+        async_resolution: How async plugins are resolved for async callables.
+            With [.AsyncResolutionMode.CONCURRENT][] all async providers are
+            awaited together, and remaining ones are cancelled when any of them
+            fails. Defaults to [.AsyncResolutionMode.SEQUENTIAL][].
+        timeout: Time limit in seconds for resolution of hosted parameters of
+            async callables. It also becomes the deadline of providers (see
+            [plug_in.core.deadline.deadline][]). Resolution is also bounded by
+            deadline of the caller. `None` (default) means no limit.
+        observer: Receives provider, finalization and bind events of this
+            callable (see [plug_in.core.observe.Observer][]). When `None`
+            (default), nothing is instrumented.
+        tracer: Records every resolution of a hosted parameter as a span (see
+            [plug_in.ioc.tracing.Tracer][]). When `None` (default), nothing is
+            traced.
     """
 
     def __init__(
@@ -35,13 +74,31 @@ class ParameterResolver[**CallParams](ParameterResolverProtocol):
         # resolve_callback: Callable[[CoreHostProtocol], Callable[[], Joint]],
         plugin_lookup: Callable[[CoreHostProtocol], CorePluginProtocol],
         assert_resolver_ready: bool = False,
+        generation: Callable[[], Hashable] | None = None,
+        async_resolution: AsyncResolutionMode = AsyncResolutionMode.SEQUENTIAL,
+        timeout: float | None = None,
+        observer: ObserverProtocol | None = None,
+        tracer: TracerProtocol | None = None,
     ) -> None:
+        self._async_resolution = async_resolution
+        self._timeout = timeout
+        self._observer = observer
+        self._tracer = tracer
         self._state: ParamsStateMachine = NothingParams(
             _callable=callable,
             _plugin_lookup=plugin_lookup,  # _resolve_provider=resolve_callback
         )
 
         self._should_use_async_bind = self._state.is_callable_a_coro_callable()
+        self._call_plan: CallPlan | None = None
+        self._current_generation = (
+            generation if generation is not None else _no_generation
+        )
+        # Generation of plugins in final state, `None` until state is final
+        self._generation: Hashable = None
+        # Guards state transitions, reentrant as state advance can resolve
+        # other routes
+        self._lock = threading.RLock()
 
         # Try to advance
         self.try_finalize_state(assert_resolver_ready)
@@ -50,10 +107,55 @@ class ParameterResolver[**CallParams](ParameterResolverProtocol):
     def should_use_async_bind(self) -> bool:
         return self._should_use_async_bind
 
+    @property
+    def async_resolution(self) -> AsyncResolutionMode:
+        return self._async_resolution
+
+    @property
+    def timeout(self) -> float | None:
+        return self._timeout
+
+    @property
+    def observer(self) -> ObserverProtocol | None:
+        return self._observer
+
+    @property
+    def tracer(self) -> TracerProtocol | None:
+        return self._tracer
+
     @property
     def state(self) -> ParamsStateMachine:
         return self._state
 
+    @property
+    def generation(self) -> Hashable:
+        """
+        Generation of plugins current call plan was built with.
+        """
+        return self._generation
+
+    def current_generation(self) -> Hashable:
+        """
+        Current generation of plugins behind plugin lookup.
+        """
+        return self._current_generation()
+
+    @property
+    def lock(self) -> threading.RLock:
+        """
+        Lock guarding resolver state transitions. Hold it when binding call plan
+        into other structures, so the binding cannot interleave with
+        [.ParameterResolver.rewind][].
+        """
+        return self._lock
+
+    @property
+    def call_plan(self) -> CallPlan | None:
+        """
+        Precompiled call plan, or `None` if resolver state is not final yet.
+        """
+        return self._call_plan
+
     def try_finalize_state(self, assert_resolver_ready: bool = False) -> None:
         """
         Advances internal resolver state to the point that no further advances
@@ -98,28 +200,316 @@ class ParameterResolver[**CallParams](ParameterResolverProtocol):
                 hosted mark should be synchronous but is asynchronous.
 
         """
-        while not self._state.is_final():
-            try:
-                self._state = self._state.advance()
-            except (
-                ObjectNotSupported,
-                EmptyHostAnnotationError,
-            ) as e:
-                # Always reraise
-                raise e
-            except (
-                UnexpectedForwardRefError,
-                MissingMountError,
-                MissingPluginError,
-            ) as e:
-                logging.debug(
-                    "Halted resolver state at %s, with reason: %s", self._state, e
-                )
-                if assert_resolver_ready:
-                    raise e
-                else:
+        with self._lock:
+            started = perf_counter()
+            # Read before lookups, so a swap in between makes the state stale
+            generation = self._current_generation()
+            while not self._state.is_final():
+                if not self._advance(assert_resolver_ready):
                     return
 
+            if self._call_plan is None:
+                self._call_plan = self._plan_for(self._state.assert_final())
+                self._generation = generation
+                if self._observer is not None:
+                    self._observer.on_route_finalized(
+                        self._state.callable, perf_counter() - started
+                    )
+
+    def _advance(self, assert_resolver_ready: bool) -> bool:
+        """
+        Advance state by a single stage. Returns `False` when it is halted by
+        one of silenced exceptions (see [.ParameterResolver.try_finalize_state][]).
+        """
+        try:
+            self._state = self._state.advance()
+        except (
+            ObjectNotSupported,
+            EmptyHostAnnotationError,
+        ) as e:
+            # Always reraise
+            self._report_failure(e)
+            raise e
+        except (
+            UnexpectedForwardRefError,
+            MissingMountError,
+            MissingPluginError,
+        ) as e:
+            logging.debug(
+                "Halted resolver state at %s, with reason: %s", self._state, e
+            )
+            self._report_failure(e)
+            if assert_resolver_ready:
+                raise e
+            else:
+                return False
+        except Exception as e:
+            self._report_failure(e)
+            raise
+
+        return True
+
+    def _report_failure(self, error: BaseException) -> None:
+        if self._observer is not None:
+            self._observer.on_route_failed(self._state.callable, error)
+
+    def _plan_for(self, state: PluginParams) -> CallPlan:
+        """
+        Call plan of given final state, with providers reporting to observer
+        and tracer.
+        """
+        plan = state.call_plan()
+        if self._observer is None and self._tracer is None:
+            return plan
+
+        plugins = {param.name: param.plugin for param in state.params}
+        return replace(
+            plan,
+            _slots=tuple(
+                slot._replace(provide=self._instrument(slot, plugins[slot.name]))
+                for slot in plan.slots
+            ),
+        )
+
+    def _instrument(
+        self, slot: CallPlanSlot, plugin: CorePluginProtocol
+    ) -> Callable[[], Any]:
+        provide = slot.provide
+        if self._observer is not None:
+            provide = observed_provider(self._observer, plugin, provide, slot.is_async)
+        if self._tracer is not None:
+            provide = traced_provider(
+                self._tracer, slot.name, plugin, provide, slot.is_async
+            )
+        return provide
+
+    def _final_state(self) -> PluginParams:
+        with self._lock:
+            if self._generation != self._current_generation():
+                self.rewind()
+            # At this stage resolver must be ready
+            self.try_finalize_state(assert_resolver_ready=True)
+            return self._state.assert_final()
+
+    def get_call_plan(self) -> CallPlan:
+        """
+        Return call plan, finalizing resolver state if needed. Plugins are looked
+        up again when their generation is outdated.
+        """
+        plan = self._call_plan
+        if plan is None or self._generation != self._current_generation():
+            with self._lock:
+                self._final_state()
+                plan = cast(CallPlan, self._call_plan)
+
+        return plan
+
+    def needs_lease(self) -> bool:
+        """
+        Whether managed call must collect values checked out of pools by its
+        plugins. Until call plan is (re)built, the answer is unknown, and `True`
+        is returned to stay on the safe side.
+        """
+        plan = self._call_plan
+        return (
+            plan is None
+            or plan.leased
+            or self._generation != self._current_generation()
+        )
+
+    def rewind(self) -> None:
+        """
+        Drop plugins found by plugin lookup and the call plan built from them.
+        They are looked up again on the next call. Use it when plugins behind
+        plugin lookup change, e.g. router is remounted. Calls in progress finish
+        with previous plugins.
+        """
+        with self._lock:
+            if isinstance(self._state, PluginParams):
+                self._state = self._state.rewind()
+            self._call_plan = None
+            self._generation = None
+
+    def prepare_rebind(
+        self, plugin_lookup: Callable[[CoreHostProtocol], CorePluginProtocol]
+    ) -> PluginParams | None:
+        """
+        Build final state (including its call plan) against given plugin lookup,
+        without touching the current state. Apply it with
+        [.ParameterResolver.rebind][]. Prepared state keeps resolver's own plugin
+        lookup for later rewinds.
+
+        Returns:
+            Prepared state, or `None` when it cannot be built now (host
+            annotations not evaluated yet, or plugin missing in lookup).
+
+        Raises:
+            [plug_in.exc.SyncPluginExpected][]: When plugin found for a
+                synchronous callable is asynchronous.
+        """
+        with self._lock:
+            state = self._state
+
+        if isinstance(state, PluginParams):
+            state = state.rewind()
+
+        if not isinstance(state, HostParams):
+            return None
+
+        try:
+            prepared = replace(state, _plugin_lookup=plugin_lookup).advance()
+        except (MissingMountError, MissingPluginError) as e:
+            logging.debug("Cannot prepare rebind of %s: %s", state.callable, e)
+            return None
+
+        prepared = replace(prepared, _plugin_lookup=state.plugin_lookup)
+        # Compile ahead, so first call does not pay for it
+        prepared.call_plan()
+        return prepared
+
+    def rebind(self, prepared: PluginParams | None) -> None:
+        """
+        Replace current state with one returned by
+        [.ParameterResolver.prepare_rebind][]. With `None`, resolver is rewound
+        instead, and looks plugins up again on the next call.
+
+        Prepared state is assigned current generation, so call it once plugins
+        it was prepared with are current.
+        """
+        with self._lock:
+            if prepared is None:
+                self.rewind()
+            else:
+                self._state = prepared
+                self._call_plan = self._plan_for(prepared)
+                self._generation = self._current_generation()
+
+    def get_dependencies(self) -> tuple[CoreHostProtocol[Any], ...]:
+        """
+        Return hosts of all hosted parameters of managed callable. Hosts are
+        known once host annotations are evaluated, so this does not require
+        router to be mounted.
+
+        Raises:
+            [.UnexpectedForwardRefError][]: When host annotations cannot be
+                evaluated yet.
+        """
+        with self._lock:
+            self.try_finalize_state()
+
+            while not isinstance(self._state, (HostParams, PluginParams)):
+                # Raises the reason why state could not be advanced
+                self._state = self._state.advance()
+
+            return tuple(param.host for param in self._state.params)
+
+    def get_one_time_call_args_sync(
+        self, *args: CallParams.args, **kwargs: CallParams.kwargs
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """
+        Get positional and keyword arguments that original `callable` should be
+        invoked with. Only hosted parameters missing from given arguments are
+        resolved, and they are injected as keyword arguments, using precompiled
+        [.CallPlan][]. Call results are the same as when calling with
+        [.get_one_time_bind_sync][] result, but no signature binding is performed.
+
+        Note that this method is intended to work with synchronous callables. If
+        async plugin is encountered, it may raise [plug_in.exc.SyncPluginExpected][].
+
+        Args:
+            args: The same positional arguments that original `callable` accepts
+            kwargs: The same keyword arguments that original `callable` accepts
+
+        Returns:
+            Tuple of positional arguments and keyword arguments.
+        """
+        if self._observer is None:
+            return self._call_args_sync(args, kwargs)
+
+        return self._observe_bind(self._call_args_sync, args, kwargs)
+
+    def _call_args_sync(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        plan = self.get_call_plan()
+
+        if plan.bind_fallback:
+            bind = self._bind_sync(args, kwargs)
+            return bind.args, bind.kwargs
+
+        args_count = len(args)
+        for name, position, provide, _ in plan.slots:
+            # Explicitly passed by caller, skip resolution
+            if position < args_count or name in kwargs:
+                continue
+
+            kwargs[name] = provide()
+
+        return args, kwargs
+
+    async def get_one_time_call_args_async(
+        self, *args: CallParams.args, **kwargs: CallParams.kwargs
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """
+        Get positional and keyword arguments that original `callable` should be
+        invoked with. Only hosted parameters missing from given arguments are
+        resolved, and they are injected as keyword arguments, using precompiled
+        [.CallPlan][]. Call results are the same as when calling with
+        [.get_one_time_bind_async][] result, but no signature binding is performed.
+
+        Async plugins are resolved according to `async_resolution` mode given at
+        initialization time.
+
+        Args:
+            args: The same positional arguments that original `callable` accepts
+            kwargs: The same keyword arguments that original `callable` accepts
+
+        Returns:
+            Tuple of positional arguments and keyword arguments.
+
+        Raises:
+            [plug_in.exc.ProviderTimeoutError][]: When resolution did not finish
+                within `timeout` or the current deadline.
+        """
+        return await self._resolve_async(self._call_args_async(args, kwargs))
+
+    async def _call_args_async(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        plan = self.get_call_plan()
+
+        if plan.bind_fallback:
+            bind = await self._bind_async(args, kwargs)
+            return bind.args, bind.kwargs
+
+        args_count = len(args)
+        # Explicitly passed by caller, skip resolution
+        missing = [
+            slot
+            for slot in plan.slots
+            if slot.position >= args_count and slot.name not in kwargs
+        ]
+
+        if self._async_resolution == AsyncResolutionMode.CONCURRENT:
+            async_slots = [slot for slot in missing if slot.is_async]
+            async_values = await gather_or_cancel(
+                [slot.provide for slot in async_slots]
+            )
+
+            for name, _, provide, is_async in missing:
+                if not is_async:
+                    kwargs[name] = provide()
+
+            for (name, _, _, _), value in zip(async_slots, async_values):
+                kwargs[name] = value
+
+            return args, kwargs
+
+        for name, _, provide, is_async in missing:
+            kwargs[name] = (await provide()) if is_async else provide()
+
+        return args, kwargs
+
     def get_one_time_bind_sync(
         self, *args: CallParams.args, **kwargs: CallParams.kwargs
     ) -> inspect.BoundArguments:
@@ -127,7 +517,7 @@ class ParameterResolver[**CallParams](ParameterResolverProtocol):
         Get [inspect.BoundArguments][], with [.HosedMark][] default values
         replaced with its resolved value. Resolving happens by calling
         `replace_callback` given at initialization time. Default values are
-        applied.
+        applied. Hosted parameters explicitly passed by the caller are not resolved.
 
         Invoke this method with the same arguments that user invokes his `callable`.
 
@@ -141,26 +531,24 @@ class ParameterResolver[**CallParams](ParameterResolverProtocol):
         Returns:
             [inspect.BoundArguments][] object with applied defaults.
         """
-        # At this stage resolver must be ready
-        self.try_finalize_state(assert_resolver_ready=True)
-        resolver_params = self._state.assert_final()
-        resolver_map = self._state.assert_final().sync_resolver_map()
-        sig = resolver_params.sig
-
-        # https://github.com/python/cpython/issues/85542
-        # Replace defaults filtering only hosts
-        new_sig = sig.replace(
-            parameters=[
-                (
-                    param.replace(default=resolver_map[param.name]())
-                    if param.name in resolver_map
-                    else param
-                )
-                for param in sig.parameters.values()
-            ]
-        )
+        if self._observer is None:
+            return self._bind_sync(args, kwargs)
+
+        return self._observe_bind(self._bind_sync, args, kwargs)
+
+    def _bind_sync(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> inspect.BoundArguments:
+        resolver_params = self._final_state()
+        resolver_map, _ = self._resolver_maps(resolver_params)
+
+        # Hosted params still have a HostedMark default, so binding does not
+        # require them. Only missing ones are resolved afterwards.
+        arg_bind = resolver_params.sig.bind(*args, **kwargs)
+        for name, resolver in resolver_map.items():
+            if name not in arg_bind.arguments:
+                arg_bind.arguments[name] = resolver()
 
-        arg_bind = new_sig.bind(*args, **kwargs)
         arg_bind.apply_defaults()
         return arg_bind
 
@@ -171,7 +559,7 @@ class ParameterResolver[**CallParams](ParameterResolverProtocol):
         Get [inspect.BoundArguments][], with [.HosedMark][] default values
         replaced with its resolved value. Resolving happens by calling
         `replace_callback` given at initialization time. Default values are
-        applied.
+        applied. Hosted parameters explicitly passed by the caller are not resolved.
 
         Invoke this method with the same arguments that user invokes his `callable`.
 
@@ -181,31 +569,109 @@ class ParameterResolver[**CallParams](ParameterResolverProtocol):
 
         Returns:
             [inspect.BoundArguments][] object with applied defaults.
+
+        Raises:
+            [plug_in.exc.ProviderTimeoutError][]: When resolution did not finish
+                within `timeout` or the current deadline.
         """
-        # At this stage resolver must be ready
-        self.try_finalize_state(assert_resolver_ready=True)
-        resolver_params = self._state.assert_final()
-        sync_resolver_map = resolver_params.sync_resolver_map()
-        async_resolver_map = resolver_params.async_resolver_map()
-        sig = resolver_params.sig
-
-        # https://github.com/python/cpython/issues/85542
-        # Replace defaults filtering only hosts
-        new_sig = sig.replace(
-            parameters=[
-                (
-                    param.replace(default=sync_resolver_map[param.name]())
-                    if param.name in sync_resolver_map
-                    else (
-                        param.replace(default=(await async_resolver_map[param.name]()))
-                        if param.name in async_resolver_map
-                        else param
-                    )
+        return await self._resolve_async(self._bind_async(args, kwargs))
+
+    async def _bind_async(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> inspect.BoundArguments:
+        resolver_params = self._final_state()
+        sync_resolver_map, async_resolver_map = self._resolver_maps(resolver_params)
+
+        # Hosted params still have a HostedMark default, so binding does not
+        # require them. Only missing ones are resolved afterwards, in the order
+        # of callable parameters.
+        arg_bind = resolver_params.sig.bind(*args, **kwargs)
+        missing_async = {
+            name: resolver
+            for name, resolver in async_resolver_map.items()
+            if name not in arg_bind.arguments
+        }
+
+        if self._async_resolution == AsyncResolutionMode.CONCURRENT:
+            async_values = dict(
+                zip(
+                    missing_async.keys(),
+                    await gather_or_cancel(list(missing_async.values())),
                 )
-                for param in sig.parameters.values()
-            ]
-        )
+            )
+        else:
+            async_values = {}
+
+        for param_name in resolver_params.sig.parameters:
+            if param_name in arg_bind.arguments:
+                continue
+            elif param_name in sync_resolver_map:
+                arg_bind.arguments[param_name] = sync_resolver_map[param_name]()
+            elif param_name in async_values:
+                arg_bind.arguments[param_name] = async_values[param_name]
+            elif param_name in missing_async:
+                arg_bind.arguments[param_name] = await missing_async[param_name]()
 
-        arg_bind = new_sig.bind(*args, **kwargs)
         arg_bind.apply_defaults()
         return arg_bind
+
+    def _resolver_maps(self, state: PluginParams) -> tuple[
+        dict[str, Callable[[], Any]],
+        dict[str, Callable[[], Awaitable[Any]]],
+    ]:
+        """
+        Sync and async resolver maps of given final state. With observer or
+        tracer, they are taken from the call plan, which keeps instrumented
+        providers.
+        """
+        if self._observer is None and self._tracer is None:
+            return state.sync_resolver_map(), state.async_resolver_map()
+
+        slots = self.get_call_plan().slots
+        return (
+            {slot.name: slot.provide for slot in slots if not slot.is_async},
+            {slot.name: slot.provide for slot in slots if slot.is_async},
+        )
+
+    def _observe_bind[
+        T
+    ](
+        self,
+        bind: Callable[[tuple[Any, ...], dict[str, Any]], T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> T:
+        started = perf_counter()
+        result = bind(args, kwargs)
+        cast(ObserverProtocol, self._observer).on_bind(
+            self._state.callable, perf_counter() - started
+        )
+        return result
+
+    async def _resolve_async[T](self, resolution: Awaitable[T]) -> T:
+        """
+        Await resolution, bounded by timeout and deadline, and reported to
+        observer when they are set.
+        """
+        if self._timeout is not None or get_deadline() is not None:
+            resolution = self._bounded(resolution)
+
+        if self._observer is None:
+            return await resolution
+
+        started = perf_counter()
+        result = await resolution
+        self._observer.on_bind(self._state.callable, perf_counter() - started)
+        return result
+
+    async def _bounded[T](self, resolution: Awaitable[T]) -> T:
+        """
+        Await resolution within route timeout, which is the deadline of
+        providers awaited by it.
+        """
+        with deadline(self._timeout):
+            return await await_bounded(
+                resolution,
+                None,
+                f"Hosted parameters of {self._state.callable}",
+            )
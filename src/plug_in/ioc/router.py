@@ -1,34 +1,152 @@
-from functools import wraps
-from typing import Any, Awaitable, Callable, cast, overload
+from concurrent.futures import Future
+from functools import partial, wraps
+import inspect
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Mapping, cast, overload
 
-from plug_in.exc import MissingMountError, MissingRouteError, RouterAlreadyMountedError
+from plug_in.core.pool import aclose_lease, close_lease, open_lease
+from plug_in.exc import (
+    MissingMountError,
+    MissingRouteError,
+    RouterAlreadyMountedError,
+    UnexpectedForwardRefError,
+)
 from plug_in.types.proto.core_host import CoreHostProtocol
 from plug_in.types.proto.core_plugin import CorePluginProtocol
 from plug_in.types.proto.core_registry import CoreRegistryProtocol
+from plug_in.types.proto.observer import ObserverProtocol
+from plug_in.types.proto.tracing import TracerProtocol
 from plug_in.types.proto.resolver import ParameterResolverProtocol
 from plug_in.types.proto.router import RouterProtocol
 from plug_in.types.proto.joint import Joint
 from plug_in.types.alias import Manageable
+from plug_in.ioc.compiler import CompiledRoute, compile_route
+from plug_in.ioc.enum import AsyncResolutionMode
 from plug_in.ioc.resolver import ParameterResolver
+from plug_in.ioc.tracing import traced_route
 
 
 class Router(RouterProtocol):
+    """
+    Args:
+        async_resolution: Default [.AsyncResolutionMode][] for routes managed by
+            this router. Can be overridden per route in [.Router.manage][].
+        compiled_routes: If `True`, routes are compiled by default. See
+            [.Router.manage][] for details. Defaults to `False`.
+        observer: Receives provider, finalization and bind events of routes
+            managed by this router (see [plug_in.core.observe.Observer][]).
+            Compiled routes report provider events only.
+        tracer: Records every call of managed routes as a span, with nested
+            spans of their hosted parameters (see [plug_in.ioc.tracing.Tracer][]).
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        async_resolution: AsyncResolutionMode = AsyncResolutionMode.SEQUENTIAL,
+        compiled_routes: bool = False,
+        observer: ObserverProtocol | None = None,
+        tracer: TracerProtocol | None = None,
+    ) -> None:
         self._reg: CoreRegistryProtocol | None = None
-        self._routes = {}
+        # Generation of mounted registry, read by routes on every call
+        self._generation: int | None = None
+        self._mount_lock = threading.Lock()
+        self._routes: dict[Callable, ParameterResolver] = {}
+        self._compiled_routes: dict[Callable, CompiledRoute] = {}
+        self._async_resolution = async_resolution
+        self._compile_by_default = compiled_routes
+        self._observer = observer
+        self._tracer = tracer
 
     def mount(self, registry: CoreRegistryProtocol) -> None:
         """
         Raises:
             [plug_in.exc.RouterAlreadyMountedError][]: ...
         """
-        if self._reg is not None:
-            raise RouterAlreadyMountedError(
-                f"This router {self} is already mounted ({self._reg})"
-            )
+        with self._mount_lock:
+            if self._reg is not None:
+                raise RouterAlreadyMountedError(
+                    f"This router {self} is already mounted ({self._reg}). "
+                    "Use `remount` to replace mounted registry."
+                )
+
+            self._reg = registry
+            self._generation = registry.generation
+
+    def remount(self, registry: CoreRegistryProtocol) -> CoreRegistryProtocol | None:
+        """
+        Atomically replace mounted registry (or mount, when no registry is
+        mounted yet). Calls in progress finish with plugins of the previous
+        registry, and new calls use plugins of the new one.
+
+        Plugins of all routes are looked up in the new registry, and their call
+        plans are built in bulk before the swap, so first calls after remount do
+        not pay for it. Routes that cannot be prepared yet (e.g. forward
+        references that are not resolvable) look plugins up on their next call.
+
+        Use it together with [plug_in.core.registry.CoreRegistry.overlay][] to
+        swap plugin sets without stopping traffic.
+
+        Returns:
+            Previously mounted registry, or `None`.
+
+        Raises:
+            [plug_in.exc.SyncPluginExpected][]: When new registry provides async
+                plugin for synchronous route. Mounted registry is not changed.
+        """
+        routes = list(self._routes.items())
+        prepared = [
+            (callable, resolver, resolver.prepare_rebind(registry.plugin))
+            for callable, resolver in routes
+        ]
+
+        with self._mount_lock:
+            previous = self._reg
+            self._reg = registry
+            self._generation = registry.generation
+
+            for callable, resolver, state in prepared:
+                with resolver.lock:
+                    resolver.rebind(state)
+                    self._rebind_compiled_route(callable, resolver)
+
+        return previous
+
+    def remount_in_background(
+        self, registry: CoreRegistryProtocol
+    ) -> Future[CoreRegistryProtocol | None]:
+        """
+        Run [.Router.remount][] in a daemon thread. Currently mounted registry
+        keeps serving calls until new plans are ready.
+
+        Returns:
+            Future of previously mounted registry.
+        """
+        future: Future[CoreRegistryProtocol | None] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.remount(registry))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"remount-{id(self)}", daemon=True).start()
+        return future
 
-        self._reg = registry
+    def _rebind_compiled_route(
+        self, callable: Callable, resolver: ParameterResolver
+    ) -> None:
+        compiled_route = self._compiled_routes.get(callable)
+        if compiled_route is None:
+            return
+
+        if resolver.call_plan is None:
+            compiled_route.unbind()
+        else:
+            compiled_route.bind(resolver.call_plan)
 
     def get_registry(self) -> CoreRegistryProtocol:
         """
@@ -40,6 +158,12 @@ class Router(RouterProtocol):
 
         return self._reg
 
+    def get_generation(self) -> int | None:
+        """
+        Generation of mounted registry, or `None` if router is not mounted.
+        """
+        return self._generation
+
     def resolve[
         JointType: Joint
     ](self, host: CoreHostProtocol[JointType]) -> JointType | Awaitable[JointType]:
@@ -53,68 +177,157 @@ class Router(RouterProtocol):
         reg = self.get_registry()
         return reg.resolve(host)
 
+    def resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Resolve many hosts at once via mounted registry. See
+        [plug_in.core.registry.CoreRegistry.resolve_many][].
+
+        Raises:
+            [plug_in.exc.MissingMountError][]: ...
+            [plug_in.exc.MissingPluginError][]: ...
+        """
+        return self.get_registry().resolve_many(hosts)
+
+    async def async_resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Resolve many hosts at once into provided values via mounted registry.
+        See [plug_in.core.registry.CoreRegistry.async_resolve_many][].
+
+        Raises:
+            [plug_in.exc.MissingMountError][]: ...
+            [plug_in.exc.MissingPluginError][]: ...
+        """
+        return await self.get_registry().async_resolve_many(hosts)
+
     def plugin_lookup(self, host: CoreHostProtocol) -> CorePluginProtocol:
         return self.get_registry().plugin(host)
 
     @overload
     def _callable_route_factory[
         R, **P
-    ](self, callable: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]: ...
+    ](
+        self,
+        callable: Callable[P, Awaitable[R]],
+        async_resolution: AsyncResolutionMode | None = None,
+        compiled: bool | None = None,
+        timeout: float | None = None,
+    ) -> Callable[P, Awaitable[R]]: ...
 
     @overload
     def _callable_route_factory[
         R, **P
-    ](self, callable: Callable[P, R]) -> Callable[P, R]: ...
+    ](
+        self,
+        callable: Callable[P, R],
+        async_resolution: AsyncResolutionMode | None = None,
+        compiled: bool | None = None,
+        timeout: float | None = None,
+    ) -> Callable[P, R]: ...
 
     def _callable_route_factory[
         R, **P
-    ](self, callable: Callable[P, R] | Callable[P, Awaitable[R]]) -> (
-        Callable[P, R] | Callable[P, Awaitable[R]]
-    ):
+    ](
+        self,
+        callable: Callable[P, R] | Callable[P, Awaitable[R]],
+        async_resolution: AsyncResolutionMode | None = None,
+        compiled: bool | None = None,
+        timeout: float | None = None,
+    ) -> (Callable[P, R] | Callable[P, Awaitable[R]]):
         """
         Create new callable that will have default values substituted by a plugin
         resolver.
 
         Args:
             callable: Subject callable.
+            async_resolution: Route specific [.AsyncResolutionMode][]. When `None`,
+                router default is used.
+            compiled: Whether to generate specialized wrapper for this route. When
+                `None`, router default is used.
+            timeout: Time limit in seconds for resolution of hosted parameters of
+                async callable, see [.ParameterResolver][].
 
         Returns:
             New callable with substituted `CoreHost` defaults. Nothing but default
             values to parameters change in new callable signature.
         """
+        use_compiled = compiled if compiled is not None else self._compile_by_default
+        resolution_mode = (
+            async_resolution if async_resolution is not None else self._async_resolution
+        )
+
+        # Reused only when managed with the same options
+        cached = self._compiled_routes.get(callable) if use_compiled else None
+        if (
+            cached is not None
+            and cached.resolver.async_resolution == resolution_mode
+            and cached.resolver.timeout == timeout
+        ):
+            return self._traced(callable, cached.function)
+
+        # Compiled route follows the latest resolver of its callable
+        self._compiled_routes.pop(callable, None)
+
         # Keep parameter resolver
         param_resolver = ParameterResolver(
-            callable=callable, plugin_lookup=self.plugin_lookup
+            callable=callable,
+            plugin_lookup=self.plugin_lookup,
+            generation=self.get_generation,
+            async_resolution=resolution_mode,
+            timeout=timeout,
+            observer=self._observer,
+            tracer=self._tracer,
         )
 
         self._routes[callable] = param_resolver
 
-        if param_resolver.should_use_async_bind:
-            # Create async wrapper for callable
-            @wraps(callable)
-            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                # Get arg bind
-                bind = await param_resolver.get_one_time_bind_async(*args, **kwargs)
-
-                # Proceed with call
-                return await cast(Callable[P, Awaitable[R]], callable)(
-                    *bind.args, **bind.kwargs
-                )
+        if use_compiled:
+            compiled_route = compile_route(callable, param_resolver)
+            if compiled_route is not None:
+                self._compiled_routes[callable] = compiled_route
+                return self._traced(callable, compiled_route.function)
 
-            return async_wrapper
+        if param_resolver.should_use_async_bind:
+            return self._traced(
+                callable,
+                _async_route_wrapper(
+                    cast(Callable[P, Awaitable[R]], callable), param_resolver
+                ),
+            )
         else:
-            # Create wrapper for callable
-            @wraps(callable)
-            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                # Get arg bind
-                bind = param_resolver.get_one_time_bind_sync(*args, **kwargs)
+            return self._traced(
+                callable,
+                _sync_route_wrapper(cast(Callable[P, R], callable), param_resolver),
+            )
 
-                # Proceed with call
-                return cast(Callable[P, R], callable)(*bind.args, **bind.kwargs)
+    def _traced[T: Callable](self, callable: Callable, route: T) -> T:
+        if self._tracer is None:
+            return route
 
-            return wrapper
+        return cast(
+            T,
+            traced_route(
+                self._tracer, callable, route, inspect.iscoroutinefunction(route)
+            ),
+        )
 
-    def manage[T: Manageable](self) -> Callable[[T], T]:
+    def manage[
+        T: Manageable
+    ](
+        self,
+        async_resolution: AsyncResolutionMode | None = None,
+        compiled: bool | None = None,
+        timeout: float | None = None,
+    ) -> Callable[[T], T]:
         """
         Decorator maker for marking callables to be managed by plug_in IoC system.
 
@@ -124,16 +337,33 @@ class Router(RouterProtocol):
         modification is applied to the marked callable.
 
         Args:
-            eager_forward_resolve: Set this to `False` when You are using hosts
-                with subjects being generic classes parametrized with forward
-                references. Defaults to `True`. Default behavior slightly improves
-                call-time performance.
+            async_resolution: How async plugins are resolved for this route.
+                When `None` (default), router default mode is used.
+            compiled: When `True`, a specialized wrapper with the same parameter
+                list as decorated callable is generated, and hosted parameters
+                are resolved without generic `*args, **kwargs` handling. Objects
+                that cannot be expressed this way (builtins, classes, callable
+                objects) silently fall back to the generic wrapper. When `None`
+                (default), router default is used.
+            timeout: Time limit in seconds for resolution of hosted parameters
+                of async callable. Providers awaited by it get the deadline
+                (see [plug_in.core.deadline.deadline][]). Exceeding it raises
+                [plug_in.exc.ProviderTimeoutError][]. `None` (default) means no
+                limit.
 
         Returns:
             Decorator that makes your callable a manageable entity
 
         """
-        return cast(Callable[[T], T], self._callable_route_factory)
+        return cast(
+            Callable[[T], T],
+            partial(
+                self._callable_route_factory,
+                async_resolution=async_resolution,
+                compiled=compiled,
+                timeout=timeout,
+            ),
+        )
 
     def get_route_resolver[
         **CallParams
@@ -152,3 +382,94 @@ class Router(RouterProtocol):
             raise MissingRouteError(
                 f"Route for {callable=} is not managed by this router"
             ) from e
+
+    def get_route_dependencies(
+        self, callable: Callable[..., Any]
+    ) -> tuple[CoreHostProtocol[Any], ...]:
+        """
+        Return hosts required by a managed callable. Managed wrapper returned
+        by [.Router.manage][] can be passed as well, e.g. a plugin provider.
+
+        Returns:
+            Hosts of hosted parameters, or empty tuple when callable is not
+            managed by this router or its annotations cannot be evaluated yet.
+        """
+        # Managed wrappers keep original callable under `__wrapped__`
+        try:
+            resolver = self._routes[inspect.unwrap(callable)]
+        except (KeyError, TypeError):
+            return ()
+
+        try:
+            return resolver.get_dependencies()
+        except UnexpectedForwardRefError as e:
+            logging.debug("Dependencies of %s are not known yet: %s", callable, e)
+            return ()
+
+
+def _async_route_wrapper[
+    R, **P
+](
+    callable: Callable[P, Awaitable[R]], param_resolver: ParameterResolver[P]
+) -> Callable[P, Awaitable[R]]:
+    """
+    Generic wrapper of async managed callable.
+    """
+    # Cast outside of the wrapper, typing subscription is not free
+    async_callable = cast(Callable[..., Awaitable[R]], callable)
+
+    @wraps(callable)
+    async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if param_resolver.needs_lease():
+            # Pooled values are returned when the call finishes
+            token = open_lease()
+            try:
+                call_args, call_kwargs = (
+                    await param_resolver.get_one_time_call_args_async(*args, **kwargs)
+                )
+                return await async_callable(*call_args, **call_kwargs)
+            finally:
+                await aclose_lease(token)
+
+        # Get call arguments
+        call_args, call_kwargs = await param_resolver.get_one_time_call_args_async(
+            *args, **kwargs
+        )
+
+        # Proceed with call
+        return await async_callable(*call_args, **call_kwargs)
+
+    return async_wrapper
+
+
+def _sync_route_wrapper[
+    R, **P
+](callable: Callable[P, R], param_resolver: ParameterResolver[P]) -> Callable[P, R]:
+    """
+    Generic wrapper of sync managed callable.
+    """
+    # Cast outside of the wrapper, typing subscription is not free
+    sync_callable = cast(Callable[..., R], callable)
+
+    @wraps(callable)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if param_resolver.needs_lease():
+            # Pooled values are returned when the call finishes
+            token = open_lease()
+            try:
+                call_args, call_kwargs = param_resolver.get_one_time_call_args_sync(
+                    *args, **kwargs
+                )
+                return sync_callable(*call_args, **call_kwargs)
+            finally:
+                close_lease(token)
+
+        # Get call arguments
+        call_args, call_kwargs = param_resolver.get_one_time_call_args_sync(
+            *args, **kwargs
+        )
+
+        # Proceed with call
+        return sync_callable(*call_args, **call_kwargs)
+
+    return wrapper
@@ -0,0 +1,469 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import wraps
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Iterator, Literal, Mapping
+
+from plug_in.types.proto.core_host import CoreHostProtocol
+from plug_in.types.proto.core_plugin import CorePluginProtocol
+from plug_in.types.proto.tracing import (
+    SpanExporterProtocol,
+    SpanProtocol,
+    TracerProtocol,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Span(SpanProtocol):
+    """
+    Finished span, as given to exporters. Start is a wall clock time
+    (`time.time_ns`), duration is measured with `time.perf_counter_ns`.
+    """
+
+    _name: str
+    _category: str
+    _trace_id: str
+    _span_id: str
+    _parent_id: str | None
+    _start_ns: int
+    _duration_ns: int
+    _thread_id: int
+    _attributes: Mapping[str, Any] = field(default_factory=dict)
+    _error: str | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def category(self) -> str:
+        return self._category
+
+    @property
+    def trace_id(self) -> str:
+        return self._trace_id
+
+    @property
+    def span_id(self) -> str:
+        return self._span_id
+
+    @property
+    def parent_id(self) -> str | None:
+        return self._parent_id
+
+    @property
+    def start_ns(self) -> int:
+        return self._start_ns
+
+    @property
+    def duration_ns(self) -> int:
+        return self._duration_ns
+
+    @property
+    def thread_id(self) -> int:
+        return self._thread_id
+
+    @property
+    def attributes(self) -> Mapping[str, Any]:
+        return self._attributes
+
+    @property
+    def error(self) -> str | None:
+        return self._error
+
+
+class _OpenSpan:
+    """
+    Span in progress, current one is kept in a context variable.
+    """
+
+    __slots__ = (
+        "name",
+        "category",
+        "attributes",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "started",
+        "token",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        attributes: Mapping[str, Any] | None,
+        trace_id: str,
+        parent_id: str | None,
+    ) -> None:
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.started = time.perf_counter_ns()
+        self.token: Token[_OpenSpan | Literal[False] | None] | None = None
+
+    def finish(self, error: BaseException | None) -> Span:
+        return Span(
+            _name=self.name,
+            _category=self.category,
+            _trace_id=self.trace_id,
+            _span_id=self.span_id,
+            _parent_id=self.parent_id,
+            _start_ns=self.start_ns,
+            _duration_ns=time.perf_counter_ns() - self.started,
+            _thread_id=threading.get_ident(),
+            _attributes=dict(self.attributes) if self.attributes else {},
+            _error=repr(error) if error is not None else None,
+        )
+
+
+# Span in progress, or `False` within a trace that was not sampled
+_current_span: ContextVar[_OpenSpan | Literal[False] | None] = ContextVar(
+    "plug_in_current_span", default=None
+)
+
+
+class Tracer(TracerProtocol):
+    """
+    Records nested spans and hands finished ones to an exporter. Parent of a
+    new span is the span in progress in current context, so spans opened in
+    tasks and threads started with a copied context nest as well.
+
+    Sampling decision is made once per trace, when its root span is started.
+    Spans within a trace that was not sampled are not recorded at all, so
+    tracing can stay enabled with a low `sample_rate`.
+
+    Args:
+        exporter: Receives finished spans.
+        sample_rate: Fraction of traces that are recorded, within `[0, 1]`.
+
+    Raises:
+        ValueError: When `sample_rate` is out of range.
+    """
+
+    def __init__(
+        self, exporter: SpanExporterProtocol, sample_rate: float = 1.0
+    ) -> None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"Sample rate must be within [0, 1], got {sample_rate}")
+
+        self._exporter = exporter
+        self._sample_rate = sample_rate
+
+    @property
+    def exporter(self) -> SpanExporterProtocol:
+        return self._exporter
+
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+
+    def start_span(
+        self,
+        name: str,
+        category: str,
+        attributes: Mapping[str, Any] | None = None,
+    ) -> Any:
+        """
+        Start a span as a child of the current one, and make it current. Pass
+        returned handle to [.Tracer.end_span][] in the same context.
+        """
+        parent = _current_span.get()
+        if parent is False:
+            return None
+
+        if parent is None:
+            if random.random() >= self._sample_rate:
+                return _current_span.set(False)
+            span = _OpenSpan(
+                name, category, attributes, f"{random.getrandbits(128):032x}", None
+            )
+        else:
+            span = _OpenSpan(
+                name, category, attributes, parent.trace_id, parent.span_id
+            )
+
+        span.token = _current_span.set(span)
+        return span
+
+    def end_span(self, handle: Any, error: BaseException | None = None) -> None:
+        """
+        Finish span started by [.Tracer.start_span][] and export it.
+        """
+        if handle is None:
+            return
+
+        if isinstance(handle, Token):
+            # Root of a trace that was not sampled
+            _current_span.reset(handle)
+            return
+
+        _current_span.reset(handle.token)
+        self._exporter.export(handle.finish(error))
+
+    @contextmanager
+    def span(
+        self, name: str, category: str = "custom", **attributes: Any
+    ) -> Iterator[None]:
+        """
+        Context manager recording a span, e.g. the root span of a request.
+        """
+        handle = self.start_span(name, category, attributes)
+        try:
+            yield
+        except BaseException as e:
+            self.end_span(handle, e)
+            raise
+
+        self.end_span(handle)
+
+
+def _host_label(host: CoreHostProtocol[Any]) -> str:
+    subject = host.subject
+    label = getattr(subject, "__qualname__", None) or repr(subject)
+    if host.marks:
+        label += f"[{', '.join(map(repr, host.marks))}]"
+    return label
+
+
+def traced_provider(
+    tracer: TracerProtocol,
+    name: str,
+    plugin: CorePluginProtocol[Any, Any],
+    provide: Callable[[], Any],
+    is_async: bool,
+) -> Callable[[], Any]:
+    """
+    Wrap provider of hosted parameter `name`, so every call is recorded as
+    a `param` span. Managed callables invoked by the provider nest in it.
+    """
+    host = _host_label(plugin.host)
+    span_name = f"{name}: {host}"
+    attributes = {"param": name, "host": host, "policy": str(plugin.policy)}
+
+    if is_async:
+        async_provide: Callable[[], Awaitable[Any]] = provide
+
+        async def trace(awaitable: Awaitable[Any]) -> Any:
+            handle = tracer.start_span(span_name, "param", attributes)
+            try:
+                value = await awaitable
+            except BaseException as e:
+                tracer.end_span(handle, e)
+                raise
+
+            tracer.end_span(handle)
+            return value
+
+        def traced_async() -> Awaitable[Any]:
+            # Provider is called at request time, as some providers depend on
+            # the task calling them. Span is opened where it is awaited.
+            return trace(async_provide())
+
+        return traced_async
+
+    def traced() -> Any:
+        handle = tracer.start_span(span_name, "param", attributes)
+        try:
+            value = provide()
+        except BaseException as e:
+            tracer.end_span(handle, e)
+            raise
+
+        tracer.end_span(handle)
+        return value
+
+    return traced
+
+
+def traced_route(
+    tracer: TracerProtocol,
+    callable: Callable[..., Any],
+    route: Callable[..., Any],
+    is_async: bool,
+) -> Callable[..., Any]:
+    """
+    Wrap managed `route` of `callable`, so every call is recorded as a `route`
+    span, parent of spans of its hosted parameters.
+    """
+    span_name = getattr(callable, "__qualname__", None) or repr(callable)
+
+    if is_async:
+
+        @wraps(callable)
+        async def traced_async(*args: Any, **kwargs: Any) -> Any:
+            handle = tracer.start_span(span_name, "route")
+            try:
+                result = await route(*args, **kwargs)
+            except BaseException as e:
+                tracer.end_span(handle, e)
+                raise
+
+            tracer.end_span(handle)
+            return result
+
+        return traced_async
+
+    @wraps(callable)
+    def traced(*args: Any, **kwargs: Any) -> Any:
+        handle = tracer.start_span(span_name, "route")
+        try:
+            result = route(*args, **kwargs)
+        except BaseException as e:
+            tracer.end_span(handle, e)
+            raise
+
+        tracer.end_span(handle)
+        return result
+
+    return traced
+
+
+class FileSpanExporter(ABC, SpanExporterProtocol):
+    """
+    Base of exporters writing spans into a local file. Spans are buffered and
+    written every `buffer_size` spans, on [.FileSpanExporter.flush][] and on
+    [.FileSpanExporter.close][]. Thread-safe.
+
+    Args:
+        path: Output file, truncated when exporter writes first spans.
+        buffer_size: Number of spans kept in memory before they are written.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], buffer_size: int = 256) -> None:
+        self._path = path
+        self._buffer_size = buffer_size
+        self._buffer: list[str] = []
+        self._lock = threading.Lock()
+        self._file: Any = None
+        self._closed = False
+
+    @abstractmethod
+    def _format(self, span: SpanProtocol) -> str: ...
+
+    def _header(self) -> str:
+        return ""
+
+    def _separator(self) -> str:
+        return ""
+
+    def _footer(self) -> str:
+        return ""
+
+    def export(self, span: SpanProtocol) -> None:
+        line = self._format(span)
+        with self._lock:
+            if self._closed:
+                return
+            self._buffer.append(line)
+            if len(self._buffer) >= self._buffer_size:
+                self._write()
+
+    def _write(self) -> None:
+        """
+        Write buffered spans. Caller holds the lock.
+        """
+        if self._file is None:
+            self._file = open(self._path, "w", encoding="utf-8")
+            self._file.write(self._header())
+        elif self._buffer:
+            self._file.write(self._separator())
+
+        self._file.write(self._separator().join(self._buffer))
+        self._file.flush()
+        self._buffer.clear()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._closed and self._buffer:
+                self._write()
+
+    def close(self) -> None:
+        """
+        Write remaining spans and close the file. Later spans are dropped.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._write()
+            self._file.write(self._footer())
+            self._file.close()
+            self._closed = True
+
+
+class JsonLinesSpanExporter(FileSpanExporter):
+    """
+    Writes every span as a single JSON object line.
+    """
+
+    def _format(self, span: SpanProtocol) -> str:
+        return (
+            json.dumps(
+                {
+                    "name": span.name,
+                    "category": span.category,
+                    "trace_id": span.trace_id,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "start_ns": span.start_ns,
+                    "duration_ns": span.duration_ns,
+                    "thread_id": span.thread_id,
+                    "attributes": span.attributes,
+                    "error": span.error,
+                },
+                default=str,
+            )
+            + "\n"
+        )
+
+
+class ChromeTraceSpanExporter(FileSpanExporter):
+    """
+    Writes spans as complete events of Chrome trace event format (JSON array
+    format), which can be opened in `chrome://tracing` or Perfetto UI.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], buffer_size: int = 256) -> None:
+        super().__init__(path, buffer_size)
+        self._pid = os.getpid()
+
+    def _format(self, span: SpanProtocol) -> str:
+        return json.dumps(
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": self._pid,
+                "tid": span.thread_id,
+                "args": {
+                    **span.attributes,
+                    "trace_id": span.trace_id,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "error": span.error,
+                },
+            },
+            default=str,
+        )
+
+    def _header(self) -> str:
+        return "[\n"
+
+    def _separator(self) -> str:
+        return ",\n"
+
+    def _footer(self) -> str:
+        return "\n]\n"
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Sequence
+
+
+async def _cancel_all(tasks: Sequence[asyncio.Future[Any]]) -> None:
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def gather_or_cancel(
+    providers: Sequence[Callable[[], Awaitable[Any]]],
+) -> list[Any]:
+    """
+    Call and await all given providers concurrently. Results are returned in the
+    order of providers.
+
+    When any of the providers fails, all remaining ones are cancelled and the
+    exception of the first failed provider (in the order of `providers`) is
+    raised. When the caller gets cancelled, all providers are cancelled too.
+    """
+    if not providers:
+        # `asyncio.wait` rejects empty sets
+        return []
+
+    tasks = [asyncio.ensure_future(provide()) for provide in providers]
+
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    except BaseException:
+        await _cancel_all(tasks)
+        raise
+
+    for task in tasks:
+        # Deterministic error propagation - first failed in providers order
+        if task.done() and not task.cancelled() and (exc := task.exception()):
+            await _cancel_all(tasks)
+            raise exc
+
+    return [task.result() for task in tasks]
@@ -81,3 +81,19 @@ def is_coroutine_callable(obj: Any) -> TypeGuard[Callable[..., Awaitable[Any]]]:
     return asyncio.iscoroutinefunction(obj) or (
         callable(obj) and asyncio.iscoroutinefunction(obj.__call__)  # type: ignore
     )
+
+
+def is_generator_callable(obj: Any) -> bool:
+    """
+    Returns True if given argument is a generator function, possibly wrapped
+    (e.g. by `contextlib.contextmanager` or a managed route wrapper).
+    """
+    return callable(obj) and inspect.isgeneratorfunction(inspect.unwrap(obj))
+
+
+def is_async_generator_callable(obj: Any) -> bool:
+    """
+    Returns True if given argument is an async generator function, possibly
+    wrapped (e.g. by `contextlib.asynccontextmanager` or a managed route wrapper).
+    """
+    return callable(obj) and inspect.isasyncgenfunction(inspect.unwrap(obj))
@@ -3,6 +3,7 @@ from typing import Hashable, Protocol
 
 
 class CoreHostProtocol[T](Protocol):
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -4,6 +4,7 @@ from plug_in.types.proto.pluggable import Pluggable
 
 
 class CorePlugProtocol[T: Pluggable](Protocol):
+    __slots__ = ()
 
     @property
     @abstractmethod
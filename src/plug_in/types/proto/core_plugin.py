@@ -1,12 +1,14 @@
 from abc import abstractmethod
-from typing import Awaitable, Callable, Protocol, Self
+from typing import Any, Awaitable, Callable, Protocol, Self, runtime_checkable
 
+from plug_in.core.enum import PluginPolicy
 from plug_in.types.proto.core_host import CoreHostProtocol
 from plug_in.types.proto.core_plug import CorePlugProtocol
 from plug_in.types.proto.joint import Joint
 
 
 class BindingCorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -20,6 +22,10 @@ class BindingCorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
     @abstractmethod
     def metadata(self) -> MetaDataType: ...
 
+    @property
+    @abstractmethod
+    def policy(self) -> PluginPolicy: ...
+
     @abstractmethod
     def provide(self) -> JointType: ...
 
@@ -35,6 +41,7 @@ class BindingCorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
 # TODO: Consider allowing for passing host data into
 #   providing plug callable.
 class ProvidingCorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -48,6 +55,10 @@ class ProvidingCorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
     @abstractmethod
     def metadata(self) -> MetaDataType: ...
 
+    @property
+    @abstractmethod
+    def policy(self) -> PluginPolicy: ...
+
     @abstractmethod
     def provide(self) -> JointType: ...
 
@@ -61,6 +72,8 @@ class ProvidingCorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
 
 
 class AsyncCorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def plug(self) -> CorePlugProtocol[Callable[[], Awaitable[JointType]]]: ...
@@ -73,6 +86,10 @@ class AsyncCorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
     @abstractmethod
     def metadata(self) -> MetaDataType: ...
 
+    @property
+    @abstractmethod
+    def policy(self) -> PluginPolicy: ...
+
     @abstractmethod
     def provide(self) -> Awaitable[JointType]: ...
 
@@ -89,11 +106,16 @@ class AsyncCorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
 
 
 class CorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
+    __slots__ = ()
 
     @property
     @abstractmethod
     def metadata(self) -> MetaDataType: ...
 
+    @property
+    @abstractmethod
+    def policy(self) -> PluginPolicy: ...
+
     @abstractmethod
     def provide(self) -> JointType | Awaitable[JointType]: ...
 
@@ -121,3 +143,53 @@ class CorePluginProtocol[JointType: Joint, MetaDataType](Protocol):
     # TODO: Consider adding verify_joint method
     # @abstractmethod
     # def verify_joint(self) -> bool: ...
+
+
+@runtime_checkable
+class ClosingCorePluginProtocol(Protocol):
+    """
+    Plugin holding a resource that has to be torn down synchronously.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+@runtime_checkable
+class AsyncClosingCorePluginProtocol(Protocol):
+    """
+    Plugin holding a resource that has to be torn down asynchronously.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def aclose(self) -> None: ...
+
+
+@runtime_checkable
+class OffloadingCorePluginProtocol(Protocol):
+    """
+    Sync plugin which provider blocks. Async callers resolve it with `offload`,
+    which does not block the event loop.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def offload(self) -> Any: ...
+
+
+@runtime_checkable
+class HoldingCorePluginProtocol(Protocol):
+    """
+    Plugin keeping provided value between requests, e.g. lazy plugin.
+    """
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def is_provided(self) -> bool: ...
@@ -1,14 +1,36 @@
 from abc import abstractmethod
-from typing import Any, Awaitable, Protocol
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Protocol,
+    Self,
+)
 from plug_in.types.proto.core_host import CoreHostProtocol
 from plug_in.types.proto.core_plugin import (
     CorePluginProtocol,
 )
 from plug_in.types.proto.joint import Joint
 
+if TYPE_CHECKING:
+    from plug_in.core.graph import DependencyGraph
+    from plug_in.core.warmup import WarmUpReport
+
 
 class CoreRegistryProtocol(Protocol):
 
+    @property
+    @abstractmethod
+    def generation(self) -> int:
+        """
+        Process-unique id of registry, changes whenever plugins may change.
+        """
+        ...
+
     @abstractmethod
     def resolve[
         JointType: Joint
@@ -57,6 +79,111 @@ class CoreRegistryProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    def resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Resolve many hosts at once. Mapping of hosts gives dict with the same
+        keys, other iterables give tuple.
+
+        Raises:
+            [plug_in.exc.MissingPluginError][]
+        """
+        ...
+
+    @abstractmethod
+    async def async_resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Resolve many hosts at once into provided values, awaiting async
+        providers concurrently.
+
+        Raises:
+            [plug_in.exc.MissingPluginError][]
+        """
+        ...
+
+    @abstractmethod
+    def overlay(self, plugins: Iterable[CorePluginProtocol[Any, Any]]) -> Self:
+        """
+        Create child registry with given plugins overriding plugins of this one.
+
+        Raises:
+            [plug_in.exc.AmbiguousHostError][]
+        """
+        ...
+
+    @abstractmethod
+    def dependency_graph(
+        self,
+        route_dependencies: Callable[
+            [Callable[..., Any]], Iterable[CoreHostProtocol[Any]]
+        ],
+    ) -> "DependencyGraph":
+        """
+        Raises:
+            [plug_in.exc.DependencyCycleError][]
+        """
+        ...
+
+    @abstractmethod
+    def close(self, graph: "DependencyGraph | None" = None) -> None:
+        """
+        Tear down resources of synchronous plugins.
+        """
+        ...
+
+    @abstractmethod
+    async def aclose(self, graph: "DependencyGraph | None" = None) -> None:
+        """
+        Tear down resources of all plugins.
+        """
+        ...
+
+    @abstractmethod
+    async def async_warm_up(
+        self,
+        hosts: Iterable[CoreHostProtocol[Any]] | None = None,
+        metadata_filter: Callable[[Any], bool] | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        raise_on_error: bool = True,
+        graph: "DependencyGraph | None" = None,
+    ) -> "WarmUpReport":
+        """
+        Initialize lazy plugins ahead of time.
+
+        Raises:
+            [plug_in.exc.WarmUpError][]
+        """
+        ...
+
+    @abstractmethod
+    def warm_up(
+        self,
+        hosts: Iterable[CoreHostProtocol[Any]] | None = None,
+        metadata_filter: Callable[[Any], bool] | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        raise_on_error: bool = True,
+        graph: "DependencyGraph | None" = None,
+    ) -> "WarmUpReport":
+        """
+        Initialize lazy plugins ahead of time.
+
+        Raises:
+            [plug_in.exc.WarmUpError][]
+        """
+        ...
+
 
 class AsyncCoreRegistryProtocol(CoreRegistryProtocol, Protocol):
 
@@ -70,3 +197,16 @@ class AsyncCoreRegistryProtocol(CoreRegistryProtocol, Protocol):
 
         """
         ...
+
+    @abstractmethod
+    async def resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Raises:
+            [plug_in.exc.MissingPluginError][]
+        """
+        ...
@@ -0,0 +1,32 @@
+from abc import abstractmethod
+from typing import Any, Callable, Protocol
+
+from plug_in.core.enum import PluginPolicy
+from plug_in.types.proto.core_host import CoreHostProtocol
+
+
+class ObserverProtocol(Protocol):
+
+    @abstractmethod
+    def on_provide(
+        self,
+        host: CoreHostProtocol[Any],
+        policy: PluginPolicy,
+        duration: float,
+        is_async: bool,
+        hit: bool | None,
+        error: BaseException | None,
+    ) -> None: ...
+
+    @abstractmethod
+    def on_route_finalized(
+        self, route: Callable[..., Any], duration: float
+    ) -> None: ...
+
+    @abstractmethod
+    def on_route_failed(
+        self, route: Callable[..., Any], error: BaseException
+    ) -> None: ...
+
+    @abstractmethod
+    def on_bind(self, route: Callable[..., Any], duration: float) -> None: ...
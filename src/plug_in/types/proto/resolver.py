@@ -1,8 +1,13 @@
 from abc import abstractmethod
 import inspect
-from typing import Protocol
+from typing import Any, Callable, Hashable, Protocol
 
-from plug_in.types.proto.parameter import ParamsStateMachineProtocol
+from plug_in.types.proto.core_host import CoreHostProtocol
+from plug_in.types.proto.core_plugin import CorePluginProtocol
+from plug_in.types.proto.parameter import (
+    FinalParamsProtocol,
+    ParamsStateMachineProtocol,
+)
 
 
 class ParameterResolverProtocol[**CallParams](Protocol):
@@ -18,6 +23,40 @@ class ParameterResolverProtocol[**CallParams](Protocol):
     @abstractmethod
     def should_use_async_bind(self) -> bool: ...
 
+    @abstractmethod
+    def rewind(self) -> None: ...
+
+    @abstractmethod
+    def needs_lease(self) -> bool: ...
+
+    @property
+    @abstractmethod
+    def generation(self) -> Hashable: ...
+
+    @abstractmethod
+    def current_generation(self) -> Hashable: ...
+
+    @abstractmethod
+    def prepare_rebind(
+        self, plugin_lookup: Callable[[CoreHostProtocol], CorePluginProtocol]
+    ) -> FinalParamsProtocol | None:
+        """
+        Raises:
+            [plug_in.exc.SyncPluginExpected][]: ...
+        """
+        ...
+
+    @abstractmethod
+    def rebind(self, prepared: Any) -> None: ...
+
+    @abstractmethod
+    def get_dependencies(self) -> tuple[CoreHostProtocol[Any], ...]:
+        """
+        Raises:
+            [plug_in.exc.UnexpectedForwardRefError][]: ...
+        """
+        ...
+
     def get_one_time_bind_sync(
         self, *args: CallParams.args, **kwargs: CallParams.kwargs
     ) -> inspect.BoundArguments: ...
@@ -25,3 +64,11 @@ class ParameterResolverProtocol[**CallParams](Protocol):
     async def get_one_time_bind_async(
         self, *args: CallParams.args, **kwargs: CallParams.kwargs
     ) -> inspect.BoundArguments: ...
+
+    def get_one_time_call_args_sync(
+        self, *args: CallParams.args, **kwargs: CallParams.kwargs
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]: ...
+
+    async def get_one_time_call_args_async(
+        self, *args: CallParams.args, **kwargs: CallParams.kwargs
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]: ...
@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from typing import Any, Callable, Protocol
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Iterable, Mapping, Protocol
 
 from plug_in.types.proto.core_host import CoreHostProtocol
 from plug_in.types.proto.core_registry import CoreRegistryProtocol
@@ -18,6 +19,24 @@ class RouterProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    def remount(self, registry: CoreRegistryProtocol) -> CoreRegistryProtocol | None:
+        """
+        Atomically replace mounted registry. Returns previously mounted one.
+
+        Raises:
+            [plug_in.exc.SyncPluginExpected][]: ...
+        """
+        ...
+
+    @abstractmethod
+    def remount_in_background(
+        self, registry: CoreRegistryProtocol
+    ) -> Future[CoreRegistryProtocol | None]: ...
+
+    @abstractmethod
+    def get_generation(self) -> int | None: ...
+
     @abstractmethod
     def get_registry(self) -> CoreRegistryProtocol:
         """
@@ -35,6 +54,36 @@ class RouterProtocol(Protocol):
             [plug_in.exc.MissingPluginError][]: ...
         """
 
+    @abstractmethod
+    def resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Resolve many hosts at once via mounted registry.
+
+        Raises:
+            [plug_in.exc.MissingMountError][]: ...
+            [plug_in.exc.MissingPluginError][]: ...
+        """
+        ...
+
+    @abstractmethod
+    async def async_resolve_many(
+        self,
+        hosts: (
+            Mapping[Hashable, CoreHostProtocol[Any]] | Iterable[CoreHostProtocol[Any]]
+        ),
+    ) -> dict[Hashable, Any] | tuple[Any, ...]:
+        """
+        Raises:
+            [plug_in.exc.MissingMountError][]: ...
+            [plug_in.exc.MissingPluginError][]: ...
+        """
+        ...
+
     # @abstractmethod
     # def resolve_at(self, callable: Callable, host_mark: HostedMarkProtocol) -> Joint:
     #     """
@@ -58,3 +107,13 @@ class RouterProtocol(Protocol):
     ](self, callable: Callable[CallParams, Any]) -> ParameterResolverProtocol[
         CallParams
     ]: ...
+
+    @abstractmethod
+    def get_route_dependencies(
+        self, callable: Callable[..., Any]
+    ) -> tuple[CoreHostProtocol[Any], ...]:
+        """
+        Return hosts required by a managed callable (or its managed wrapper).
+        Empty for callables not managed by this router.
+        """
+        ...
@@ -0,0 +1,71 @@
+from abc import abstractmethod
+from typing import Any, Mapping, Protocol
+
+
+class SpanProtocol(Protocol):
+
+    @property
+    @abstractmethod
+    def name(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def category(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def trace_id(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def span_id(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def parent_id(self) -> str | None: ...
+
+    @property
+    @abstractmethod
+    def start_ns(self) -> int: ...
+
+    @property
+    @abstractmethod
+    def duration_ns(self) -> int: ...
+
+    @property
+    @abstractmethod
+    def thread_id(self) -> int: ...
+
+    @property
+    @abstractmethod
+    def attributes(self) -> Mapping[str, Any]: ...
+
+    @property
+    @abstractmethod
+    def error(self) -> str | None: ...
+
+
+class SpanExporterProtocol(Protocol):
+
+    @abstractmethod
+    def export(self, span: SpanProtocol) -> None: ...
+
+    @abstractmethod
+    def flush(self) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class TracerProtocol(Protocol):
+
+    @abstractmethod
+    def start_span(
+        self,
+        name: str,
+        category: str,
+        attributes: Mapping[str, Any] | None = None,
+    ) -> Any: ...
+
+    @abstractmethod
+    def end_span(self, handle: Any, error: BaseException | None = None) -> None: ...
@@ -5,6 +5,9 @@ from logging import getLogger
 from pathlib import Path
 import pytest
 
+from plug_in import get_root_config
+from plug_in.core.host import CoreHost
+
 
 logger = getLogger(__name__)
 
@@ -60,6 +63,12 @@ def test_sample_app_1_runs_and_injects(sample_app_package_path):
     assert api.get_user("user1").id == "user1"
     assert api.get_user_session_data("user1") == "some_data"
 
+    base = importlib.import_module("base")
+    graph = get_root_config().dependency_graph()
+    assert graph.order.index(CoreHost(base.Store)) < graph.order.index(
+        CoreHost(base.Session)
+    )
+
     # Destroy import
     del api
     del config
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.host import CoreHost
+from plug_in.core.plug import CorePlug
+from plug_in.core.plugin import create_core_plugin
+from plug_in.core.registry import CoreRegistry
+from plug_in.exc import DependencyCycleError
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.router import Router
+
+
+class Store:
+    pass
+
+
+class Session:
+    def __init__(self, store: Store) -> None:
+        self.store = store
+
+
+class Client:
+    pass
+
+
+@pytest.mark.asyncio
+async def test_registry_derives_dependency_graph_from_routes():
+    router = Router()
+    started: list[str] = []
+
+    @router.manage()
+    async def make_session(store: Store = Hosted()) -> Session:
+        started.append("session")
+        return Session(store)
+
+    async def make_store() -> Store:
+        started.append("store")
+        await asyncio.sleep(0.05)
+        return Store()
+
+    async def make_client() -> Client:
+        started.append("client")
+        return Client()
+
+    reg = CoreRegistry(
+        [
+            create_core_plugin(
+                CorePlug(make_session), CoreHost(Session), PluginPolicy.LAZY_ASYNC
+            ),
+            create_core_plugin(
+                CorePlug(make_store), CoreHost(Store), PluginPolicy.LAZY_ASYNC
+            ),
+            create_core_plugin(
+                CorePlug(make_client), CoreHost(Client), PluginPolicy.LAZY_ASYNC
+            ),
+        ]
+    )
+    router.mount(reg)
+
+    graph = reg.dependency_graph(router.get_route_dependencies)
+
+    assert graph.dependencies(CoreHost(Session)) == (CoreHost(Store),)
+    assert graph.layers == (
+        (CoreHost(Store), CoreHost(Client)),
+        (CoreHost(Session),),
+    )
+
+    report = await reg.async_warm_up(graph=graph)
+
+    assert report.failed == ()
+    # Client does not wait for store, session waits for its own prerequisite
+    assert started == ["store", "client", "session"]
+
+
+def test_registry_detects_dependency_cycle():
+    router = Router()
+
+    @router.manage()
+    def make_session(store: Store = Hosted()) -> Session:
+        return Session(store)
+
+    @router.manage()
+    def make_store(session: Session = Hosted()) -> Store:
+        return Store()
+
+    reg = CoreRegistry(
+        [
+            create_core_plugin(
+                CorePlug(make_session), CoreHost(Session), PluginPolicy.LAZY
+            ),
+            create_core_plugin(
+                CorePlug(make_store), CoreHost(Store), PluginPolicy.LAZY
+            ),
+        ]
+    )
+
+    with pytest.raises(DependencyCycleError):
+        reg.dependency_graph(router.get_route_dependencies)
@@ -1,10 +1,17 @@
+import asyncio
 from dataclasses import dataclass
 
+import pytest
+
+from plug_in.boot.builder.builder import plug
+
 from plug_in.core.enum import PluginPolicy
 from plug_in.core.host import CoreHost
 from plug_in.core.plug import CorePlug
 from plug_in.core.plugin import create_core_plugin
 from plug_in.core.registry import CoreRegistry
+from plug_in.exc import MissingPluginError
+from plug_in.ioc.router import Router
 
 
 def test_registry():
@@ -125,3 +132,125 @@ def test_registry_can_be_hosted():
     assert reg2.sync_resolve(CoreHost(CoreRegistry, ("reg1",))).sync_resolve(
         CoreHost(SampleClass[str])
     ) == SampleClass("abc")
+
+
+def test_registry_overlay_overrides_and_shares_plugins():
+    class Greeting(str):
+        pass
+
+    class Counter:
+        pass
+
+    class Extra:
+        pass
+
+    base = CoreRegistry(
+        [
+            create_core_plugin(
+                CorePlug(Greeting("hello")), CoreHost(Greeting), PluginPolicy.DIRECT
+            ),
+            create_core_plugin(CorePlug(Counter), CoreHost(Counter), PluginPolicy.LAZY),
+        ]
+    )
+    tenant = base.overlay(
+        [
+            create_core_plugin(
+                CorePlug(Greeting("hi")), CoreHost(Greeting), PluginPolicy.DIRECT
+            ),
+            create_core_plugin(CorePlug("extra"), CoreHost(Extra), PluginPolicy.DIRECT),
+        ]
+    )
+
+    assert tenant.parent is base
+    assert tenant.resolve(CoreHost(Greeting)) == "hi"
+    assert tenant.resolve(CoreHost(Extra)) == "extra"
+    assert base.resolve(CoreHost(Greeting)) == "hello"
+
+    # Lazy plugin and its value are shared with parent
+    assert tenant.resolve(CoreHost(Counter)) is base.resolve(CoreHost(Counter))
+
+    # Nested overlays see all layers
+    nested = tenant.overlay([])
+    assert nested.resolve(CoreHost(Greeting)) == "hi"
+    assert nested.resolve(CoreHost(Counter)) is base.resolve(CoreHost(Counter))
+
+
+class Db:
+    pass
+
+
+class Cache:
+    pass
+
+
+class Mailer:
+    pass
+
+
+def test_registry_resolve_many_keeps_order_and_keys():
+    calls: list[str] = []
+
+    def make_db() -> Db:
+        calls.append("db")
+        return Db()
+
+    reg = CoreRegistry(
+        [
+            plug(make_db).into(Db).via_provider("factory"),
+            plug(Cache()).into(Cache).directly(),
+        ]
+    )
+
+    db, cache, other_db = reg.resolve_many(
+        [CoreHost(Db), CoreHost(Cache), CoreHost(Db)]
+    )
+    assert isinstance(db, Db) and isinstance(other_db, Db) and db is not other_db
+    assert isinstance(cache, Cache)
+
+    values = reg.resolve_many({"db": CoreHost(Db), "cache": CoreHost(Cache)})
+    assert list(values) == ["db", "cache"]
+    assert values["cache"] is cache
+
+    # All plugins are looked up before any provider is called
+    calls.clear()
+    with pytest.raises(MissingPluginError):
+        reg.resolve_many([CoreHost(Db), CoreHost(Mailer)])
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_async_resolve_many_awaits_providers_concurrently():
+    started = 0
+    both_started = asyncio.Event()
+
+    async def wait_for_sibling() -> None:
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    async def make_db() -> Db:
+        await wait_for_sibling()
+        return Db()
+
+    async def make_mailer() -> Mailer:
+        await wait_for_sibling()
+        return Mailer()
+
+    reg = CoreRegistry(
+        [
+            plug(make_db).into(Db).via_provider("factory_async"),
+            plug(make_mailer).into(Mailer).via_provider("factory_async"),
+            plug(Cache()).into(Cache).directly(),
+        ]
+    )
+    router = Router()
+    router.mount(reg)
+
+    db, cache, mailer = await router.async_resolve_many(
+        (CoreHost(Db), CoreHost(Cache), CoreHost(Mailer))
+    )
+    assert isinstance(db, Db)
+    assert isinstance(cache, Cache)
+    assert isinstance(mailer, Mailer)
@@ -58,3 +58,104 @@ def test_routing_basic_capabilities():
 
     smd = SomeManagedDataclass("Kupa", SomeClass(2))
     assert smd.run_some() == "KupaKupa"
+
+
+def test_router_remount_swaps_plugins_of_managed_routes():
+    router = Router()
+
+    @router.manage()
+    def greet(name: str, greeting: str = Hosted()) -> str:
+        return f"{greeting} {name}"
+
+    @router.manage(compiled=True)
+    def greet_compiled(name: str, greeting: str = Hosted()) -> str:
+        return f"{greeting} {name}"
+
+    base = CoreRegistry(
+        [create_core_plugin(CorePlug("hello"), CoreHost(str), PluginPolicy.DIRECT)]
+    )
+    router.mount(base)
+
+    assert greet("bob") == "hello bob"
+    assert greet_compiled("bob") == "hello bob"
+
+    tenant = base.overlay(
+        [create_core_plugin(CorePlug("hi"), CoreHost(str), PluginPolicy.DIRECT)]
+    )
+
+    assert router.remount(tenant) is base
+    assert router.get_registry() is tenant
+    assert greet("bob") == "hi bob"
+    assert greet_compiled("bob") == "hi bob"
+
+
+def test_router_remount_prebuilds_call_plans():
+    router = Router()
+
+    @router.manage()
+    def greet(name: str, greeting: str = Hosted()) -> str:
+        return f"{greeting} {name}"
+
+    @router.manage(compiled=True)
+    def greet_compiled(name: str, greeting: str = Hosted()) -> str:
+        return f"{greeting} {name}"
+
+    router.mount(
+        CoreRegistry(
+            [create_core_plugin(CorePlug("hello"), CoreHost(str), PluginPolicy.DIRECT)]
+        )
+    )
+    resolver = router.get_route_resolver(greet.__wrapped__)
+    assert resolver.call_plan is None
+
+    future = router.remount_in_background(
+        CoreRegistry(
+            [create_core_plugin(CorePlug("hi"), CoreHost(str), PluginPolicy.DIRECT)]
+        )
+    )
+    future.result(timeout=5)
+
+    # Plans are ready before the first call
+    assert resolver.call_plan is not None
+    assert router.get_route_resolver(greet_compiled.__wrapped__).call_plan is not None
+    assert greet("bob") == "hi bob"
+    assert greet_compiled("bob") == "hi bob"
+
+    # Missing plugin leaves the route to be looked up lazily
+    router.remount(CoreRegistry([]))
+    assert resolver.call_plan is None
+
+
+def test_routes_rebind_when_registry_generation_changes():
+    class Swappable(Router):
+        def swap_without_remount(self, registry: CoreRegistry) -> None:
+            # Plugins change behind routes, no rebind is requested
+            self._reg = registry
+            self._generation = registry.generation
+
+    router = Swappable()
+
+    @router.manage()
+    def greet(name: str, greeting: str = Hosted()) -> str:
+        return f"{greeting} {name}"
+
+    @router.manage(compiled=True)
+    def greet_compiled(name: str, greeting: str = Hosted()) -> str:
+        return f"{greeting} {name}"
+
+    base = CoreRegistry(
+        [create_core_plugin(CorePlug("hello"), CoreHost(str), PluginPolicy.DIRECT)]
+    )
+    router.mount(base)
+    assert greet("bob") == "hello bob"
+    assert greet_compiled("bob") == "hello bob"
+
+    tenant = base.overlay(
+        [create_core_plugin(CorePlug("hi"), CoreHost(str), PluginPolicy.DIRECT)]
+    )
+    assert tenant.generation != base.generation
+
+    router.swap_without_remount(tenant)
+    assert greet("bob") == "hi bob"
+    assert greet_compiled("bob") == "hi bob"
+    assert router.get_route_resolver(greet.__wrapped__).generation == tenant.generation
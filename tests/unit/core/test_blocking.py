@@ -0,0 +1,92 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from plug_in.boot.builder.builder import plug
+from plug_in.core.host import CoreHost
+from plug_in.core.plugin import blocking
+from plug_in.core.registry import CoreRegistry
+from plug_in.ioc.enum import AsyncResolutionMode
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.router import Router
+
+
+class Config:
+    def __init__(self) -> None:
+        self.thread = threading.current_thread()
+
+
+class Session:
+    pass
+
+
+@pytest.mark.asyncio
+async def test_blocking_provider_runs_off_the_event_loop():
+    loop_ticked = threading.Event()
+
+    def read_config() -> Config:
+        # Would deadlock if the loop was blocked by this provider
+        assert loop_ticked.wait(timeout=5)
+        return Config()
+
+    async def open_session() -> Session:
+        await asyncio.sleep(0)
+        loop_ticked.set()
+        return Session()
+
+    router = Router(async_resolution=AsyncResolutionMode.CONCURRENT)
+    router.mount(
+        CoreRegistry(
+            [
+                blocking(plug(read_config).into(Config).via_provider("factory")),
+                plug(open_session).into(Session).via_provider("factory_async"),
+            ]
+        )
+    )
+
+    @router.manage()
+    async def handle(
+        config: Config = Hosted(), session: Session = Hosted()
+    ) -> tuple[Config, Session]:
+        return config, session
+
+    @router.manage()
+    def handle_sync(config: Config = Hosted()) -> Config:
+        return config
+
+    config, session = await handle()
+    assert config.thread is not threading.current_thread()
+    assert isinstance(session, Session)
+
+    # Sync callers resolve it in place
+    assert handle_sync().thread is threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_registry_async_resolve_offloads_to_given_executor():
+    with ThreadPoolExecutor(thread_name_prefix="config_reader") as executor:
+        reg = CoreRegistry(
+            [blocking(plug(Config).into(Config).via_provider("lazy"), executor)]
+        )
+
+        config = await reg.async_resolve(CoreHost(Config))
+        assert config.thread.name.startswith("config_reader")
+        assert reg.sync_resolve(CoreHost(Config)) is config
+        (same,) = await reg.async_resolve_many([CoreHost(Config)])
+        assert same is config
+
+
+@pytest.mark.asyncio
+async def test_initialized_lazy_value_is_not_offloaded():
+    executor = ThreadPoolExecutor()
+    reg = CoreRegistry(
+        [blocking(plug(Config).into(Config).via_provider("lazy"), executor)]
+    )
+
+    config = await reg.async_resolve(CoreHost(Config))
+    executor.shutdown()
+
+    # Shut down executor would reject offloaded work
+    assert await reg.async_resolve(CoreHost(Config)) is config
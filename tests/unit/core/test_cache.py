@@ -0,0 +1,200 @@
+import asyncio
+import threading
+import time
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from plug_in.boot.builder.builder import plug
+from plug_in.core.cache import TtlCache
+from plug_in.core.host import CoreHost
+from plug_in.core.registry import CoreRegistry
+
+
+class Token(str):
+    pass
+
+
+Lock = type(threading.Lock())
+
+
+def test_cached_plugin_refreshes_expired_value():
+    events: list[str] = []
+    issued = 0
+
+    def issue_token() -> Iterator[Token]:
+        nonlocal issued
+        issued += 1
+        events.append(f"issue {issued}")
+        yield Token(f"token {issued}")
+        events.append("revoke")
+
+    reg = CoreRegistry(
+        [plug(issue_token).into(Token).via_cache(ttl=0.05, stale_ttl=0, jitter=0.0)]
+    )
+
+    assert reg.sync_resolve(CoreHost(Token)) == "token 1"
+    assert reg.sync_resolve(CoreHost(Token)) == "token 1"
+    time.sleep(0.06)
+
+    # Replaced value is retired, as it may still be in use
+    assert reg.sync_resolve(CoreHost(Token)) == "token 2"
+    assert events == ["issue 1", "issue 2"]
+    time.sleep(0.06)
+
+    # Retired value is torn down on the following refresh
+    assert reg.sync_resolve(CoreHost(Token)) == "token 3"
+    assert events == ["issue 1", "issue 2", "issue 3", "revoke"]
+
+    reg.close()
+    assert events == ["issue 1", "issue 2", "issue 3", "revoke", "revoke", "revoke"]
+    assert reg.sync_resolve(CoreHost(Token)) == "token 4"
+
+
+def test_cached_plugin_serves_stale_value_while_refreshing():
+    issued = 0
+    release = threading.Event()
+
+    def issue_token() -> Token:
+        nonlocal issued
+        issued += 1
+        if issued > 1:
+            release.wait(timeout=5)
+        return Token(f"token {issued}")
+
+    reg = CoreRegistry(
+        [plug(issue_token).into(Token).via_cache(ttl=0.02, stale_ttl=60, jitter=0.0)]
+    )
+
+    assert reg.sync_resolve(CoreHost(Token)) == "token 1"
+    time.sleep(0.03)
+
+    # Refresh is started once, requests do not wait for it
+    for _ in range(5):
+        assert reg.sync_resolve(CoreHost(Token)) == "token 1"
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while reg.sync_resolve(CoreHost(Token)) != "token 2":
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    assert issued == 2
+
+
+def test_cached_plugin_serves_stale_value_by_default():
+    issued = 0
+    refreshing = threading.Event()
+    release = threading.Event()
+
+    def issue_token() -> Token:
+        nonlocal issued
+        issued += 1
+        if issued > 1:
+            refreshing.set()
+            release.wait(timeout=5)
+        return Token(f"token {issued}")
+
+    reg = CoreRegistry([plug(issue_token).into(Token).via_cache(ttl=0.1, jitter=0.0)])
+
+    assert reg.sync_resolve(CoreHost(Token)) == "token 1"
+    time.sleep(0.11)
+
+    # Expiry does not block, stale value is served while refresh runs
+    assert reg.sync_resolve(CoreHost(Token)) == "token 1"
+    assert refreshing.wait(timeout=5)
+    assert reg.sync_resolve(CoreHost(Token)) == "token 1"
+    release.set()
+
+
+def test_cached_plugin_keeps_context_manager_values_as_they_are():
+    reg = CoreRegistry([plug(threading.Lock).into(Lock).via_cache(ttl=60)])
+
+    lock = reg.sync_resolve(CoreHost(Lock))
+    assert isinstance(lock, Lock)
+    assert not lock.locked()
+
+
+def test_ttl_cache_validates_arguments():
+    with pytest.raises(ValueError):
+        TtlCache(lambda: (None, None), ttl=0)
+
+    with pytest.raises(ValueError):
+        TtlCache(lambda: (None, None), ttl=1, jitter=1)
+
+
+@pytest.mark.asyncio
+async def test_cached_async_plugin_deduplicates_concurrent_refreshes():
+    issued = 0
+
+    async def issue_token() -> Token:
+        nonlocal issued
+        issued += 1
+        await asyncio.sleep(0.01)
+        return Token(f"token {issued}")
+
+    reg = CoreRegistry(
+        [
+            plug(issue_token)
+            .into(Token)
+            .via_async_cache(ttl=0.05, stale_ttl=60, jitter=0.0)
+        ]
+    )
+
+    tokens = await reg.async_resolve_many([CoreHost(Token)] * 5)
+    assert set(tokens) == {"token 1"}
+    assert issued == 1
+
+    await asyncio.sleep(0.06)
+
+    # Stale value is served, and refreshed by a single background task
+    tokens = await reg.async_resolve_many([CoreHost(Token)] * 5)
+    assert set(tokens) == {"token 1"}
+    await asyncio.sleep(0.03)
+    assert await reg.async_resolve(CoreHost(Token)) == "token 2"
+    assert issued == 2
+
+    await reg.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cached_async_plugin_defers_teardown_of_replaced_value():
+    events: list[str] = []
+    issued = 0
+
+    async def issue_token() -> AsyncIterator[Token]:
+        nonlocal issued
+        issued += 1
+        events.append(f"issue {issued}")
+        yield Token(f"token {issued}")
+        events.append("revoke")
+
+    reg = CoreRegistry(
+        [
+            plug(issue_token)
+            .into(Token)
+            .via_async_cache(ttl=0.05, stale_ttl=0, jitter=0.0)
+        ]
+    )
+
+    token = await reg.async_resolve(CoreHost(Token))
+    await asyncio.sleep(0.06)
+    assert await reg.async_resolve(CoreHost(Token)) == "token 2"
+
+    # Value obtained before refresh is still valid
+    assert token == "token 1"
+    assert events == ["issue 1", "issue 2"]
+
+    await reg.aclose()
+    assert events == ["issue 1", "issue 2", "revoke", "revoke"]
+
+
+@pytest.mark.asyncio
+async def test_coroutine_plug_caches_awaited_value():
+    async def issue_token() -> Token:
+        return Token("token")
+
+    reg = CoreRegistry([plug(issue_token).into(Token).via_cache(ttl=60)])
+
+    # Value is cached, not the coroutine, which could be awaited only once
+    assert await reg.async_resolve(CoreHost(Token)) == "token"
+    assert await reg.async_resolve(CoreHost(Token)) == "token"
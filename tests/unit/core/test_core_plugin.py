@@ -1,9 +1,19 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
 from typing import Any, Callable
 import pytest
+from plug_in.core.asyncio.plugin import FactoryAsyncCorePlugin
 from plug_in.core.enum import PluginPolicy
 from plug_in.core.host import CoreHost
 from plug_in.core.plug import CorePlug
 from plug_in.core.plugin import create_core_plugin
+from plug_in.core.registry import CoreRegistry
+from plug_in.core.scope import scope
+from plug_in.ioc.enum import AsyncResolutionMode
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.router import Router
 from plug_in.types.proto.core_plugin import CorePluginProtocol
 
 
@@ -153,3 +163,158 @@ def test_factory_plugin_provide(
         assert value is plugin.provide()
         assert value is plugin.provide()
         assert value is plugin.provide()
+
+
+def test_lazy_plugin_initializes_once_under_thread_contention():
+    calls: list[int] = []
+    barrier = threading.Barrier(16)
+
+    def provider() -> object:
+        calls.append(1)
+        time.sleep(0.01)
+        return object()
+
+    plugin = create_core_plugin(
+        plug=CorePlug(provider), host=CoreHost(object), policy=PluginPolicy.LAZY
+    )
+
+    def resolve() -> object:
+        barrier.wait()
+        return plugin.provide()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        values = list(executor.map(lambda _: resolve(), range(16)))
+
+    assert len(calls) == 1
+    assert all(value is values[0] for value in values)
+
+
+def test_lazy_async_plugin_is_shared_across_event_loops():
+    calls: list[int] = []
+    barrier = threading.Barrier(4)
+
+    async def provider() -> object:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return object()
+
+    plugin = create_core_plugin(
+        plug=CorePlug(provider), host=CoreHost(object), policy=PluginPolicy.LAZY_ASYNC
+    )
+
+    async def resolve_twice() -> list[object]:
+        return list(await asyncio.gather(plugin.provide(), plugin.provide()))
+
+    def run_in_own_loop() -> list[object]:
+        barrier.wait()
+        return asyncio.run(resolve_twice())
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        values = [
+            v for vs in executor.map(lambda _: run_in_own_loop(), range(4)) for v in vs
+        ]
+
+    assert len(calls) == 1
+    assert all(value is values[0] for value in values)
+
+
+@pytest.mark.asyncio
+async def test_lazy_async_plugin_retries_failed_initialization():
+    results = iter([LookupError("first"), "second"])
+
+    async def provider() -> str:
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    plugin = create_core_plugin(
+        plug=CorePlug(provider), host=CoreHost(str), policy=PluginPolicy.LAZY_ASYNC
+    )
+
+    with pytest.raises(LookupError):
+        await plugin.provide()
+
+    assert await plugin.provide() == "second"
+    assert await plugin.provide() == "second"
+
+
+@pytest.mark.asyncio
+async def test_coalescing_factory_async_plugin_shares_concurrent_invocations():
+    calls = 0
+
+    async def provider() -> object:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return object()
+
+    plugin = FactoryAsyncCorePlugin(
+        CorePlug(provider), CoreHost(object), None, _coalesce=True
+    )
+
+    # Concurrent requests within a scope share invocation
+    async with scope():
+        first, second = await asyncio.gather(plugin.provide(), plugin.provide())
+    assert first is second
+    assert calls == 1
+
+    # Finished invocation is not reused
+    assert await plugin.provide() is not first
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_does_not_cancel_coalesced_invocation():
+    release = asyncio.Event()
+
+    async def provider() -> object:
+        await release.wait()
+        return object()
+
+    plugin = FactoryAsyncCorePlugin(
+        CorePlug(provider), CoreHost(object), None, _coalesce=True
+    )
+
+    async with scope():
+        first = asyncio.ensure_future(plugin.provide())
+        second = asyncio.ensure_future(plugin.provide())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+        assert isinstance(await second, object)
+        assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_coalescing_factory_async_plugin_shares_invocation_within_route():
+    calls = 0
+
+    async def provider() -> object:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return object()
+
+    router = Router(async_resolution=AsyncResolutionMode.CONCURRENT)
+    router.mount(
+        CoreRegistry(
+            [
+                FactoryAsyncCorePlugin(
+                    CorePlug(provider), CoreHost(object), None, _coalesce=True
+                )
+            ]
+        )
+    )
+
+    @router.manage()
+    async def handle(
+        first: object = Hosted(), second: object = Hosted()
+    ) -> tuple[object, object]:
+        return first, second
+
+    # No scope is active, parameters are resolved in tasks of their own
+    first, second = await handle()
+    assert first is second
+    assert calls == 1
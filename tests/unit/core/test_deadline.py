@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from plug_in.boot.builder.builder import plug
+from plug_in.core.deadline import deadline, get_deadline, time_left
+from plug_in.core.host import CoreHost
+from plug_in.core.registry import CoreRegistry
+from plug_in.exc import ProviderTimeoutError
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.router import Router
+
+
+class Connection:
+    pass
+
+
+async def hang() -> Connection:
+    await asyncio.sleep(10)
+    return Connection()
+
+
+def test_nested_deadline_cannot_extend_outer_one():
+    assert get_deadline() is None
+    assert time_left(5) == 5
+
+    with deadline(1) as outer:
+        with deadline(10) as inner:
+            assert inner == outer
+            left = time_left()
+            assert left is not None and 0 < left <= 1
+
+        with deadline(None) as kept:
+            assert kept == outer
+
+    assert get_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_factory_async_plugin_times_out():
+    reg = CoreRegistry(
+        [plug(hang).into(Connection).via_async_provider("factory", timeout=0.01)]
+    )
+
+    with pytest.raises(ProviderTimeoutError) as exc_info:
+        await reg.async_resolve(CoreHost(Connection))
+    assert isinstance(exc_info.value, TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_timed_out_lazy_async_init_is_retried():
+    calls = 0
+
+    async def connect() -> Connection:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(10)
+        return Connection()
+
+    reg = CoreRegistry(
+        [plug(connect).into(Connection).via_async_provider("lazy", timeout=0.01)]
+    )
+
+    with pytest.raises(ProviderTimeoutError):
+        await reg.async_resolve(CoreHost(Connection))
+
+    connection = await reg.async_resolve(CoreHost(Connection))
+    assert await reg.async_resolve(CoreHost(Connection)) is connection
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_lazy_async_init_outlives_deadline_of_starting_request():
+    calls = 0
+
+    async def connect() -> Connection:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return Connection()
+
+    reg = CoreRegistry([plug(connect).into(Connection).via_async_provider("lazy")])
+
+    async def impatient() -> Connection:
+        with deadline(0.01):
+            return await reg.async_resolve(CoreHost(Connection))
+
+    # Request that started initialization gives up, the other one gets value
+    started = asyncio.ensure_future(impatient())
+    await asyncio.sleep(0)
+    waiting = asyncio.ensure_future(reg.async_resolve(CoreHost(Connection)))
+
+    with pytest.raises(ProviderTimeoutError):
+        await started
+    assert isinstance(await waiting, Connection)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_route_timeout_and_request_deadline_bound_resolution():
+    router = Router()
+    reg = CoreRegistry([plug(hang).into(Connection).via_provider("factory_async")])
+    router.mount(reg)
+
+    @router.manage(timeout=0.01)
+    async def query(conn: Connection = Hosted()) -> Connection:
+        return conn
+
+    @router.manage()
+    async def query_without_timeout(conn: Connection = Hosted()) -> Connection:
+        return conn
+
+    with pytest.raises(ProviderTimeoutError):
+        await query()
+
+    # Deadline of the request bounds routes and registry resolution
+    with deadline(0.01):
+        with pytest.raises(ProviderTimeoutError):
+            await query_without_timeout()
+
+        with pytest.raises(ProviderTimeoutError):
+            await reg.async_resolve_many([CoreHost(Connection)] * 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compiled", [False, True])
+async def test_request_deadline_bounds_providers_of_any_route(compiled: bool):
+    router = Router()
+    router.mount(
+        CoreRegistry([plug(hang).into(Connection).via_provider("task_local_async")])
+    )
+
+    @router.manage(compiled=compiled)
+    async def query(conn: Connection = Hosted()) -> Connection:
+        return conn
+
+    # Task local provider has no timeout of its own
+    with deadline(0.01):
+        with pytest.raises(ProviderTimeoutError):
+            await query()
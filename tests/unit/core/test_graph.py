@@ -0,0 +1,26 @@
+import pytest
+
+from plug_in.core.graph import build_dependency_graph
+from plug_in.core.host import CoreHost
+from plug_in.exc import DependencyCycleError
+
+
+A, B, C, D = (CoreHost(name) for name in "abcd")
+
+
+def test_graph_layers_and_order():
+    graph = build_dependency_graph({A: [], B: [A], C: [A], D: [B, C, CoreHost("x")]})
+
+    assert graph.layers == ((A,), (B, C), (D,))
+    assert graph.order == (A, B, C, D)
+    assert graph.dependencies(D) == (B, C)
+    assert set(graph.dependents(A)) == {B, C}
+
+
+def test_graph_detects_cycle():
+    with pytest.raises(DependencyCycleError) as exc_info:
+        build_dependency_graph({A: [], B: [A, D], C: [B], D: [C]})
+
+    cycle = exc_info.value.cycle
+    assert cycle[0] == cycle[-1]
+    assert set(cycle) == {B, C, D}
@@ -1 +1,76 @@
+import gc
+import weakref
+
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.host import CoreHost, intern_host
+from plug_in.core.plug import CorePlug
+from plug_in.core.plugin import create_core_plugin
+from plug_in.core.registry import CoreRegistry
+
+
+class CollidingSubject:
+    """
+    Distinct instances, always the same hash.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __hash__(self) -> int:
+        return 42
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CollidingSubject) and other.name == self.name
+
+
 def test_host(): ...
+
+
+def test_host_equality_and_cached_hash():
+    assert CoreHost(int) == CoreHost(int)
+    assert CoreHost(int, ("a",)) != CoreHost(int, ("b",))
+    assert hash(CoreHost(int, ("a",))) == hash((int, "a"))
+
+
+def test_colliding_hosts_are_distinct_registry_keys():
+    a = CoreHost(CollidingSubject("a"))
+    b = CoreHost(CollidingSubject("b"))
+    assert hash(a) == hash(b) and a != b
+
+    reg = CoreRegistry(
+        [
+            create_core_plugin(CorePlug("A"), a, PluginPolicy.DIRECT),
+            create_core_plugin(CorePlug("B"), b, PluginPolicy.DIRECT),
+        ]
+    )
+
+    assert reg.resolve(CoreHost(CollidingSubject("a"))) == "A"
+    assert reg.resolve(CoreHost(CollidingSubject("b"))) == "B"
+
+
+def test_intern_host_returns_canonical_instance():
+    first = intern_host(CoreHost(CollidingSubject("interned")))
+
+    assert intern_host(CoreHost(CollidingSubject("interned"))) is first
+
+
+def test_interned_host_is_released_when_unused():
+    host = intern_host(CoreHost(CollidingSubject("released")))
+    ref = weakref.ref(host)
+
+    del host
+    gc.collect()
+    assert ref() is None
+
+    fresh = CoreHost(CollidingSubject("released"))
+    assert intern_host(fresh) is fresh
+
+
+def test_core_objects_use_slots():
+    host = CoreHost(int)
+    plugin = create_core_plugin(CorePlug(lambda: 1), host, PluginPolicy.LAZY)
+
+    assert not hasattr(host, "__dict__")
+    assert not hasattr(plugin, "__dict__")
+    assert not hasattr(plugin.plug, "__dict__")
+    assert plugin.provide() == 1
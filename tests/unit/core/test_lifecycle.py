@@ -0,0 +1,129 @@
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from plug_in.boot.builder.builder import plug
+from plug_in.core.graph import build_dependency_graph
+from plug_in.core.host import CoreHost
+from plug_in.core.registry import CoreRegistry
+from plug_in.core.scope import scope
+from plug_in.exc import AsyncPluginCannotBeAwaited, MissingScopeError
+
+
+class Pool:
+    pass
+
+
+class Client:
+    pass
+
+
+class Session:
+    pass
+
+
+def test_lazy_generator_provider_is_torn_down_on_close():
+    events: list[str] = []
+
+    def make_pool() -> Iterator[Pool]:
+        events.append("open")
+        yield Pool()
+        events.append("close")
+
+    reg = CoreRegistry([plug(make_pool).into(Pool).via_provider("lazy")])
+
+    pool = reg.sync_resolve(CoreHost(Pool))
+    assert isinstance(pool, Pool)
+    assert reg.sync_resolve(CoreHost(Pool)) is pool
+
+    reg.close()
+    assert events == ["open", "close"]
+
+    # Closed plugin is initialized again on request
+    assert reg.sync_resolve(CoreHost(Pool)) is not pool
+
+
+@pytest.mark.asyncio
+async def test_registry_aclose_follows_reverse_dependency_order():
+    events: list[str] = []
+
+    @contextmanager
+    def make_pool() -> Iterator[Pool]:
+        yield Pool()
+        events.append("pool")
+
+    @asynccontextmanager
+    async def make_client() -> AsyncIterator[Client]:
+        yield Client()
+        events.append("client")
+
+    async def make_session() -> AsyncIterator[Session]:
+        yield Session()
+        events.append("session")
+
+    reg = CoreRegistry(
+        [
+            plug(make_session).into(Session).via_provider("lazy_async"),
+            plug(make_pool).into(Pool).via_provider("lazy"),
+            plug(make_client).into(Client).via_provider("lazy_async"),
+        ]
+    )
+    graph = build_dependency_graph(
+        {
+            CoreHost(Pool): [],
+            CoreHost(Client): [CoreHost(Pool)],
+            CoreHost(Session): [CoreHost(Client)],
+        }
+    )
+
+    for host in graph.order:
+        await reg.async_resolve(host)
+
+    await reg.aclose(graph=graph)
+
+    assert events == ["session", "client", "pool"]
+
+
+@pytest.mark.asyncio
+async def test_factory_and_scoped_providers_are_torn_down_at_scope_exit():
+    events: list[str] = []
+
+    def make_pool() -> Iterator[Pool]:
+        yield Pool()
+        events.append("pool")
+
+    async def make_session() -> AsyncIterator[Session]:
+        yield Session()
+        events.append("session")
+
+    reg = CoreRegistry(
+        [
+            plug(make_pool).into(Pool).via_provider("factory"),
+            plug(make_session).into(Session).via_provider("scoped_async"),
+        ]
+    )
+
+    async with scope():
+        first = reg.sync_resolve(CoreHost(Pool))
+        assert reg.sync_resolve(CoreHost(Pool)) is not first
+        session = await reg.async_resolve(CoreHost(Session))
+        assert await reg.async_resolve(CoreHost(Session)) is session
+        assert events == []
+
+    assert events == ["session", "pool", "pool"]
+
+    with pytest.raises(MissingScopeError):
+        reg.sync_resolve(CoreHost(Pool))
+
+
+@pytest.mark.asyncio
+async def test_sync_scope_exit_rejects_async_teardown():
+    async def make_session() -> AsyncIterator[Session]:
+        yield Session()
+
+    reg = CoreRegistry([plug(make_session).into(Session).via_provider("factory_async")])
+
+    with pytest.raises(AsyncPluginCannotBeAwaited):
+        with scope():
+            await reg.async_resolve(CoreHost(Session))
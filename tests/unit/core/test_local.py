@@ -0,0 +1,114 @@
+import asyncio
+import gc
+import threading
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from plug_in.boot.builder.builder import plug
+from plug_in.core.host import CoreHost
+from plug_in.core.registry import CoreRegistry
+from plug_in.exc import MissingTaskError
+
+
+class Parser:
+    pass
+
+
+class Connection:
+    pass
+
+
+def test_thread_local_plugin_provides_value_per_thread():
+    events: list[str] = []
+
+    def make_parser() -> Iterator[Parser]:
+        events.append("open")
+        yield Parser()
+        events.append("close")
+
+    reg = CoreRegistry([plug(make_parser).into(Parser).via_provider("thread_local")])
+
+    main = reg.sync_resolve(CoreHost(Parser))
+    assert reg.sync_resolve(CoreHost(Parser)) is main
+
+    other: list[Parser] = []
+
+    def worker() -> None:
+        other.append(reg.sync_resolve(CoreHost(Parser)))
+        other.append(reg.sync_resolve(CoreHost(Parser)))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    assert other[0] is other[1] and other[0] is not main
+    # Value of finished thread is torn down
+    assert events == ["open", "open", "close"]
+
+    reg.close()
+    assert events == ["open", "open", "close", "close"]
+    assert reg.sync_resolve(CoreHost(Parser)) is not main
+
+
+@pytest.mark.asyncio
+async def test_task_local_plugin_provides_value_per_task():
+    events: list[str] = []
+
+    def make_parser() -> Iterator[Parser]:
+        yield Parser()
+        events.append("close")
+
+    reg = CoreRegistry([plug(make_parser).into(Parser).via_provider("task_local")])
+
+    async def resolve_twice() -> tuple[Parser, Parser]:
+        return reg.sync_resolve(CoreHost(Parser)), reg.sync_resolve(CoreHost(Parser))
+
+    first = await asyncio.create_task(resolve_twice())
+    second = await asyncio.create_task(resolve_twice())
+    await asyncio.sleep(0)
+
+    assert first[0] is first[1]
+    assert second[0] is second[1]
+    assert first[0] is not second[0]
+    assert events == ["close", "close"]
+
+    with pytest.raises(MissingTaskError):
+        await asyncio.to_thread(reg.sync_resolve, CoreHost(Parser))
+
+
+@pytest.mark.asyncio
+async def test_task_local_async_plugin_shares_invocation_within_task():
+    events: list[str] = []
+    calls = 0
+
+    async def make_connection() -> AsyncIterator[Connection]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        yield Connection()
+        events.append("close")
+
+    reg = CoreRegistry(
+        [plug(make_connection).into(Connection).via_provider("task_local_async")]
+    )
+
+    async def handle() -> None:
+        first, second = await reg.async_resolve_many(
+            [CoreHost(Connection), CoreHost(Connection)]
+        )
+        assert first is second
+
+    await asyncio.create_task(handle())
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert calls == 1
+    assert events == ["close"]
+
+    # Tasks still running are torn down on close
+    connection = await reg.async_resolve(CoreHost(Connection))
+    assert isinstance(connection, Connection)
+    await reg.aclose()
+    assert events == ["close", "close"]
@@ -0,0 +1,110 @@
+import pytest
+
+from plug_in.boot.builder.builder import plug
+from plug_in.core.host import CoreHost
+from plug_in.core.observe import InMemoryAggregator, LatencyHistogram
+from plug_in.core.registry import CoreRegistry
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.router import Router
+
+
+class Config:
+    pass
+
+
+class Session:
+    pass
+
+
+class Broken:
+    pass
+
+
+def open_broken() -> Broken:
+    raise RuntimeError("Cannot open")
+
+
+def test_aggregator_counts_provides_and_lazy_hits():
+    aggregator = InMemoryAggregator()
+    router = Router(observer=aggregator)
+
+    @router.manage()
+    def handle(config: Config = Hosted(), session: Session = Hosted()) -> Session:
+        return session
+
+    # Lookup fails until router is mounted
+    assert aggregator.route_stats(handle.__wrapped__).failures == 1
+
+    router.mount(
+        CoreRegistry(
+            [
+                plug(Config).into(Config).via_provider("lazy"),
+                plug(Session).into(Session).via_provider("factory"),
+            ]
+        )
+    )
+
+    for _ in range(3):
+        handle()
+
+    config_stats = aggregator.provider_stats(CoreHost(Config))
+    assert config_stats is not None
+    assert (config_stats.calls, config_stats.hits, config_stats.misses) == (3, 2, 1)
+
+    session_stats = aggregator.provider_stats(CoreHost(Session))
+    assert session_stats is not None
+    assert (session_stats.calls, session_stats.hits, session_stats.misses) == (3, 0, 0)
+
+    route_stats = aggregator.route_stats(handle.__wrapped__)
+    assert route_stats is not None
+    assert route_stats.finalizations == 1
+    assert route_stats.bind.count == 3
+
+    snapshot = aggregator.snapshot()
+    assert snapshot["providers"][str(CoreHost(Config))]["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_registry_reports_provider_errors():
+    aggregator = InMemoryAggregator()
+    reg = CoreRegistry(
+        [plug(open_broken).into(Broken).via_provider("factory")], observer=aggregator
+    )
+
+    with pytest.raises(RuntimeError):
+        reg.sync_resolve(CoreHost(Broken))
+
+    with pytest.raises(RuntimeError):
+        await reg.overlay([]).async_resolve(CoreHost(Broken))
+
+    stats = aggregator.provider_stats(CoreHost(Broken))
+    assert stats is not None
+    assert (stats.calls, stats.errors) == (2, 2)
+
+
+def test_call_plan_is_not_instrumented_without_observer():
+    reg = CoreRegistry([plug(Config).into(Config).via_provider("lazy")])
+    router = Router()
+    router.mount(reg)
+
+    @router.manage()
+    def handle(config: Config = Hosted()) -> Config:
+        return config
+
+    handle()
+    (slot,) = router._routes[handle.__wrapped__].get_call_plan().slots
+    assert slot.provide == reg.plugin(CoreHost(Config)).provide
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+
+    for _ in range(99):
+        histogram.record(0.0001)
+    histogram.record(0.5)
+
+    assert histogram.count == 100
+    assert 0.0001 <= histogram.percentile(50) < 0.0002
+    assert histogram.percentile(100) == 0.5
+    assert histogram.min == 0.0001
@@ -0,0 +1,200 @@
+import asyncio
+import threading
+import time
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from plug_in.boot.builder.builder import plug
+from plug_in.core.host import CoreHost
+from plug_in.core.pool import PoolEntry, _PoolState
+from plug_in.core.registry import CoreRegistry
+from plug_in.core.scope import Scope
+from plug_in.exc import MissingScopeError, PoolTimeoutError
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.router import Router
+
+
+class Connection:
+    pass
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_pooled_plugin_returns_value_after_managed_call(compiled: bool):
+    created: list[Connection] = []
+
+    def connect() -> Connection:
+        created.append(Connection())
+        return created[-1]
+
+    router = Router()
+    reg = CoreRegistry([plug(connect).into(Connection).via_pool(max_size=1)])
+    router.mount(reg)
+    pool = reg.plugin(CoreHost(Connection)).pool
+
+    @router.manage(compiled=compiled)
+    def query(conn: Connection = Hosted()) -> Connection:
+        return conn
+
+    @router.manage(compiled=compiled)
+    def fail(conn: Connection = Hosted()) -> None:
+        raise ValueError("query failed")
+
+    assert query() is query()
+    with pytest.raises(ValueError):
+        fail()
+
+    # Value is returned also when the call raises
+    assert query() is created[0]
+    assert len(created) == 1
+    assert pool.acquire().value is created[0]
+
+
+def test_pooled_plugin_times_out_when_pool_is_exhausted():
+    router = Router()
+    router.mount(
+        CoreRegistry([plug(Connection).into(Connection).via_pool(1, timeout=0.05)])
+    )
+    inside = threading.Event()
+    leave = threading.Event()
+
+    @router.manage()
+    def hold(conn: Connection = Hosted()) -> None:
+        inside.set()
+        leave.wait(timeout=5)
+
+    @router.manage()
+    def query(conn: Connection = Hosted()) -> Connection:
+        return conn
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    inside.wait(timeout=5)
+    try:
+        with pytest.raises(PoolTimeoutError):
+            query()
+    finally:
+        leave.set()
+        thread.join()
+
+    assert isinstance(query(), Connection)
+
+
+def test_pooled_plugin_evicts_idle_values():
+    events: list[str] = []
+
+    def connect() -> Iterator[Connection]:
+        events.append("open")
+        yield Connection()
+        events.append("close")
+
+    reg = CoreRegistry([plug(connect).into(Connection).via_pool(max_idle=0.01)])
+
+    with Scope():
+        first = reg.sync_resolve(CoreHost(Connection))
+    time.sleep(0.02)
+
+    with Scope():
+        second = reg.sync_resolve(CoreHost(Connection))
+
+        # Expired value is torn down when pool is used next time
+        assert second is not first
+        assert events == ["open", "close", "open"]
+
+    reg.close()
+    assert events == ["open", "close", "open", "close"]
+
+    # Value cannot be returned outside of managed call or scope
+    with pytest.raises(MissingScopeError):
+        reg.sync_resolve(CoreHost(Connection))
+
+
+def test_pool_release_frees_place_of_every_evicted_value():
+    state = _PoolState(max_size=3, max_idle=1.0)
+    entries = [PoolEntry(Connection(), None, state.epoch) for _ in range(3)]
+    state.size = 3
+
+    state.put(entries[0], now=0.0)
+    state.put(entries[1], now=0.0)
+
+    # Both idle values expired, waiters can take three places
+    discarded, freed = state.put(entries[2], now=2.0)
+    assert discarded == entries[:2]
+    assert freed == 3
+    assert state.size == 1
+
+
+class Session:
+    """
+    Plain context manager, not entered by the pool.
+    """
+
+    def __init__(self) -> None:
+        self.entered = False
+
+    def __enter__(self) -> bool:
+        self.entered = True
+        return True
+
+    def __exit__(self, *exc: object) -> None:
+        self.entered = False
+
+
+def test_pooled_plugin_keeps_context_manager_values_as_they_are():
+    reg = CoreRegistry([plug(Session).into(Session).via_pool(max_idle=0.01)])
+
+    with Scope():
+        session = reg.sync_resolve(CoreHost(Session))
+
+    assert isinstance(session, Session)
+    assert not session.entered
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compiled", [False, True])
+async def test_pooled_async_plugin_shares_value_between_tasks(compiled: bool):
+    events: list[str] = []
+
+    async def connect() -> AsyncIterator[Connection]:
+        events.append("open")
+        yield Connection()
+        events.append("close")
+
+    router = Router()
+    reg = CoreRegistry([plug(connect).into(Connection).via_async_pool(1)])
+    router.mount(reg)
+    active = 0
+
+    @router.manage(compiled=compiled)
+    async def query(conn: Connection = Hosted()) -> Connection:
+        nonlocal active
+        active += 1
+        assert active == 1
+        await asyncio.sleep(0)
+        active -= 1
+        return conn
+
+    first, second = await asyncio.gather(query(), query())
+    assert first is second
+    assert events == ["open"]
+
+    await reg.aclose()
+    assert events == ["open", "close"]
+
+
+@pytest.mark.asyncio
+async def test_coroutine_plug_pools_awaited_values():
+    async def connect() -> Connection:
+        return Connection()
+
+    router = Router()
+    router.mount(CoreRegistry([plug(connect).into(Connection).via_pool(1)]))
+
+    @router.manage()
+    async def query(conn: Connection = Hosted()) -> Connection:
+        return conn
+
+    # Values are pooled, not coroutines, which could be awaited only once
+    first = await query()
+    assert isinstance(first, Connection)
+    assert await query() is first
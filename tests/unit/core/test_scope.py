@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from plug_in.core.asyncio.plugin import LazyAsyncCorePlugin, ScopedAsyncCorePlugin
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.host import CoreHost
+from plug_in.core.plug import CorePlug
+from plug_in.core.plugin import create_core_plugin
+from plug_in.core.scope import scope
+from plug_in.exc import MissingScopeError, ScopeAlreadyActiveError
+from plug_in import plug
+
+
+def test_scoped_plugin_provides_one_value_per_scope():
+    plugin = create_core_plugin(
+        CorePlug(lambda: object()), CoreHost(object), PluginPolicy.SCOPED
+    )
+
+    with scope():
+        first = plugin.provide()
+        assert first is plugin.provide()
+
+        with scope():
+            # Nested scope is a separate scope
+            assert plugin.provide() is not first
+
+        assert first is plugin.provide()
+
+    with scope():
+        assert plugin.provide() is not first
+
+
+def test_scoped_plugin_requires_scope():
+    plugin = create_core_plugin(
+        CorePlug(lambda: object()), CoreHost(object), PluginPolicy.SCOPED
+    )
+
+    with pytest.raises(MissingScopeError):
+        plugin.provide()
+
+
+def test_scope_can_be_entered_once():
+    used_scope = scope()
+
+    with used_scope:
+        with pytest.raises(ScopeAlreadyActiveError):
+            with used_scope:
+                pass
+
+
+@pytest.mark.asyncio
+async def test_scoped_async_plugin_shares_single_invocation():
+    calls: list[int] = []
+
+    async def provider() -> object:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    plugin = create_core_plugin(
+        CorePlug(provider), CoreHost(object), PluginPolicy.SCOPED_ASYNC
+    )
+
+    async with scope():
+        first, second = await asyncio.gather(plugin.provide(), plugin.provide())
+        assert first is second
+        assert first is await plugin.provide()
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_does_not_cancel_scoped_async_invocation():
+    release = asyncio.Event()
+
+    async def provider() -> object:
+        await release.wait()
+        return object()
+
+    plugin = create_core_plugin(
+        CorePlug(provider), CoreHost(object), PluginPolicy.SCOPED_ASYNC
+    )
+
+    async with scope():
+        first = asyncio.ensure_future(plugin.provide())
+        second = asyncio.ensure_future(plugin.provide())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+        value = await second
+        assert first.cancelled()
+        assert await plugin.provide() is value
+
+
+@pytest.mark.asyncio
+async def test_scoped_async_plugin_does_not_keep_failures():
+    results = iter([LookupError("first"), "second"])
+
+    async def provider() -> str:
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    plugin = create_core_plugin(
+        CorePlug(provider), CoreHost(str), PluginPolicy.SCOPED_ASYNC
+    )
+
+    async with scope():
+        with pytest.raises(LookupError):
+            await plugin.provide()
+
+        assert await plugin.provide() == "second"
+
+
+def test_coroutine_plug_selects_async_plugins():
+    async def provider() -> int:
+        return 1
+
+    assert isinstance(
+        plug(provider).into(int).via_async_provider("lazy"), LazyAsyncCorePlugin
+    )
+    assert isinstance(
+        plug(provider).into(int).via_async_provider("scoped"), ScopedAsyncCorePlugin
+    )
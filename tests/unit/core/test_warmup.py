@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.host import CoreHost
+from plug_in.core.plug import CorePlug
+from plug_in.core.plugin import create_core_plugin
+from plug_in.core.registry import CoreRegistry
+from plug_in.exc import SyncPluginExpected, WarmUpError
+
+
+class Database:
+    pass
+
+
+class Cache:
+    pass
+
+
+class Client:
+    pass
+
+
+def _make_registry(calls: list[str]) -> CoreRegistry:
+    def make_database() -> Database:
+        calls.append("database")
+        time.sleep(0.05)
+        return Database()
+
+    async def make_client() -> Client:
+        calls.append("client")
+        await asyncio.sleep(0.05)
+        return Client()
+
+    def make_cache() -> Cache:
+        calls.append("cache")
+        return Cache()
+
+    return CoreRegistry(
+        [
+            create_core_plugin(
+                CorePlug(make_database),
+                CoreHost(Database),
+                PluginPolicy.LAZY,
+                meta={"tag": "db"},
+            ),
+            create_core_plugin(
+                CorePlug(make_client), CoreHost(Client), PluginPolicy.LAZY_ASYNC
+            ),
+            create_core_plugin(
+                CorePlug(make_cache), CoreHost(Cache), PluginPolicy.FACTORY
+            ),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_warm_up_initializes_lazy_plugins_only():
+    calls: list[str] = []
+    reg = _make_registry(calls)
+
+    report = await reg.async_warm_up()
+
+    assert sorted(calls) == ["client", "database"]
+    assert {entry.host for entry in report.entries} == {
+        CoreHost(Database),
+        CoreHost(Client),
+    }
+    assert all(entry.duration >= 0.04 for entry in report.entries)
+    assert report.failed == ()
+
+    # Warmed up values are provided without calling providers again
+    reg.sync_resolve(CoreHost(Database))
+    assert sorted(calls) == ["client", "database"]
+
+
+def test_sync_warm_up_skips_async_plugins():
+    calls: list[str] = []
+    reg = _make_registry(calls)
+
+    report = reg.warm_up()
+
+    assert calls == ["database"]
+    assert [entry.host for entry in report.entries] == [CoreHost(Database)]
+
+    # Async values would be bound to a closed loop
+    with pytest.raises(SyncPluginExpected):
+        reg.warm_up(hosts=[CoreHost(Client)])
+    assert calls == ["database"]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_filters_by_host_and_metadata():
+    calls: list[str] = []
+    reg = _make_registry(calls)
+
+    await reg.async_warm_up(hosts=[CoreHost(Client), CoreHost(Cache)])
+    assert calls == ["client"]
+
+    await reg.async_warm_up(
+        metadata_filter=lambda meta: meta is not None and "tag" in meta
+    )
+    assert calls == ["client", "database"]
+
+
+def test_warm_up_runs_sync_providers_in_parallel():
+    barrier = threading.Barrier(2, timeout=1)
+
+    def make_database() -> Database:
+        barrier.wait()
+        return Database()
+
+    def make_cache() -> Cache:
+        barrier.wait()
+        return Cache()
+
+    reg = CoreRegistry(
+        [
+            create_core_plugin(
+                CorePlug(make_database), CoreHost(Database), PluginPolicy.LAZY
+            ),
+            create_core_plugin(
+                CorePlug(make_cache), CoreHost(Cache), PluginPolicy.LAZY
+            ),
+        ]
+    )
+
+    report = reg.warm_up(max_concurrency=2)
+
+    assert report.failed == ()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_timeouts_and_errors():
+    async def slow_client() -> Client:
+        await asyncio.sleep(10)
+        return Client()
+
+    def broken_database() -> Database:
+        raise ValueError("no connection")
+
+    reg = CoreRegistry(
+        [
+            create_core_plugin(
+                CorePlug(broken_database), CoreHost(Database), PluginPolicy.LAZY
+            ),
+            create_core_plugin(
+                CorePlug(slow_client), CoreHost(Client), PluginPolicy.LAZY_ASYNC
+            ),
+        ]
+    )
+
+    with pytest.raises(WarmUpError) as exc_info:
+        await reg.async_warm_up(timeout=0.05)
+
+    failed = {entry.host: entry.error for entry in exc_info.value.report.failed}
+    assert isinstance(failed[CoreHost(Database)], ValueError)
+    assert isinstance(failed[CoreHost(Client)], TimeoutError)
+
+    report = await reg.async_warm_up(timeout=0.05, raise_on_error=False)
+    assert len(report.failed) == 2
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+import inspect
+from typing import Any, Callable
+import pytest
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.host import CoreHost
+from plug_in.core.plug import CorePlug
+from plug_in.core.plugin import create_core_plugin
+from plug_in.core.registry import CoreRegistry
+from plug_in.ioc.enum import AsyncResolutionMode
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.router import Router
+
+
+async def _async_str() -> str:
+    return "async"
+
+
+def _make_registry() -> CoreRegistry:
+    return CoreRegistry(
+        [
+            create_core_plugin(CorePlug(10), CoreHost(int), PluginPolicy.DIRECT),
+            create_core_plugin(
+                CorePlug(lambda: "abc"), CoreHost(str), PluginPolicy.FACTORY
+            ),
+            create_core_plugin(
+                CorePlug(_async_str), CoreHost(str, ("async",)), PluginPolicy.LAZY_ASYNC
+            ),
+        ]
+    )
+
+
+def f_mixed(a: int, b: int = Hosted(), c: object = [], d: str = Hosted()) -> tuple:
+    return (a, b, c, d)
+
+
+def f_kinds(
+    a: int, b: int = Hosted(), /, c: str = Hosted(), *args: Any, d: int = Hosted(), **kw
+) -> tuple:
+    return (a, b, c, args, d, kw)
+
+
+def f_keyword_only(*, a: int = Hosted(), b: int) -> tuple:
+    return (a, b)
+
+
+@pytest.mark.parametrize(
+    "callable, args, kwargs",
+    [
+        (f_mixed, (1,), {}),
+        (f_mixed, (1, 2), {"d": "x"}),
+        (f_mixed, (1, 2, 3, "x"), {}),
+        (f_kinds, (1,), {}),
+        (f_kinds, (1, 2, "x", 4, 5), {"d": 6, "e": 7}),
+        (f_keyword_only, (), {"b": 1}),
+    ],
+)
+def test_compiled_route_matches_generic_route(
+    callable: Callable, args: tuple, kwargs: dict[str, Any]
+):
+    generic_router = Router()
+    compiled_router = Router(compiled_routes=True)
+
+    generic = generic_router.manage()(callable)
+    compiled = compiled_router.manage()(callable)
+
+    # Compiled before mount, providers are bound on the first call
+    generic_router.mount(_make_registry())
+    compiled_router.mount(_make_registry())
+
+    assert compiled is not generic
+    assert inspect.signature(compiled) == inspect.signature(callable)
+    assert compiled(*args, **kwargs) == generic(*args, **kwargs)
+    assert compiled(*args, **kwargs) == generic(*args, **kwargs)
+
+
+def test_compiled_route_is_cached_per_callable():
+    router = Router()
+    router.mount(_make_registry())
+
+    assert router.manage(compiled=True)(f_mixed) is router.manage(compiled=True)(
+        f_mixed
+    )
+
+
+async def f_async(a: int = Hosted(), b: str = Hosted("async")) -> tuple:
+    return (a, b)
+
+
+def test_compiled_route_cache_respects_route_options():
+    router = Router()
+    router.mount(_make_registry())
+
+    compiled = router.manage(compiled=True)(f_async)
+    assert router.manage(compiled=True, timeout=1)(f_async) is not compiled
+    assert (
+        router.manage(compiled=True, async_resolution=AsyncResolutionMode.CONCURRENT)(
+            f_async
+        )
+        is not compiled
+    )
+
+
+def test_compiled_route_falls_back_for_non_functions():
+    router = Router(compiled_routes=True)
+    router.mount(_make_registry())
+
+    @router.manage()
+    @dataclass
+    class Managed:
+        a: int = Hosted()
+
+    assert Managed().a == 10
+
+
+@pytest.mark.asyncio
+async def test_compiled_async_route():
+    router = Router(compiled_routes=True)
+    router.mount(_make_registry())
+
+    @router.manage()
+    async def handler(a: int = Hosted(), b: str = Hosted("async")) -> tuple:
+        return (a, b)
+
+    assert await handler() == (10, "async")
+    assert await handler(b="x") == (10, "x")
@@ -0,0 +1,242 @@
+import asyncio
+from typing import Any, Callable
+import pytest
+from plug_in.core.enum import PluginPolicy
+from plug_in.core.host import CoreHost
+from plug_in.core.plug import CorePlug
+from plug_in.core.plugin import create_core_plugin
+from plug_in.core.registry import CoreRegistry
+from plug_in.ioc.enum import AsyncResolutionMode
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.resolver import ParameterResolver
+
+
+def _make_registry() -> CoreRegistry:
+    return CoreRegistry(
+        [
+            create_core_plugin(CorePlug(10), CoreHost(int), PluginPolicy.DIRECT),
+            create_core_plugin(
+                CorePlug(lambda: "abc"), CoreHost(str), PluginPolicy.FACTORY
+            ),
+        ]
+    )
+
+
+def f_simple(a: int, b: int = Hosted()) -> tuple:
+    return (a, b)
+
+
+def f_keyword_only(a: int, *, b: int = Hosted(), c: str = Hosted()) -> tuple:
+    return (a, b, c)
+
+
+def f_var(a: int, *args: Any, b: int = Hosted(), **kwargs: Any) -> tuple:
+    return (a, args, b, kwargs)
+
+
+def f_mixed(a: int, b: int = Hosted(), c: int = 3, d: str = Hosted()) -> tuple:
+    return (a, b, c, d)
+
+
+def f_positional_only(a: int, b: int = Hosted(), /, c: str = Hosted()) -> tuple:
+    return (a, b, c)
+
+
+@pytest.mark.parametrize(
+    "callable, args, kwargs",
+    [
+        (f_simple, (1,), {}),
+        (f_simple, (1, 2), {}),
+        (f_simple, (1,), {"b": 2}),
+        (f_keyword_only, (1,), {}),
+        (f_keyword_only, (1,), {"c": "x"}),
+        (f_var, (1, 2, 3), {}),
+        (f_var, (1,), {"b": 5, "x": 6}),
+        (f_mixed, (1,), {"c": 4}),
+        (f_mixed, (1, 2, 3), {}),
+        (f_mixed, (1, 2, 3, "x"), {}),
+        (f_positional_only, (1,), {}),
+        (f_positional_only, (1, 2), {"c": "x"}),
+    ],
+)
+def test_call_args_match_signature_bind(
+    callable: Callable, args: tuple, kwargs: dict[str, Any]
+):
+    """
+    Calling with precompiled plan arguments gives the same result as calling
+    with signature bind.
+    """
+    resolver = ParameterResolver(callable, plugin_lookup=_make_registry().plugin)
+
+    bind = resolver.get_one_time_bind_sync(*args, **kwargs)
+    call_args, call_kwargs = resolver.get_one_time_call_args_sync(*args, **kwargs)
+
+    assert callable(*call_args, **call_kwargs) == callable(*bind.args, **bind.kwargs)
+
+
+def test_call_plan_is_compiled_once_state_is_final():
+    resolver = ParameterResolver(f_mixed, plugin_lookup=_make_registry().plugin)
+
+    plan = resolver.call_plan
+    assert plan is not None
+    assert [slot.name for slot in plan.slots] == ["b", "d"]
+    assert not plan.bind_fallback
+
+    resolver.get_one_time_call_args_sync(1)
+    assert resolver.call_plan is plan
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_resolution_awaits_providers_together():
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    async def provider_a() -> str:
+        started.append("a")
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), 1)
+        return "a"
+
+    async def provider_b() -> int:
+        started.append("b")
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), 1)
+        return 1
+
+    registry = CoreRegistry(
+        [
+            create_core_plugin(
+                CorePlug(provider_a), CoreHost(str), PluginPolicy.FACTORY_ASYNC
+            ),
+            create_core_plugin(
+                CorePlug(provider_b), CoreHost(int), PluginPolicy.FACTORY_ASYNC
+            ),
+        ]
+    )
+
+    async def handler(a: str = Hosted(), b: int = Hosted()) -> tuple:
+        return (a, b)
+
+    resolver = ParameterResolver(
+        handler,
+        plugin_lookup=registry.plugin,
+        async_resolution=AsyncResolutionMode.CONCURRENT,
+    )
+
+    args, kwargs = await resolver.get_one_time_call_args_async()
+    assert await handler(*args, **kwargs) == ("a", 1)
+
+    bind = await resolver.get_one_time_bind_async()
+    assert await handler(*bind.args, **bind.kwargs) == ("a", 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_resolution_cancels_siblings_on_failure():
+    cancelled = asyncio.Event()
+
+    async def failing() -> str:
+        raise LookupError("failing")
+
+    async def hanging() -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 1
+
+    registry = CoreRegistry(
+        [
+            create_core_plugin(
+                CorePlug(failing), CoreHost(str), PluginPolicy.FACTORY_ASYNC
+            ),
+            create_core_plugin(
+                CorePlug(hanging), CoreHost(int), PluginPolicy.FACTORY_ASYNC
+            ),
+        ]
+    )
+
+    async def handler(b: int = Hosted(), a: str = Hosted()) -> tuple:
+        return (a, b)
+
+    resolver = ParameterResolver(
+        handler,
+        plugin_lookup=registry.plugin,
+        async_resolution=AsyncResolutionMode.CONCURRENT,
+    )
+
+    with pytest.raises(LookupError):
+        await resolver.get_one_time_call_args_async()
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "async_resolution",
+    [AsyncResolutionMode.SEQUENTIAL, AsyncResolutionMode.CONCURRENT],
+)
+async def test_explicitly_passed_hosted_params_are_not_resolved(
+    async_resolution: AsyncResolutionMode,
+):
+    calls: list[str] = []
+
+    def factory() -> str:
+        calls.append("called")
+        return "abc"
+
+    async def async_factory() -> bytes:
+        calls.append("awaited")
+        return b"abc"
+
+    registry = CoreRegistry(
+        [
+            create_core_plugin(CorePlug(factory), CoreHost(str), PluginPolicy.FACTORY),
+            create_core_plugin(
+                CorePlug(async_factory), CoreHost(bytes), PluginPolicy.FACTORY_ASYNC
+            ),
+        ]
+    )
+
+    def handler(a: str = Hosted(), *, b: str = Hosted()) -> tuple:
+        return (a, b)
+
+    resolver = ParameterResolver(handler, plugin_lookup=registry.plugin)
+
+    assert resolver.get_one_time_call_args_sync("x", b="y") == (("x",), {"b": "y"})
+    assert resolver.get_one_time_bind_sync(a="x", b="y").arguments == {
+        "a": "x",
+        "b": "y",
+    }
+    assert calls == []
+
+    assert resolver.get_one_time_call_args_sync("x") == (("x",), {"b": "abc"})
+    assert calls == ["called"]
+
+    async def async_handler(a: str = Hosted(), *, b: bytes = Hosted()) -> tuple:
+        return (a, b)
+
+    calls.clear()
+    async_resolver = ParameterResolver(
+        async_handler,
+        plugin_lookup=registry.plugin,
+        async_resolution=async_resolution,
+    )
+
+    assert await async_resolver.get_one_time_call_args_async("x", b=b"y") == (
+        ("x",),
+        {"b": b"y"},
+    )
+    assert calls == []
+
+    assert await async_resolver.get_one_time_call_args_async(b=b"y") == (
+        (),
+        {"b": b"y", "a": "abc"},
+    )
+    assert await async_resolver.get_one_time_call_args_async("x") == (
+        ("x",),
+        {"b": b"abc"},
+    )
+    assert calls == ["called", "awaited"]
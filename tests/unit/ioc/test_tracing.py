@@ -0,0 +1,172 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from plug_in.boot.builder.builder import plug
+from plug_in.core.registry import CoreRegistry
+from plug_in.ioc.enum import AsyncResolutionMode
+from plug_in.ioc.hosting import Hosted
+from plug_in.ioc.router import Router
+from plug_in.ioc.tracing import (
+    ChromeTraceSpanExporter,
+    JsonLinesSpanExporter,
+    Tracer,
+)
+from plug_in.types.proto.tracing import SpanExporterProtocol, SpanProtocol
+
+
+class ListExporter(SpanExporterProtocol):
+    def __init__(self) -> None:
+        self.spans: list[SpanProtocol] = []
+
+    def export(self, span: SpanProtocol) -> None:
+        self.spans.append(span)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class Config:
+    pass
+
+
+class Session:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+def test_managed_provider_spans_nest_in_param_span():
+    exporter = ListExporter()
+    router = Router(tracer=Tracer(exporter))
+
+    @router.manage()
+    def open_session(config: Config = Hosted()) -> Session:
+        return Session(config)
+
+    @router.manage()
+    def handle(session: Session = Hosted()) -> Session:
+        return session
+
+    router.mount(
+        CoreRegistry(
+            [
+                plug(Config).into(Config).via_provider("lazy"),
+                plug(open_session).into(Session).via_provider("factory"),
+            ]
+        )
+    )
+
+    handle()
+
+    # Spans are exported when they finish, innermost first
+    config, provider, session, route = exporter.spans
+    assert [span.category for span in exporter.spans] == [
+        "param",
+        "route",
+        "param",
+        "route",
+    ]
+    assert route.name.endswith("handle") and route.parent_id is None
+    assert session.name == "session: Session"
+    assert session.attributes["policy"] == "FACTORY"
+    assert session.parent_id == route.span_id
+    assert provider.parent_id == session.span_id
+    assert config.parent_id == provider.span_id
+    assert {span.trace_id for span in exporter.spans} == {route.trace_id}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_params_share_route_parent():
+    exporter = ListExporter()
+    router = Router(
+        async_resolution=AsyncResolutionMode.CONCURRENT, tracer=Tracer(exporter)
+    )
+
+    async def fail() -> Session:
+        await asyncio.sleep(0)
+        raise RuntimeError("Cannot open session")
+
+    router.mount(
+        CoreRegistry(
+            [
+                plug(Config).into(Config).via_provider("factory"),
+                plug(fail).into(Session).via_provider("factory_async"),
+            ]
+        )
+    )
+
+    @router.manage()
+    async def handle(config: Config = Hosted(), session: Session = Hosted()) -> Session:
+        return session
+
+    with pytest.raises(RuntimeError):
+        await handle()
+
+    (route,) = [span for span in exporter.spans if span.category == "route"]
+    params = [span for span in exporter.spans if span.category == "param"]
+    assert {span.parent_id for span in params} == {route.span_id}
+    assert route.error is not None
+    assert [span.error is not None for span in params].count(True) == 1
+
+
+def test_bind_fallback_records_param_spans():
+    exporter = ListExporter()
+    router = Router(tracer=Tracer(exporter))
+    router.mount(CoreRegistry([plug(Config).into(Config).via_provider("factory")]))
+
+    # Positional-only hosted parameter is resolved by binding signature
+    @router.manage()
+    def handle(config: Config = Hosted(), /) -> Config:
+        return config
+
+    handle()
+
+    param, route = exporter.spans
+    assert (param.category, route.category) == ("param", "route")
+    assert param.name == "config: Config"
+    assert param.parent_id == route.span_id
+
+
+def test_sampling_decision_is_made_for_whole_trace():
+    exporter = ListExporter()
+    router = Router(tracer=Tracer(exporter, sample_rate=0.0))
+    router.mount(CoreRegistry([plug(Config).into(Config).via_provider("factory")]))
+
+    @router.manage()
+    def handle(config: Config = Hosted()) -> Config:
+        return config
+
+    handle()
+    assert exporter.spans == []
+
+    # Sampled root makes whole trace recorded
+    with Tracer(exporter).span("request", path="/"):
+        handle()
+    assert [span.category for span in exporter.spans] == ["param", "route", "custom"]
+
+    with pytest.raises(ValueError):
+        Tracer(exporter, sample_rate=1.5)
+
+
+def test_file_exporters_write_valid_output(tmp_path: Path):
+    jsonl = JsonLinesSpanExporter(tmp_path / "spans.jsonl", buffer_size=2)
+    chrome = ChromeTraceSpanExporter(tmp_path / "trace.json", buffer_size=2)
+
+    for exporter in (jsonl, chrome):
+        tracer = Tracer(exporter)
+        for idx in range(3):
+            with tracer.span("request", idx=idx):
+                pass
+        exporter.close()
+
+    lines = (tmp_path / "spans.jsonl").read_text().splitlines()
+    assert [json.loads(line)["attributes"]["idx"] for line in lines] == [0, 1, 2]
+
+    events = json.loads((tmp_path / "trace.json").read_text())
+    assert [event["args"]["idx"] for event in events] == [0, 1, 2]
+    assert {event["ph"] for event in events} == {"X"}